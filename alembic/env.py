@@ -41,6 +41,20 @@ from datamanager.data_models import User, Movie, UserMovies
 # for 'autogenerate' support
 target_metadata = db.metadata
 
+# Prefix of the full-text search objects created with raw SQL by migration 008:
+# the movie_fts virtual table, its shadow tables and its sync triggers
+FTS_OBJECT_PREFIX = 'movie_fts'
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the FTS5 search index out of autogenerate comparisons.
+
+    The virtual table and its shadow tables are not in the model metadata,
+    so without this filter autogenerate would emit revisions dropping them.
+    """
+    return not (name or '').startswith(FTS_OBJECT_PREFIX)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -63,6 +77,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -86,7 +101,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,37 @@
+"""add user_movies and movie lookup indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the oldest link per (user_id, movie_id) so the unique index can be built
+    op.execute(
+        "DELETE FROM user_movies WHERE id NOT IN ("
+        "SELECT MIN(id) FROM user_movies GROUP BY user_id, movie_id)"
+    )
+
+    op.create_index('uq_user_movies_user_id_movie_id', 'user_movies',
+                    ['user_id', 'movie_id'], unique=True)
+    op.create_index('ix_user_movies_movie_id', 'user_movies', ['movie_id'])
+    op.create_index('ix_movie_title_release_year', 'movie', ['title', 'release_year'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_title_release_year', table_name='movie')
+    op.drop_index('ix_user_movies_movie_id', table_name='user_movies')
+    op.drop_index('uq_user_movies_user_id_movie_id', table_name='user_movies')
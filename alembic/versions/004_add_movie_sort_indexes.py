@@ -0,0 +1,32 @@
+"""add movie sort indexes for keyset pagination
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite appends the rowid to every index entry, so each of these serves
+    # ORDER BY <column>, id and the (<column>, id) > (?, ?) keyset seek
+    op.create_index('ix_movie_title', 'movie', ['title'])
+    op.create_index('ix_movie_release_year', 'movie', ['release_year'])
+    op.create_index('ix_movie_rating', 'movie', ['rating'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_rating', table_name='movie')
+    op.drop_index('ix_movie_release_year', table_name='movie')
+    op.drop_index('ix_movie_title', table_name='movie')
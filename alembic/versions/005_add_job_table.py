@@ -0,0 +1,48 @@
+"""add job table for asynchronous add-movie requests
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('dedupe_key', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('result_message', sa.String(), nullable=True),
+        sa.Column('movie_id', sa.Integer(), nullable=True),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Only one queued/running job per dedupe key, so duplicate requests coalesce
+    op.create_index('uq_job_active_dedupe_key', 'job', ['dedupe_key'], unique=True,
+                    sqlite_where=sa.text("status IN ('queued', 'running')"))
+    op.create_index('ix_job_status_updated_at', 'job', ['status', 'updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_status_updated_at', table_name='job')
+    op.drop_index('uq_job_active_dedupe_key', table_name='job')
+    op.drop_table('job')
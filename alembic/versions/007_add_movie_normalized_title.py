@@ -0,0 +1,49 @@
+"""add movie.normalized_title for local-first title resolution
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _normalize(title: str) -> str:
+    # Frozen copy of datamanager.titles.normalize_catalog_title at this revision
+    normalized = " ".join(title.split()).casefold()
+    normalized = re.sub(r',\s*(?:the|an|a)$', '', normalized)
+    return re.sub(r'^(?:the|an|a)\s+(?=\S)', '', normalized)
+
+
+def upgrade() -> None:
+    op.add_column('movie', sa.Column('normalized_title', sa.String(), nullable=True))
+
+    connection = op.get_bind()
+    movies = connection.execute(sa.text("SELECT id, title FROM movie")).fetchall()
+    for start_index in range(0, len(movies), BACKFILL_BATCH_SIZE):
+        connection.execute(
+            sa.text("UPDATE movie SET normalized_title = :normalized_title WHERE id = :movie_id"),
+            [{'normalized_title': _normalize(title), 'movie_id': movie_id}
+             for movie_id, title in movies[start_index:start_index + BACKFILL_BATCH_SIZE]]
+        )
+
+    op.create_index('ix_movie_normalized_title_release_year', 'movie', ['normalized_title', 'release_year'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movie_normalized_title_release_year', table_name='movie')
+    with op.batch_alter_table('movie') as batch_op:
+        batch_op.drop_column('normalized_title')
@@ -0,0 +1,58 @@
+"""add movie_fts full-text index over movie title and director
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # External-content FTS5 table: stores tokens only, rows come from movie
+    op.execute(
+        "CREATE VIRTUAL TABLE movie_fts USING fts5("
+        "title, director, content='movie', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute("INSERT INTO movie_fts(movie_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')")
+
+    # Keep the index in sync with the movie table
+    op.execute(
+        "CREATE TRIGGER movie_fts_after_insert AFTER INSERT ON movie BEGIN "
+        "INSERT INTO movie_fts(rowid, title, director) VALUES (new.id, new.title, new.director); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER movie_fts_after_delete AFTER DELETE ON movie BEGIN "
+        "INSERT INTO movie_fts(movie_fts, rowid, title, director) "
+        "VALUES ('delete', old.id, old.title, old.director); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER movie_fts_after_update AFTER UPDATE OF title, director ON movie BEGIN "
+        "INSERT INTO movie_fts(movie_fts, rowid, title, director) "
+        "VALUES ('delete', old.id, old.title, old.director); "
+        "INSERT INTO movie_fts(rowid, title, director) VALUES (new.id, new.title, new.director); "
+        "END"
+    )
+
+    # Index the existing catalog
+    op.execute("INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS movie_fts_after_update")
+    op.execute("DROP TRIGGER IF EXISTS movie_fts_after_delete")
+    op.execute("DROP TRIGGER IF EXISTS movie_fts_after_insert")
+    op.execute("DROP TABLE IF EXISTS movie_fts")
@@ -0,0 +1,40 @@
+"""add data_version table of change counters for conditional requests
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    data_version = op.create_table(
+        'data_version',
+        sa.Column('scope', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('scope')
+    )
+    # Start the table-wide counters at the upgrade time, so validators issued
+    # for another database (e.g. one restored from scratch) never match
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.bulk_insert(data_version, [
+        {'scope': 'users', 'version': 1, 'updated_at': now},
+        {'scope': 'movies', 'version': 1, 'updated_at': now},
+    ])
+
+
+def downgrade() -> None:
+    op.drop_table('data_version')
@@ -0,0 +1,55 @@
+"""make movie titles without a release year unique
+
+SQLite treats NULLs as distinct in unique indexes, so uq_movie_title_release_year
+lets any number of movies share a title when release_year is NULL.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Map every duplicate year-less movie to the oldest row with the same title
+    op.execute(
+        "CREATE TEMP TABLE movie_duplicates AS "
+        "SELECT movie.id AS duplicate_id, keeper.keep_id AS keep_id FROM movie "
+        "JOIN (SELECT title, MIN(id) AS keep_id FROM movie WHERE release_year IS NULL "
+        "      GROUP BY title HAVING COUNT(*) > 1) AS keeper "
+        "ON movie.title = keeper.title AND movie.release_year IS NULL "
+        "WHERE movie.id != keeper.keep_id"
+    )
+
+    # Repoint links to the kept movie; links the user already has there are skipped, then dropped
+    op.execute(
+        "UPDATE OR IGNORE user_movies SET movie_id = ("
+        "SELECT keep_id FROM movie_duplicates WHERE duplicate_id = user_movies.movie_id) "
+        "WHERE movie_id IN (SELECT duplicate_id FROM movie_duplicates)"
+    )
+    op.execute("DELETE FROM user_movies WHERE movie_id IN (SELECT duplicate_id FROM movie_duplicates)")
+    op.execute(
+        "UPDATE job SET movie_id = ("
+        "SELECT keep_id FROM movie_duplicates WHERE duplicate_id = job.movie_id) "
+        "WHERE movie_id IN (SELECT duplicate_id FROM movie_duplicates)"
+    )
+    op.execute("DELETE FROM movie WHERE id IN (SELECT duplicate_id FROM movie_duplicates)")
+    op.execute("DROP TABLE movie_duplicates")
+
+    op.create_index('uq_movie_title_null_release_year', 'movie', ['title'], unique=True,
+                    sqlite_where=sa.text('release_year IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_movie_title_null_release_year', table_name='movie')
@@ -6,7 +6,12 @@ from flask import Flask
 from extensions import db
 from datamanager import data_manager
 from routes import register_blueprints
-from config import setup_logging, configure_database
+from commands import register_commands
+from services.job_queue import job_queue
+from services.fragment_cache import fragment_cache
+from services.posters import poster_store
+from services.instrumentation import request_instrumentation
+from config import setup_logging, configure_database, register_sqlite_pragmas
 
 load_dotenv()
 
@@ -35,13 +40,21 @@ def create_app():
     setup_logging(app)
     
     db.init_app(app)
+    with app.app_context():
+        register_sqlite_pragmas(db.engine, app.config['SQLITE_PRAGMAS'])
     data_manager.init_app(app)  # initialize with app here
+    job_queue.init_app(app)
+    fragment_cache.init_app(app)
+    poster_store.init_app(app)
+    request_instrumentation.init_app(app)
     
     register_blueprints(app)
+    register_commands(app)
 
     return app
 
 
 if __name__ == '__main__':
+    # Development server only; production runs `gunicorn -c gunicorn.conf.py wsgi:app`
     app = create_app()
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    app.run(host="0.0.0.0", port=5000, debug=os.getenv('FLASK_ENV', 'development') == 'development')
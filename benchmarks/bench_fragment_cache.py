@@ -0,0 +1,75 @@
+"""
+Benchmark page renders per second of /users/<id> and /movies with the
+fragment cache disabled, in memory and on the filesystem.
+
+Creates the application on a throwaway SQLite database, gives one user a
+collection of synthetic movies, then requests both pages repeatedly through
+the Flask test client with each fragment cache backend.
+
+Usage:
+    python benchmarks/bench_fragment_cache.py [--movies 500] [--requests 200]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def requests_per_second(client, url: str, request_count: int) -> float:
+    """Return the request rate of repeated GETs of url."""
+    client.get(url)  # warm up (and fill the cache)
+    start_time = time.perf_counter()
+    for _ in range(request_count):
+        response = client.get(url)
+        assert response.status_code == 200, response.status_code
+    return request_count / (time.perf_counter() - start_time)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--movies', type=int, default=500, help='movies in the user collection')
+    parser.add_argument('--requests', type=int, default=200, help='requests per page and backend')
+    arguments = parser.parse_args()
+
+    work_directory = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(work_directory, 'bench.db')}"
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from app import create_app
+    from extensions import db
+    from datamanager import data_manager
+    from services.fragment_cache import fragment_cache, create_fragment_backend
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        data_manager.add_user('Bench User')
+        user_id = data_manager.get_user_by_name('Bench User').id
+        data_manager.upsert_movies([
+            {'title': f'Movie {index}', 'release_year': 1950 + index % 70, 'director': f'Director {index % 40}',
+             'rating': 5 + index % 50 / 10, 'poster': f'https://example.com/posters/{index}.jpg'}
+            for index in range(arguments.movies)
+        ])
+        movie_ids = [movie.id for movie in data_manager.get_all_movies()]
+        db.session.execute(db.text("INSERT INTO user_movies (user_id, movie_id, user_rating) VALUES (:u, :m, 7)"),
+                           [{'u': user_id, 'm': movie_id} for movie_id in movie_ids])
+        # Bump the collection counter like a data manager write would
+        data_manager._bump_data_versions(f'user:{user_id}')
+        db.session.commit()
+
+    client = app.test_client()
+    pages = (f'/users/{user_id}', '/movies?limit=200&sort=title')
+    print(f"{arguments.movies} movies in the collection, {arguments.requests} requests per page\n")
+    for backend_name in ('none', 'memory', 'filesystem'):
+        fragment_cache.backend = create_fragment_backend(
+            backend_name, directory=os.path.join(work_directory, 'fragments')
+        )
+        rates = [requests_per_second(client, url, arguments.requests) for url in pages]
+        print(f"  {backend_name:<11} " + ", ".join(f"{url}: {rate:,.0f} req/s" for url, rate in zip(pages, rates)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark catalog search: LIKE '%term%' scans versus the FTS5 index added by
+migration 008.
+
+Builds a throwaway SQLite database with a synthetic movie catalog, creates
+the movie_fts index and runs the same prefix searches both ways, printing the
+mean latency of fetching the first page of results.
+
+Usage:
+    python benchmarks/bench_movie_search.py [--movies 1000000] [--repeat 20]
+"""
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datamanager.search import MOVIE_FTS_DDL, build_match_query  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE movie (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, title VARCHAR NOT NULL, release_year INTEGER,
+    poster VARCHAR, director VARCHAR, rating FLOAT NOT NULL
+);
+"""
+
+SYLLABLES = ("ka", "lo", "mi", "ra", "tes", "von", "dar", "el", "qui", "sun", "bo", "ny", "gra", "phe", "lux")
+VOCABULARY_SIZE = 20_000
+DIRECTOR_COUNT = 5_000
+PAGE_SIZE = 50
+
+
+def make_words(count: int, seed: int) -> list[str]:
+    """Build a vocabulary of pronounceable synthetic words (real titles use many distinct words)."""
+    generator = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(generator.choice(SYLLABLES) for _ in range(generator.randint(2, 4))))
+    return sorted(words)
+
+
+WORDS = make_words(VOCABULARY_SIZE, seed=1)
+DIRECTORS = [word.title() for word in make_words(DIRECTOR_COUNT, seed=2)]
+SEARCHES = (WORDS[100][:4], f"{WORDS[200]} {WORDS[300][:3]}", DIRECTORS[5].lower(), WORDS[400])
+
+
+def populate(connection, movie_count: int) -> None:
+    """Fill the catalog with synthetic three-word titles and directors."""
+    random.seed(7)
+    connection.executemany(
+        "INSERT INTO movie (title, release_year, director, rating) VALUES (?, ?, ?, ?)",
+        ((" ".join(random.sample(WORDS, 3)).title() + f" {index}", 1950 + index % 71,
+          random.choice(DIRECTORS), 7.0) for index in range(movie_count))
+    )
+    connection.commit()
+
+
+def mean_ms(connection, sql: str, parameters: tuple, repeat: int) -> float:
+    """Return the mean latency of a query in milliseconds."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        connection.execute(sql, parameters).fetchall()
+    return (time.perf_counter() - start_time) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--movies', type=int, default=1_000_000, help='number of movie rows')
+    parser.add_argument('--repeat', type=int, default=20, help='executions per query')
+    arguments = parser.parse_args()
+
+    database_fd, database_path = tempfile.mkstemp(suffix='.db')
+    os.close(database_fd)
+    try:
+        connection = sqlite3.connect(database_path)
+        connection.executescript(SCHEMA)
+        print(f"Populating {arguments.movies:,} movies...")
+        populate(connection, arguments.movies)
+
+        start_time = time.perf_counter()
+        for statement in MOVIE_FTS_DDL:
+            connection.execute(statement)
+        connection.execute("INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')")
+        connection.commit()
+        print(f"FTS index built in {time.perf_counter() - start_time:.2f} s\n")
+
+        for search_text in SEARCHES:
+            like_conditions = " AND ".join("(title LIKE ? OR director LIKE ?)" for _ in search_text.split())
+            like_parameters = tuple(value for term in search_text.split() for value in (f"%{term}%",) * 2)
+            like_ms = mean_ms(
+                connection,
+                f"SELECT id FROM movie WHERE {like_conditions} ORDER BY title LIMIT {PAGE_SIZE}",
+                like_parameters, max(1, arguments.repeat // 5)
+            )
+            fts_ms = mean_ms(
+                connection,
+                "SELECT movie.id FROM movie_fts JOIN movie ON movie.id = movie_fts.rowid "
+                f"WHERE movie_fts MATCH ? ORDER BY movie_fts.rank, movie_fts.rowid LIMIT {PAGE_SIZE}",
+                (build_match_query(search_text),), arguments.repeat
+            )
+            print(f"  {search_text!r}: LIKE {like_ms:.1f} ms, FTS5 {fts_ms:.1f} ms")
+        connection.close()
+    finally:
+        os.unlink(database_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark title suggestions served from the in-memory TitleIndex.
+
+Loads a synthetic catalog into the index, then measures lookup latency for
+random 1-6 character prefixes and the cost of the in-place updates made when
+single movies are added or deleted, printing p50/p99 latencies.
+
+Usage:
+    python benchmarks/bench_movie_suggest.py [--movies 1000000] [--lookups 20000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datamanager.suggest import TitleIndex, DEFAULT_SUGGESTIONS  # noqa: E402
+
+SYLLABLES = ("ka", "lo", "mi", "ra", "tes", "von", "dar", "el", "qui", "sun", "bo", "ny", "gra", "phe", "lux")
+ARTICLES = ("", "", "", "The ", "A ")
+
+
+def make_title(generator: random.Random) -> str:
+    """Return a synthetic two- or three-word title, sometimes with an article."""
+    words = ("".join(generator.choice(SYLLABLES) for _ in range(generator.randint(2, 4)))
+             for _ in range(generator.randint(2, 3)))
+    return generator.choice(ARTICLES) + " ".join(words).title()
+
+
+def percentiles_ms(durations: list[float]) -> tuple[float, float]:
+    """Return the p50 and p99 of durations (in seconds) in milliseconds."""
+    durations = sorted(durations)
+    return (durations[len(durations) // 2] * 1000,
+            durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--movies', type=int, default=1_000_000, help='number of catalog titles')
+    parser.add_argument('--lookups', type=int, default=20_000, help='number of prefix lookups')
+    arguments = parser.parse_args()
+
+    generator = random.Random(7)
+    titles = [make_title(generator) for _ in range(arguments.movies)]
+    title_index = TitleIndex()
+
+    start_time = time.perf_counter()
+    title_index.load((movie_id, title, 2000) for movie_id, title in enumerate(titles, start=1))
+    print(f"Loaded {arguments.movies:,} titles in {time.perf_counter() - start_time:.2f} s\n")
+
+    lookup_durations = []
+    for _ in range(arguments.lookups):
+        title = generator.choice(titles)
+        prefix = title[:generator.randint(1, 6)]
+        start_time = time.perf_counter()
+        title_index.suggest(prefix, DEFAULT_SUGGESTIONS)
+        lookup_durations.append(time.perf_counter() - start_time)
+    p50_ms, p99_ms = percentiles_ms(lookup_durations)
+    print(f"  suggest:          p50 {p50_ms:.3f} ms, p99 {p99_ms:.3f} ms")
+
+    update_durations = []
+    for movie_id in range(arguments.movies + 1, arguments.movies + 1001):
+        start_time = time.perf_counter()
+        title_index.add(movie_id, make_title(generator), 2024)
+        title_index.discard(generator.randint(1, arguments.movies))
+        update_durations.append(time.perf_counter() - start_time)
+    p50_ms, p99_ms = percentiles_ms(update_durations)
+    print(f"  add + discard:    p50 {p50_ms:.3f} ms, p99 {p99_ms:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
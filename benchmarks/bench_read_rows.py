@@ -0,0 +1,125 @@
+"""
+Benchmark the projected listings of the data manager against loading the
+same rows as ORM objects.
+
+Creates the application on a throwaway SQLite database holding the given
+number of users and movies, links every movie to one user, then walks every
+page of get_users_page and get_movies_page and reads get_user_movies. Each is
+compared with the equivalent ORM query (select(User) / select(Movie) pages,
+and the Movie join). Reports rows per second (best of --repeat runs) and the
+peak memory allocated while reading, as measured by tracemalloc.
+
+Usage:
+    python benchmarks/bench_read_rows.py [--rows 100000] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+from sqlalchemy import select
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(db, read, repeat: int) -> tuple[int, float, float]:
+    """Return (rows, best rows per second, peak MiB) of read()."""
+    best_seconds = None
+    for _ in range(repeat):
+        db.session.remove()  # start from an empty identity map
+        start_time = time.perf_counter()
+        row_count = len(read())
+        elapsed = time.perf_counter() - start_time
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    db.session.remove()
+    tracemalloc.start()
+    rows = read()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    db.session.remove()
+    return row_count, row_count / best_seconds, peak_bytes / 2 ** 20
+
+
+def walk_pages(fetch_page) -> list:
+    """Return the items of every page of fetch_page(cursor), first to last."""
+    items, cursor = [], None
+    while True:
+        page = fetch_page(cursor)
+        items.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return items
+
+
+def orm_pages(db, model, page_size: int) -> list:
+    """Return every row of model as ORM objects, read in id-ordered keyset pages."""
+    items, last_id = [], 0
+    while True:
+        page = db.session.scalars(
+            select(model).where(model.id > last_id).order_by(model.id).limit(page_size)
+        ).all()
+        items.extend(page)
+        if len(page) < page_size:
+            return items
+        last_id = page[-1].id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000, help='users, movies and collection links')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per method and mode')
+    arguments = parser.parse_args()
+
+    work_directory = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(work_directory, 'bench.db')}"
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from app import create_app
+    from extensions import db
+    from datamanager import data_manager
+    from datamanager.data_models import User, Movie, UserMovies
+    from datamanager.pagination import MAX_PAGE_SIZE
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        db.session.execute(db.text("INSERT INTO user (name) VALUES (:name)"),
+                           [{'name': f'User {index}'} for index in range(arguments.rows)])
+        db.session.commit()
+        data_manager.upsert_movies([
+            {'title': f'Movie {index}', 'release_year': 1950 + index % 70, 'director': f'Director {index % 40}',
+             'rating': 5 + index % 50 / 10, 'poster': f'https://example.com/posters/{index}.jpg'}
+            for index in range(arguments.rows)
+        ])
+        db.session.execute(db.text("INSERT INTO user_movies (user_id, movie_id, user_rating) "
+                                   "SELECT 1, id, 7 FROM movie"))
+        db.session.commit()
+
+        readers = {
+            'get_users_page': {
+                'orm': lambda: orm_pages(db, User, MAX_PAGE_SIZE),
+                'rows': lambda: walk_pages(lambda cursor: data_manager.get_users_page(MAX_PAGE_SIZE, cursor)),
+            },
+            'get_movies_page': {
+                'orm': lambda: orm_pages(db, Movie, MAX_PAGE_SIZE),
+                'rows': lambda: walk_pages(lambda cursor: data_manager.get_movies_page(MAX_PAGE_SIZE, cursor)),
+            },
+            'get_user_movies': {
+                'orm': lambda: db.session.query(Movie, UserMovies.user_rating)
+                .join(UserMovies, UserMovies.movie_id == Movie.id).filter(UserMovies.user_id == 1).all(),
+                'rows': lambda: data_manager.get_user_movies(1),
+            },
+        }
+        print(f"{'method':<16} {'mode':<5} {'rows':>8} {'rows/s':>12} {'peak MiB':>9}")
+        for method_name, modes in readers.items():
+            for mode, read in modes.items():
+                row_count, rows_per_second, peak_mib = measure(db, read, arguments.repeat)
+                print(f"{method_name:<16} {mode:<5} {row_count:>8} {rows_per_second:>12,.0f} {peak_mib:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark request throughput of a running server.
+
+Sends GET requests from concurrent client threads over keep-alive
+connections and reports requests per second and latency percentiles. Run it
+against the development server and against gunicorn to compare serving
+modes, e.g.:
+
+    python app.py                                   # development server
+    gunicorn -c gunicorn.conf.py wsgi:app           # production serving
+
+Usage:
+    python benchmarks/bench_serving.py --url http://127.0.0.1:5000/movies [--concurrency 16] [--requests 2000]
+"""
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def run_client(url: str, request_count: int, latencies: list, errors: list) -> None:
+    """Send request_count GETs over one keep-alive session, recording latencies."""
+    session = requests.Session()
+    for _ in range(request_count):
+        start_time = time.perf_counter()
+        try:
+            response = session.get(url, timeout=30)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+        except requests.RequestException as request_error:
+            errors.append(type(request_error).__name__)
+        latencies.append(time.perf_counter() - start_time)
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Return the value at the given fraction of a sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000/movies', help='page to request')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent clients')
+    parser.add_argument('--requests', type=int, default=2000, help='total requests')
+    arguments = parser.parse_args()
+
+    requests.get(arguments.url, timeout=30)  # warm up caches
+    # list.append is atomic, so clients share the result lists
+    latencies, errors = [], []
+    requests_per_client = max(1, arguments.requests // arguments.concurrency)
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=arguments.concurrency) as executor:
+        for _ in range(arguments.concurrency):
+            executor.submit(run_client, arguments.url, requests_per_client, latencies, errors)
+    elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    print(f"{arguments.url}: {len(latencies)} requests, {arguments.concurrency} clients")
+    print(f"  throughput  {len(latencies) / elapsed:8.1f} req/s")
+    print(f"  latency p50 {percentile(latencies, 0.50) * 1000:8.1f} ms")
+    print(f"  latency p99 {percentile(latencies, 0.99) * 1000:8.1f} ms")
+    print(f"  errors      {len(errors)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark the user_movies/movie lookup queries with and without the indexes
+added by migration 003.
+
+Builds a throwaway SQLite database with the initial schema, fills it with
+synthetic users, movies and user_movies links, then runs the data manager's
+hot lookups before and after creating the indexes. For each query it prints
+the SQLite query plan and the mean latency.
+
+Usage:
+    python benchmarks/bench_user_movies_indexes.py [--links 1000000] [--repeat 200]
+"""
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+SCHEMA = """
+CREATE TABLE user (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR NOT NULL UNIQUE);
+CREATE TABLE movie (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, title VARCHAR NOT NULL, release_year INTEGER,
+    poster VARCHAR, director VARCHAR, rating FLOAT NOT NULL
+);
+CREATE TABLE user_movies (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL REFERENCES user (id),
+    movie_id INTEGER NOT NULL REFERENCES movie (id),
+    user_rating FLOAT
+);
+"""
+
+# Same definitions as alembic/versions/003_add_user_movies_and_movie_indexes.py
+INDEXES = """
+CREATE UNIQUE INDEX uq_user_movies_user_id_movie_id ON user_movies (user_id, movie_id);
+CREATE INDEX ix_user_movies_movie_id ON user_movies (movie_id);
+CREATE INDEX ix_movie_title_release_year ON movie (title, release_year);
+"""
+
+# (label, SQL, parameter factory) mirroring SQLiteDataManager lookups
+QUERIES = [
+    ("link lookup (get_user_movie_rating / update_movie / delete_movie / add_movie)",
+     "SELECT id, user_rating FROM user_movies WHERE user_id = ? AND movie_id = ? LIMIT 1",
+     lambda users, movies: (random.randint(1, users), random.randint(1, movies))),
+    ("orphan check (delete_user)",
+     "SELECT id FROM user_movies WHERE movie_id = ? LIMIT 1",
+     lambda users, movies: (random.randint(1, movies),)),
+    ("movie dedupe (add_movie)",
+     "SELECT id FROM movie WHERE title = ? AND release_year = ? LIMIT 1",
+     lambda users, movies: (f"Movie {random.randint(1, movies)}", 1950 + random.randint(0, 70))),
+]
+
+
+def populate(connection, link_count: int, user_count: int, movie_count: int) -> None:
+    """Fill the database with synthetic rows."""
+    connection.executemany("INSERT INTO user (name) VALUES (?)",
+                           ((f"user{index}",) for index in range(user_count)))
+    connection.executemany(
+        "INSERT INTO movie (title, release_year, director, rating) VALUES (?, ?, ?, ?)",
+        ((f"Movie {index}", 1950 + index % 71, "Director", 7.0) for index in range(1, movie_count + 1))
+    )
+    # Each user gets a distinct run of movies, so (user_id, movie_id) pairs are unique
+    connection.executemany(
+        "INSERT INTO user_movies (user_id, movie_id, user_rating) VALUES (?, ?, ?)",
+        ((index % user_count + 1,
+          ((index % user_count) * (link_count // user_count) + index // user_count) % movie_count + 1,
+          8.0)
+         for index in range(link_count))
+    )
+    connection.commit()
+
+
+def run_queries(connection, repeat: int, user_count: int, movie_count: int) -> None:
+    """Print the plan and mean latency of each benchmark query."""
+    for label, sql, make_params in QUERIES:
+        plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", make_params(user_count, movie_count)).fetchall()
+        random.seed(42)
+        parameter_sets = [make_params(user_count, movie_count) for _ in range(repeat)]
+        start_time = time.perf_counter()
+        for parameters in parameter_sets:
+            connection.execute(sql, parameters).fetchall()
+        mean_ms = (time.perf_counter() - start_time) / repeat * 1000
+        print(f"  {label}")
+        print(f"    plan: {'; '.join(row[-1] for row in plan)}")
+        print(f"    mean: {mean_ms:.3f} ms over {repeat} runs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--links', type=int, default=1_000_000, help='number of user_movies rows')
+    parser.add_argument('--repeat', type=int, default=200, help='executions per query')
+    arguments = parser.parse_args()
+
+    user_count = max(1, arguments.links // 50)
+    movie_count = max(1, arguments.links // 5)
+
+    database_fd, database_path = tempfile.mkstemp(suffix='.db')
+    os.close(database_fd)
+    try:
+        connection = sqlite3.connect(database_path)
+        connection.executescript(SCHEMA)
+        print(f"Populating {arguments.links:,} links, {user_count:,} users, {movie_count:,} movies...")
+        populate(connection, arguments.links, user_count, movie_count)
+
+        print("\nWithout indexes:")
+        run_queries(connection, max(1, arguments.repeat // 20), user_count, movie_count)
+
+        start_time = time.perf_counter()
+        connection.executescript(INDEXES)
+        print(f"\nIndexes built in {time.perf_counter() - start_time:.2f} s")
+
+        print("\nWith indexes:")
+        run_queries(connection, arguments.repeat, user_count, movie_count)
+        connection.close()
+    finally:
+        os.unlink(database_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+import os
+import csv
+import json
+import time
+import logging
+
+import click
+from flask.cli import AppGroup
+
+from datamanager import data_manager as data
+from services.omdb_api import fetch_movies_data
+
+logger = logging.getLogger(__name__)
+
+movies_cli = AppGroup('movies', help='Manage the movie catalog.')
+
+# Rows written per transaction by `flask movies import`
+IMPORT_CHUNK_SIZE = 1000
+
+# Input column names (lowercased) mapped to Movie columns; covers OMDb dump keys
+IMPORT_COLUMN_ALIASES = {
+    'title': 'title',
+    'release_year': 'release_year',
+    'year': 'release_year',
+    'poster': 'poster',
+    'director': 'director',
+    'rating': 'rating',
+    'imdbrating': 'rating',
+}
+
+# Placeholders OMDb uses for unknown values
+MISSING_VALUES = {'', 'n/a'}
+
+
+def register_commands(app):
+    """Register the CLI command groups with the application.
+
+    Args:
+        app: The Flask application instance.
+    """
+    app.cli.add_command(movies_cli)
+
+
+def _clean_value(value):
+    """Return value stripped of whitespace, or None if it is empty or 'N/A'."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value.casefold() in MISSING_VALUES else value
+
+
+def _parse_year(value) -> int | None:
+    """Parse a release year such as '1999' or OMDb's '2005–2008' into an int."""
+    value = _clean_value(value)
+    if value is None or not value[:4].isdigit():
+        return None
+    return int(value[:4])
+
+
+def _parse_rating(value) -> float | None:
+    """Parse a rating into a float, or None if it is missing or not numeric."""
+    value = _clean_value(value)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _normalize_row(raw_row: dict) -> dict | None:
+    """Map an input record onto Movie columns.
+
+    Returns:
+        dict | None: The movie values, or None if the record has no title.
+    """
+    movie_values = {'title': None, 'release_year': None, 'poster': None, 'director': None, 'rating': None}
+    for key, value in raw_row.items():
+        column = IMPORT_COLUMN_ALIASES.get(str(key).strip().lower())
+        if column:
+            movie_values[column] = value
+
+    movie_values['title'] = _clean_value(movie_values['title'])
+    if not movie_values['title']:
+        return None
+    movie_values['release_year'] = _parse_year(movie_values['release_year'])
+    movie_values['rating'] = _parse_rating(movie_values['rating'])
+    movie_values['poster'] = _clean_value(movie_values['poster'])
+    movie_values['director'] = _clean_value(movie_values['director'])
+    return movie_values
+
+
+def _read_records(path: str, file_format: str):
+    """Yield raw records from a CSV or NDJSON file, or None for unreadable lines."""
+    with open(path, newline='', encoding='utf-8') as import_file:
+        if file_format == 'csv':
+            yield from csv.DictReader(import_file)
+            return
+        for line_number, line in enumerate(import_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as decode_error:
+                logger.warning(f"Skipping invalid JSON on line {line_number}: {decode_error}")
+                yield None
+                continue
+            yield record if isinstance(record, dict) else None
+
+
+def _is_complete(movie_values: dict) -> bool:
+    """Return whether a row already carries all metadata OMDb would provide."""
+    return all(movie_values[column] is not None for column in ('release_year', 'director', 'rating'))
+
+
+def _enrich(movie_rows: list[dict]) -> None:
+    """Fill missing metadata of incomplete rows from OMDb, in place."""
+    incomplete_rows = [row for row in movie_rows if not _is_complete(row)]
+    if not incomplete_rows:
+        return
+    # Rows with a year look up that release, so ("Dune", 1984) is not completed from Dune (2021)
+    omdb_lookups = [row['title'] if row['release_year'] is None else (row['title'], row['release_year'])
+                    for row in incomplete_rows]
+    omdb_results = fetch_movies_data(omdb_lookups)
+    for row, omdb_lookup in zip(incomplete_rows, omdb_lookups):
+        omdb_movie_data = omdb_results.get(omdb_lookup)
+        if not omdb_movie_data:
+            continue
+        if row['release_year'] is None:
+            row['release_year'] = _parse_year(omdb_movie_data.get('release_year'))
+        if row['director'] is None:
+            row['director'] = _clean_value(omdb_movie_data.get('director'))
+        if row['rating'] is None:
+            row['rating'] = _parse_rating(omdb_movie_data.get('rating'))
+        if row['poster'] is None:
+            row['poster'] = _clean_value(omdb_movie_data.get('poster'))
+
+
+@movies_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'ndjson']),
+              help='Input format; detected from the file extension by default.')
+@click.option('--chunk-size', default=IMPORT_CHUNK_SIZE, show_default=True, type=click.IntRange(min=1),
+              help='Rows written per transaction.')
+@click.option('--no-omdb', is_flag=True, help='Do not look up missing metadata on OMDb.')
+def import_movies(path, file_format, chunk_size, no_omdb):
+    """Import movies from a CSV or NDJSON file into the catalog.
+
+    Rows are upserted on (title, release_year). Columns may be named after the
+    Movie model (title, release_year, poster, director, rating) or OMDb
+    (Title, Year, Poster, Director, imdbRating). Rows missing a year, director
+    or rating are completed from OMDb unless --no-omdb is given; rows that still
+    have no rating are skipped.
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_format = 'csv' if extension == '.csv' else 'ndjson'
+
+    totals = {'read': 0, 'inserted': 0, 'updated': 0, 'skipped': 0}
+    start_time = time.perf_counter()
+
+    def write_chunk(movie_rows):
+        if not no_omdb:
+            _enrich(movie_rows)
+        rated_rows = [row for row in movie_rows if row['rating'] is not None]
+        totals['skipped'] += len(movie_rows) - len(rated_rows)
+        try:
+            upsert_counts = data.upsert_movies(rated_rows)
+        except ValueError as value_error:
+            raise click.ClickException(str(value_error))
+        totals['inserted'] += upsert_counts['inserted']
+        totals['updated'] += upsert_counts['updated']
+
+        elapsed_seconds = time.perf_counter() - start_time
+        click.echo(f"{totals['read']:,} rows read, {totals['inserted']:,} inserted, "
+                   f"{totals['updated']:,} updated, {totals['skipped']:,} skipped "
+                   f"({totals['read'] / max(elapsed_seconds, 1e-9):,.0f} rows/s)")
+
+    pending_rows = []
+    for record in _read_records(path, file_format):
+        totals['read'] += 1
+        movie_values = _normalize_row(record) if record is not None else None
+        if movie_values is None:
+            totals['skipped'] += 1
+            continue
+        pending_rows.append(movie_values)
+        if len(pending_rows) >= chunk_size:
+            write_chunk(pending_rows)
+            pending_rows = []
+    if pending_rows:
+        write_chunk(pending_rows)
+
+    elapsed_seconds = time.perf_counter() - start_time
+    click.echo(f"Imported {totals['inserted'] + totals['updated']:,} movies from {path} in "
+               f"{elapsed_seconds:.2f} s: {totals['inserted']:,} inserted, {totals['updated']:,} updated, "
+               f"{totals['skipped']:,} skipped ({totals['read'] / max(elapsed_seconds, 1e-9):,.0f} rows/s).")
@@ -1,7 +1,62 @@
 import os
+import re
 import logging
 from logging.handlers import RotatingFileHandler
 
+from sqlalchemy import event
+
+# PRAGMAs applied to every new SQLite connection. Each can be overridden with
+# the matching SQLITE_<NAME> environment variable; an empty value skips it.
+SQLITE_PRAGMA_DEFAULTS = {
+    'journal_mode': 'WAL',        # Readers no longer block on writers
+    'synchronous': 'NORMAL',      # Durable in WAL mode with far fewer fsyncs
+    'cache_size': '-20000',       # Negative values are KiB: 20 MB page cache
+    'mmap_size': '268435456',     # 256 MB memory-mapped I/O
+    'temp_store': 'MEMORY',
+    'busy_timeout': '5000',       # Wait up to 5 s for locks instead of failing
+    'foreign_keys': 'ON',
+}
+
+_PRAGMA_VALUE_PATTERN = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+
+def load_sqlite_pragmas() -> dict:
+    """Read the SQLite PRAGMA settings from the environment.
+
+    Returns:
+        dict: Mapping of PRAGMA name to value, in application order.
+
+    Raises:
+        ValueError: If a configured value is not a plain word or integer.
+    """
+    sqlite_pragmas = {}
+    for pragma_name, default_value in SQLITE_PRAGMA_DEFAULTS.items():
+        pragma_value = os.getenv(f'SQLITE_{pragma_name.upper()}', default_value).strip()
+        if not pragma_value:
+            continue
+        if not _PRAGMA_VALUE_PATTERN.match(pragma_value):
+            raise ValueError(f"Invalid value for SQLITE_{pragma_name.upper()}: {pragma_value!r}")
+        sqlite_pragmas[pragma_name] = pragma_value
+    return sqlite_pragmas
+
+
+def register_sqlite_pragmas(engine, sqlite_pragmas: dict) -> None:
+    """Apply PRAGMAs to every new DBAPI connection of an SQLite engine.
+
+    Args:
+        engine: The SQLAlchemy engine to hook.
+        sqlite_pragmas: Mapping of PRAGMA name to value (see load_sqlite_pragmas).
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma_name, pragma_value in sqlite_pragmas.items():
+            cursor.execute(f"PRAGMA {pragma_name}={pragma_value}")
+        cursor.close()
+
 
 def configure_database(app):
     """Configure database connection using SQLite by default.
@@ -9,7 +64,9 @@ def configure_database(app):
     Uses `DATABASE_URL` only when it points to a SQLite database; otherwise
     falls back to a local `data/movies.db` file. This keeps the application
     compatible with platforms like PythonAnywhere that do not offer PostgreSQL
-    on the free tier.
+    on the free tier. Also sets the connection pool options and the SQLite
+    PRAGMAs (WAL journal, synchronous, cache and mmap sizes, busy timeout,
+    foreign keys) read from `SQLALCHEMY_POOL_*` and `SQLITE_*` variables.
 
     Args:
         app: The Flask application instance to configure.
@@ -33,6 +90,15 @@ def configure_database(app):
 
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Connection tuning: PRAGMAs are applied by register_sqlite_pragmas in create_app
+    app.config['SQLITE_PRAGMAS'] = load_sqlite_pragmas()
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': int(os.getenv('SQLALCHEMY_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('SQLALCHEMY_MAX_OVERFLOW', '10')),
+        'pool_timeout': float(os.getenv('SQLALCHEMY_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.getenv('SQLALCHEMY_POOL_RECYCLE', '3600')),
+    }
+
 
 def setup_logging(app):
     """Configure logging based on environment.
@@ -1,11 +1,25 @@
 from abc import ABC, abstractmethod
 
-from datamanager.data_models import User, Movie
+from datamanager.data_models import User, Movie, Job
+from datamanager.snapshots import UserSnapshot, MovieSnapshot, UserMoviesPage
+from datamanager.pagination import Page
 
 
 class DataManagerInterface(ABC):
     """Abstract interface for data management operations."""
 
+    @abstractmethod
+    def get_data_versions(self, scopes) -> dict:
+        """Read the change counters of data scopes.
+
+        Args:
+            scopes: The scopes to read, e.g. ['users'] or ['user:3', 'movies'].
+
+        Returns:
+            dict: (version, updated_at) per scope; (0, None) for unwritten scopes.
+        """
+        pass
+
     @abstractmethod
     def get_all_users(self) -> list[User]:
         """Fetch all users from the database.
@@ -24,6 +38,41 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_users_page(self, limit: int | None = None, cursor: str | None = None) -> Page:
+        """Fetch one page of users ordered by ID.
+
+        Args:
+            limit: Maximum number of users to return.
+            cursor: The next_cursor of the previous page, or None for the first page.
+
+        Returns:
+            Page: The users on this page, as UserSnapshot objects, and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        pass
+
+    @abstractmethod
+    def get_movies_page(self, limit: int | None = None, cursor: str | None = None,
+                        sort: str = 'id', descending: bool = False) -> Page:
+        """Fetch one page of movies in a stable order.
+
+        Args:
+            limit: Maximum number of movies to return.
+            cursor: The next_cursor of the previous page, or None for the first page.
+            sort: The sort key ('id', 'title', 'year' or 'rating').
+            descending: Whether to sort in descending order.
+
+        Returns:
+            Page: The movies on this page, as MovieSnapshot objects, and the cursor of the next page.
+
+        Raises:
+            ValueError: If the sort key or the cursor is invalid.
+        """
+        pass
+
     @abstractmethod
     def get_user_movies(self, user_id: int) -> list[dict]:
         """Fetch all movies associated with a user from the database.
@@ -37,14 +86,88 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def get_user(self, user_id: int) -> User:
+    def get_user_with_movies(self, user_id: int, limit: int | None = None,
+                             cursor: str | None = None) -> UserMoviesPage:
+        """Fetch a user and one page of their movies with ratings in a single query.
+
+        Args:
+            user_id: The unique identifier of the user.
+            limit: Maximum number of movies to return.
+            cursor: The next_cursor of the previous page, or None for the first page.
+
+        Returns:
+            UserMoviesPage: The user, the movies on this page (ordered by movie ID)
+                and the cursor of the next page.
+
+        Raises:
+            ValueError: If the user is not found or the cursor is invalid.
+        """
+        pass
+
+    @abstractmethod
+    def search_movies(self, search_text: str, limit: int | None = None, cursor: str | None = None) -> Page:
+        """Full-text search movies by title and director, best matches first.
+
+        Args:
+            search_text: The words to search for.
+            limit: Maximum number of movies to return.
+            cursor: The next_cursor of the previous page, or None for the first page.
+
+        Returns:
+            Page: The matching movies on this page, as MovieSnapshot objects, and the cursor of the next page.
+
+        Raises:
+            ValueError: If the query has no searchable words or the cursor is invalid.
+        """
+        pass
+
+    @abstractmethod
+    def suggest_titles(self, prefix: str, limit: int | None = None) -> list:
+        """Suggest catalog titles starting with the text typed so far.
+
+        Args:
+            prefix: The beginning of a title.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            list: Suggestions with movie_id, title and release_year.
+        """
+        pass
+
+    @abstractmethod
+    def iter_movies(self, batch_size: int = 1000):
+        """Stream every movie in the catalog without loading it all into memory.
+
+        Args:
+            batch_size: Number of rows fetched from the database at a time.
+
+        Yields:
+            dict: The columns of one movie.
+        """
+        pass
+
+    @abstractmethod
+    def iter_user_movies(self, user_id: int, batch_size: int = 1000):
+        """Stream the movies in a user's collection with their user ratings.
+
+        Args:
+            user_id: The unique identifier of the user.
+            batch_size: Number of rows fetched from the database at a time.
+
+        Yields:
+            dict: The columns of one movie plus user_rating.
+        """
+        pass
+
+    @abstractmethod
+    def get_user(self, user_id: int) -> UserSnapshot:
         """Fetch a user by ID from the database.
 
         Args:
             user_id: The unique identifier of the user.
 
         Returns:
-            User: The User object if found.
+            UserSnapshot: An immutable snapshot of the user if found.
 
         Raises:
             ValueError: If user with the given ID is not found.
@@ -97,6 +220,21 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def delete_users(self, user_ids: list[int]) -> list[str]:
+        """Delete many users from the database in one transaction.
+
+        Args:
+            user_ids: The unique identifiers of the users to delete.
+
+        Returns:
+            list[str]: The names of the users that were deleted.
+
+        Raises:
+            ValueError: If deletion fails.
+        """
+        pass
+
     @abstractmethod
     def get_user_by_name(self, user_name: str) -> User:
         """Get a user by their name.
@@ -130,14 +268,31 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def get_movie(self, movie_id: int) -> Movie:
-        """Get a movie object from the database by ID.
+    def add_movies(self, user_id: int, titles: list[str]) -> list[dict]:
+        """Add many movies to a user's collection in one transaction.
+
+        Args:
+            user_id: The unique identifier of the user.
+            titles: The titles of the movies to add.
+
+        Returns:
+            list[dict]: One dictionary per input title with 'title', 'message'
+                ('added', 'linked', 'not_found') and 'movie' keys.
+
+        Raises:
+            ValueError: If the movies cannot be added due to database errors.
+        """
+        pass
+
+    @abstractmethod
+    def get_movie(self, movie_id: int) -> MovieSnapshot:
+        """Get a movie from the database by ID.
 
         Args:
             movie_id: The unique identifier of the movie.
 
         Returns:
-            Movie: The Movie object if found.
+            MovieSnapshot: An immutable snapshot of the movie if found.
 
         Raises:
             ValueError: If movie with the given ID is not found.
@@ -158,6 +313,22 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def upsert_movies(self, movie_rows: list[dict]) -> dict:
+        """Insert or update catalog movies keyed by (title, release_year).
+
+        Args:
+            movie_rows: Dictionaries with 'title', 'release_year', 'poster',
+                'director' and 'rating' keys.
+
+        Returns:
+            dict: Counts of 'inserted' and 'updated' movies.
+
+        Raises:
+            ValueError: If the rows cannot be written.
+        """
+        pass
+
     @abstractmethod
     def delete_movie(self, user_id: int, movie_id: int) -> Movie:
         """Delete a movie from a user's collection.
@@ -171,4 +342,76 @@ class DataManagerInterface(ABC):
         Returns:
             Movie: The deleted Movie object if found, None otherwise.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def create_job(self, kind: str, user_id: int, title: str, dedupe_key: str) -> tuple[Job, bool]:
+        """Enqueue a job unless an equivalent one is already queued or running.
+
+        Args:
+            kind: The type of work, e.g. 'add_movie'.
+            user_id: The user the job acts for.
+            title: The movie title to process.
+            dedupe_key: Key identifying equivalent jobs.
+
+        Returns:
+            tuple[Job, bool]: The job, and whether it was newly created.
+
+        Raises:
+            ValueError: If the job cannot be stored.
+        """
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: int) -> Job:
+        """Fetch a job by ID.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Returns:
+            Job: The Job object.
+
+        Raises:
+            ValueError: If no job with the given ID exists.
+        """
+        pass
+
+    @abstractmethod
+    def claim_job(self, job_id: int) -> bool:
+        """Atomically move a queued job to 'running'.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Returns:
+            bool: True if this caller claimed the job.
+        """
+        pass
+
+    @abstractmethod
+    def finish_job(self, job_id: int, status: str, result_message: str | None = None,
+                   movie_id: int | None = None, error: str | None = None) -> None:
+        """Record the outcome of a running job.
+
+        Args:
+            job_id: The unique identifier of the job.
+            status: 'succeeded' or 'failed'.
+            result_message: The outcome reported by the data manager.
+            movie_id: The movie the job resolved to, if any.
+            error: The error message of a failed job.
+        """
+        pass
+
+    @abstractmethod
+    def requeue_stale_jobs(self, stale_after_seconds: float) -> list[int]:
+        """Requeue abandoned running jobs and list all queued jobs.
+
+        Args:
+            stale_after_seconds: Age after which a running job is considered abandoned.
+
+        Returns:
+            list[int]: IDs of queued jobs, oldest first.
+        """
+        pass
+
@@ -1,4 +1,10 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DDL, event
+
 from extensions import db
+from datamanager.search import MOVIE_FTS_DDL, MOVIE_FTS_DROP_DDL
+from datamanager.titles import normalize_catalog_title
 
 
 class User(db.Model):
@@ -23,12 +29,19 @@ class User(db.Model):
         return f"{self.id}, {self.name}"
 
 
+def _normalized_title_default(context) -> str:
+    """Column default deriving normalized_title from the inserted title."""
+    return normalize_catalog_title(context.get_current_parameters()['title'])
+
+
 class Movie(db.Model):
     """Represents a movie in the database.
 
     Attributes:
         id: The unique identifier for the movie.
         title: The title of the movie.
+        normalized_title: The title as matched by the local-first resolver
+            (case, whitespace and article insensitive).
         release_year: The release year of the movie.
         poster: The URL of the movie poster.
         director: The director of the movie.
@@ -36,9 +49,20 @@ class Movie(db.Model):
         user_movies: Relationship to UserMovies linking table.
     """
     __tablename__ = 'movie'
+    __table_args__ = (
+        db.Index('uq_movie_title_release_year', 'title', 'release_year', unique=True),
+        # NULLs are distinct in unique indexes, so year-less titles need their own
+        db.Index('uq_movie_title_null_release_year', 'title', unique=True,
+                 sqlite_where=db.text('release_year IS NULL')),
+        db.Index('ix_movie_title', 'title'),
+        db.Index('ix_movie_release_year', 'release_year'),
+        db.Index('ix_movie_rating', 'rating'),
+        db.Index('ix_movie_normalized_title_release_year', 'normalized_title', 'release_year'),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String, nullable=False)
+    normalized_title = db.Column(db.String, nullable=True, default=_normalized_title_default)
     release_year = db.Column(db.Integer, nullable=True)
     poster = db.Column(db.String, nullable=True)
     director = db.Column(db.String, nullable=True)
@@ -54,6 +78,13 @@ class Movie(db.Model):
         return f"{self.id}, {self.title}, {self.release_year}"
 
 
+# Databases created with db.create_all() (tests, first run) get the same
+# full-text index as migrated ones; see alembic revision 008
+for _fts_statement in MOVIE_FTS_DDL:
+    event.listen(Movie.__table__, 'after_create', DDL(_fts_statement).execute_if(dialect='sqlite'))
+event.listen(Movie.__table__, 'before_drop', DDL(MOVIE_FTS_DROP_DDL).execute_if(dialect='sqlite'))
+
+
 class UserMovies(db.Model):
     """Linking table connecting users and movies with personal ratings.
 
@@ -66,6 +97,10 @@ class UserMovies(db.Model):
         movie: Relationship to Movie model.
     """
     __tablename__ = 'user_movies'
+    __table_args__ = (
+        db.Index('uq_user_movies_user_id_movie_id', 'user_id', 'movie_id', unique=True),
+        db.Index('ix_user_movies_movie_id', 'movie_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -77,3 +112,102 @@ class UserMovies(db.Model):
 
     def __repr__(self):
         return f'UserMovies(id = {self.id}, user_id = {self.user_id}, movie_id = {self.movie_id}, user_rating = {self.user_rating})'
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime (as stored by SQLite)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class Job(db.Model):
+    """Represents a background job, such as adding a movie asynchronously.
+
+    Attributes:
+        id: The unique identifier for the job.
+        kind: The type of work, e.g. 'add_movie'.
+        user_id: The user the job acts for.
+        title: The movie title to process.
+        dedupe_key: Identifies equivalent jobs; at most one of them is active at a time.
+        status: One of 'queued', 'running', 'succeeded', 'failed'.
+        result_message: The outcome reported by the data manager ('added', 'linked', 'not_found').
+        movie_id: The movie the job resolved to, if any.
+        error: The error message of a failed job.
+        attempts: How many times the job was claimed by a worker.
+        created_at: When the job was enqueued (UTC).
+        updated_at: When the job last changed state (UTC).
+    """
+    __tablename__ = 'job'
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+    __table_args__ = (
+        # Coalesces duplicate jobs: only one queued/running job per dedupe key
+        db.Index('uq_job_active_dedupe_key', 'dedupe_key', unique=True,
+                 sqlite_where=db.text("status IN ('queued', 'running')")),
+        db.Index('ix_job_status_updated_at', 'status', 'updated_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    kind = db.Column(db.String, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    title = db.Column(db.String, nullable=False)
+    dedupe_key = db.Column(db.String, nullable=False)
+    status = db.Column(db.String, nullable=False, default='queued')
+    result_message = db.Column(db.String, nullable=True)
+    movie_id = db.Column(db.Integer, nullable=True)
+    error = db.Column(db.String, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, nullable=False, default=_utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
+
+    def __repr__(self):
+        return f'Job(id = {self.id}, kind = {self.kind}, title = {self.title}, status = {self.status})'
+
+
+class DataVersion(db.Model):
+    """Change counter of one scope of data, used to validate cached reads.
+
+    The data manager increments the counters of every scope a write touches,
+    in the same transaction as the write. Readers compare counters instead of
+    re-running their queries (HTTP ETag/Last-Modified, cached fragments).
+
+    Attributes:
+        scope: What the counter covers: 'users' (the user list), 'movies' (the
+            catalog) or 'user:<id>' (one user's name and collection).
+        version: Number of committed writes to the scope.
+        updated_at: When the scope last changed (UTC).
+    """
+    __tablename__ = 'data_version'
+
+    USERS = 'users'
+    MOVIES = 'movies'
+
+    scope = db.Column(db.String, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=_utcnow)
+
+    @staticmethod
+    def user_scope(user_id: int) -> str:
+        """Return the scope covering one user's name and movie collection."""
+        return f'user:{user_id}'
+
+    def __repr__(self):
+        return f'DataVersion(scope = {self.scope}, version = {self.version}, updated_at = {self.updated_at})'
+
+
+@event.listens_for(DataVersion.__table__, 'after_create')
+def _seed_data_versions(target, connection, **kwargs):
+    """Start the table-wide counters at creation time, like alembic revision 009.
+
+    Versions of a recreated database then never repeat those of the
+    previous one, so validators and cached fragments cannot be mistaken.
+    """
+    created_at = _utcnow()
+    connection.execute(target.insert(), [
+        {'scope': DataVersion.USERS, 'version': 1, 'updated_at': created_at},
+        {'scope': DataVersion.MOVIES, 'version': 1, 'updated_at': created_at},
+    ])
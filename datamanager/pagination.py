@@ -0,0 +1,105 @@
+import json
+import base64
+import binascii
+from typing import NamedTuple
+
+from sqlalchemy import and_, or_, tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class Page(NamedTuple):
+    """One page of keyset-paginated results.
+
+    Attributes:
+        items: The rows on this page.
+        next_cursor: Opaque cursor for the following page, or None on the last page.
+    """
+    items: list
+    next_cursor: str | None
+
+
+def clamp_page_size(limit: int | None) -> int:
+    """Return a page size within 1..MAX_PAGE_SIZE, defaulting to DEFAULT_PAGE_SIZE.
+
+    Args:
+        limit: The requested page size, or None.
+
+    Returns:
+        int: The page size to use.
+    """
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort_key: str, last_value, last_id: int) -> str:
+    """Encode the position after a row into an opaque, URL-safe cursor.
+
+    Args:
+        sort_key: Identifies the ordering the cursor belongs to (e.g. 'rating:desc').
+        last_value: The sort column value of the last row on the page.
+        last_id: The primary key of the last row on the page.
+
+    Returns:
+        str: The cursor.
+    """
+    payload = json.dumps([sort_key, last_value, last_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple:
+    """Decode a cursor created by encode_cursor for the same ordering.
+
+    Args:
+        cursor: The opaque cursor.
+        sort_key: The ordering the cursor must belong to.
+
+    Returns:
+        tuple: (last_value, last_id).
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another ordering.
+    """
+    try:
+        padded_cursor = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort_key, last_value, last_id = json.loads(base64.urlsafe_b64decode(padded_cursor))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Invalid pagination cursor")
+    if cursor_sort_key != sort_key or not isinstance(last_id, int):
+        raise ValueError("Invalid pagination cursor")
+    return last_value, last_id
+
+
+def keyset_filter(sort_column, id_column, last_value, last_id: int, descending: bool = False):
+    """Build the WHERE clause selecting rows after (last_value, last_id).
+
+    Rows are assumed to be ordered by (sort_column, id_column), both ascending
+    or both descending. The common case is a row-value comparison, which SQLite
+    answers with an index seek. SQLite sorts NULLs first in ascending and last
+    in descending order, so nullable sort columns need an extra branch.
+
+    Args:
+        sort_column: The column the rows are ordered by.
+        id_column: The unique tie-breaker column.
+        last_value: The sort column value of the last row already returned.
+        last_id: The tie-breaker value of the last row already returned.
+        descending: Whether the ordering is descending.
+
+    Returns:
+        ColumnElement: The filter condition.
+    """
+    if sort_column is id_column:
+        return id_column < last_id if descending else id_column > last_id
+
+    if last_value is None:
+        # Still inside the block of NULL sort values
+        if descending:
+            return and_(sort_column.is_(None), id_column < last_id)
+        return or_(and_(sort_column.is_(None), id_column > last_id), sort_column.is_not(None))
+
+    if descending:
+        after_condition = tuple_(sort_column, id_column) < tuple_(last_value, last_id)
+        return or_(after_condition, sort_column.is_(None)) if sort_column.nullable else after_condition
+    return tuple_(sort_column, id_column) > tuple_(last_value, last_id)
@@ -0,0 +1,58 @@
+import re
+
+import sqlalchemy as sa
+
+# External-content FTS5 index over movie.title and movie.director. The index
+# stores only tokens; rows are read from the movie table. Prefix indexes on
+# 2 and 3 characters keep short "ma*" style prefix queries fast.
+MOVIE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS movie_fts USING fts5("
+    "title, director, content='movie', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    # Title matches weigh ten times more than director matches in ORDER BY rank
+    "INSERT INTO movie_fts(movie_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "CREATE TRIGGER IF NOT EXISTS movie_fts_after_insert AFTER INSERT ON movie BEGIN "
+    "INSERT INTO movie_fts(rowid, title, director) VALUES (new.id, new.title, new.director); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS movie_fts_after_delete AFTER DELETE ON movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title, director) "
+    "VALUES ('delete', old.id, old.title, old.director); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS movie_fts_after_update AFTER UPDATE OF title, director ON movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title, director) "
+    "VALUES ('delete', old.id, old.title, old.director); "
+    "INSERT INTO movie_fts(rowid, title, director) VALUES (new.id, new.title, new.director); "
+    "END",
+)
+
+MOVIE_FTS_DROP_DDL = "DROP TABLE IF EXISTS movie_fts"
+
+# Lightweight handle for queries; the table itself is created by MOVIE_FTS_DDL
+movie_fts = sa.table('movie_fts', sa.column('rowid'), sa.column('rank'), sa.column('movie_fts'))
+
+# Maximum number of terms taken from a search query
+MAX_SEARCH_TERMS = 8
+
+_SEARCH_TERM = re.compile(r'\w+')
+
+
+def build_match_query(search_text: str) -> str:
+    """Turn user input into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term and all terms must match, so
+    "matr wach" finds "The Matrix" directed by the Wachowskis. Quoting keeps
+    FTS5 operators and punctuation in user input from being interpreted.
+
+    Args:
+        search_text: The raw search query.
+
+    Returns:
+        str: The MATCH expression.
+
+    Raises:
+        ValueError: If the query contains no searchable words.
+    """
+    search_terms = _SEARCH_TERM.findall(search_text or '')[:MAX_SEARCH_TERMS]
+    if not search_terms:
+        raise ValueError("Search query must contain at least one letter or digit")
+    return ' '.join(f'"{term}"*' for term in search_terms)
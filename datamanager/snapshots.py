@@ -0,0 +1,149 @@
+import os
+import threading
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from services.cache import TTLCache, MISSING
+
+# Snapshots kept per entity type, and seconds before one is re-read. Writes made
+# through this process invalidate entries at once; the TTL bounds how long
+# writes made by other worker processes can go unseen.
+IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", "1024"))
+IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL", "30"))
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Immutable copy of a user row, safe to share between requests and threads.
+
+    Attributes:
+        id: The unique identifier for the user.
+        name: The name of the user.
+    """
+    id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class MovieSnapshot:
+    """Immutable copy of a movie row, safe to share between requests and threads.
+
+    Attributes:
+        id: The unique identifier for the movie.
+        title: The title of the movie.
+        release_year: The release year of the movie.
+        poster: The URL of the movie poster.
+        director: The director of the movie.
+        rating: The IMDB rating of the movie.
+    """
+    id: int
+    title: str
+    release_year: int | None
+    poster: str | None
+    director: str | None
+    rating: float | None
+
+
+class UserMovieRow(NamedTuple):
+    """One movie of a user's collection with the user's rating, as read by get_user_with_movies."""
+    id: int
+    title: str
+    release_year: int | None
+    poster: str | None
+    director: str | None
+    rating: float | None
+    user_rating: float | None
+
+
+class UserMoviesPage(NamedTuple):
+    """A user together with one keyset-paginated page of their movies.
+
+    Attributes:
+        user: The user.
+        movies: The movies on this page, ordered by movie ID.
+        next_cursor: Opaque cursor for the following page, or None on the last page.
+    """
+    user: UserSnapshot
+    movies: list[UserMovieRow]
+    next_cursor: str | None
+
+
+class IdentityCache:
+    """Read-through cache of entity snapshots keyed by primary key.
+
+    A lookup that misses runs the loader and caches its result. Every
+    invalidation bumps a generation counter; a loader result is only cached if
+    no invalidation happened while it ran, so a read that raced a write cannot
+    put the old row back after the write invalidated it.
+
+    Attributes:
+        cache: The TTLCache holding the snapshots (its stats() are the hit rates).
+    """
+
+    def __init__(self, max_size: int = IDENTITY_CACHE_SIZE, ttl: float = IDENTITY_CACHE_TTL):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of snapshots; 0 disables caching.
+            ttl: Seconds a snapshot is served before it is re-read.
+        """
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def configure(self, max_size: int, ttl: float) -> None:
+        """Change the size and TTL, dropping all snapshots.
+
+        Args:
+            max_size: Maximum number of snapshots; 0 disables caching.
+            ttl: Seconds a snapshot is served before it is re-read.
+        """
+        self.cache.max_size = max_size
+        self.cache.ttl = ttl
+        self.clear()
+
+    def get_or_load(self, key, loader):
+        """Return the cached snapshot for a key, loading it on a miss.
+
+        Args:
+            key: The primary key.
+            loader: Called with the key on a miss; returns the snapshot or
+                raises (failures are not cached).
+
+        Returns:
+            The snapshot.
+        """
+        snapshot = self.cache.get(key)
+        if snapshot is not MISSING:
+            return snapshot
+        generation = self._generation
+        snapshot = loader(key)
+        with self._lock:
+            if generation == self._generation:
+                self.cache.set(key, snapshot)
+        return snapshot
+
+    def invalidate(self, *keys) -> None:
+        """Drop the snapshots of keys; call after the write that changed them is committed.
+
+        Args:
+            *keys: The primary keys of the changed rows.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self.cache.delete(key)
+
+    def clear(self) -> None:
+        """Drop all snapshots and reset the counters."""
+        with self._lock:
+            self._generation += 1
+            self.cache.clear()
+
+    def stats(self) -> dict:
+        """Return the cache counters.
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_ratio.
+        """
+        return self.cache.stats()
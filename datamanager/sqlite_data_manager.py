@@ -1,13 +1,53 @@
 import logging
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, update, delete, exists, text, func, and_, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from datamanager.data_manager_interface import DataManagerInterface
-from datamanager.data_models import User, Movie, UserMovies
+from datamanager.data_models import User, Movie, UserMovies, Job, DataVersion, _utcnow
+from datamanager.pagination import Page, clamp_page_size, encode_cursor, decode_cursor, keyset_filter
 from extensions import db
-from services.omdb_api import fetch_movie_data
+from datamanager.search import movie_fts, build_match_query
+from datamanager.suggest import TitleIndex, Suggestion, DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS
+from datamanager.titles import normalize_catalog_title, split_title_year
+from datamanager.snapshots import (UserSnapshot, MovieSnapshot, UserMovieRow, UserMoviesPage, IdentityCache,
+                                   IDENTITY_CACHE_SIZE, IDENTITY_CACHE_TTL)
+from services.omdb_api import fetch_movie_data, fetch_movies_data, OMDB_ALWAYS_REFRESH
+from services.posters import poster_store
 
 logger = logging.getLogger(__name__)
 
+# Bound parameters per IN (...) list; keeps statements under SQLite's variable limit
+SQL_PARAMETER_CHUNK_SIZE = 500
+
+# Public sort keys for movie listings, mapped to indexed Movie columns
+MOVIE_SORT_COLUMNS = {
+    'id': 'id',
+    'title': 'title',
+    'year': 'release_year',
+    'rating': 'rating',
+}
+
+# Movie columns written by upsert_movies
+UPSERT_COLUMNS = ('title', 'release_year', 'poster', 'director', 'rating')
+UPSERT_UPDATE_COLUMNS = ('poster', 'director', 'rating')
+
+# Rows fetched per round trip when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Movie columns included in exports, in output order
+MOVIE_EXPORT_COLUMNS = (Movie.id, Movie.title, Movie.release_year, Movie.poster, Movie.director, Movie.rating)
+
+# Read-only listings run Core selects of these table columns instead of loading ORM objects
+USER_ROW_COLUMNS = (User.__table__.c.id, User.__table__.c.name)
+MOVIE_ROW_COLUMNS = tuple(Movie.__table__.c[column.key] for column in MOVIE_EXPORT_COLUMNS)
+
+
+def _chunked(values: list, chunk_size: int):
+    """Yield consecutive slices of values with at most chunk_size items."""
+    for start_index in range(0, len(values), chunk_size):
+        yield values[start_index:start_index + chunk_size]
+
 
 class SQLiteDataManager(DataManagerInterface):
     """Data manager implementation for SQLite database operations.
@@ -18,12 +58,21 @@ class SQLiteDataManager(DataManagerInterface):
     Attributes:
         db: SQLAlchemy database instance.
         db_path: Path to the database file (set during initialization).
+        always_refresh: Resolve titles through OMDb even when they exist locally.
+        title_index: In-memory prefix index behind suggest_titles.
+        user_cache: Snapshots returned by get_user, invalidated by user writes.
+        movie_cache: Snapshots returned by get_movie, invalidated by movie writes.
     """
 
     def __init__(self):
         """Initialize the SQLiteDataManager instance."""
         self.db = db
         self.db_path = None
+        self.sqlite_pragmas = {}
+        self.always_refresh = OMDB_ALWAYS_REFRESH
+        self.title_index = TitleIndex()
+        self.user_cache = IdentityCache()
+        self.movie_cache = IdentityCache()
 
     def init_app(self, app):
         """Initialize the data manager with the Flask application.
@@ -32,12 +81,103 @@ class SQLiteDataManager(DataManagerInterface):
             app: The Flask application instance.
         """
         self.db_path = app.config.get("SQLALCHEMY_DATABASE_URI", "sqlite:///movies.db")
+        self.sqlite_pragmas = app.config.get("SQLITE_PRAGMAS", {})
+        self.always_refresh = app.config.setdefault("OMDB_ALWAYS_REFRESH", OMDB_ALWAYS_REFRESH)
+        # The index and snapshots belong to the application's database
+        self.title_index.clear()
+        cache_size = app.config.setdefault("IDENTITY_CACHE_SIZE", IDENTITY_CACHE_SIZE)
+        cache_ttl = app.config.setdefault("IDENTITY_CACHE_TTL", IDENTITY_CACHE_TTL)
+        self.user_cache.configure(cache_size, cache_ttl)
+        self.movie_cache.configure(cache_size, cache_ttl)
+
+    def get_identity_cache_stats(self) -> dict:
+        """Report the hit rates of the get_user and get_movie snapshot caches.
+
+        Returns:
+            dict: TTLCache stats under 'users' and 'movies'.
+        """
+        return {'users': self.user_cache.stats(), 'movies': self.movie_cache.stats()}
+
+    def get_database_diagnostics(self) -> dict:
+        """Report the active SQLite PRAGMA values, connection pool status and cache hit rates.
+
+        Returns:
+            dict: 'dialect', 'configured_pragmas', 'active_pragmas' (as read back
+                from the database on a pooled connection), 'pool' status and
+                'identity_cache' hit rates.
+        """
+        engine = self.db.engine
+        active_pragmas = {}
+        if engine.dialect.name == 'sqlite':
+            connection = self.db.session.connection()
+            for pragma_name in self.sqlite_pragmas:
+                active_pragmas[pragma_name] = connection.execute(text(f"PRAGMA {pragma_name}")).scalar()
+        return {
+            'dialect': engine.dialect.name,
+            'configured_pragmas': dict(self.sqlite_pragmas),
+            'active_pragmas': active_pragmas,
+            'pool': engine.pool.status(),
+            'identity_cache': self.get_identity_cache_stats(),
+        }
+
+    def get_data_versions(self, scopes) -> dict[str, tuple[int, object]]:
+        """Read the change counters of data scopes (see DataVersion).
+
+        Args:
+            scopes: The scopes to read, e.g. ['users'] or ['user:3', 'movies'].
+
+        Returns:
+            dict[str, tuple[int, datetime | None]]: (version, updated_at) per scope;
+                (0, None) for scopes that have never been written.
+        """
+        scopes = list(scopes)
+        versions = {scope: (0, None) for scope in scopes}
+        for scope, version, updated_at in self.db.session.execute(
+            select(DataVersion.scope, DataVersion.version, DataVersion.updated_at)
+            .where(DataVersion.scope.in_(scopes))
+        ):
+            versions[scope] = (version, updated_at)
+        return versions
+
+    def _bump_data_versions(self, *scopes: str) -> None:
+        """Increment the change counters of scopes (uncommitted).
+
+        Runs in the caller's transaction, so counters move exactly when the
+        write they describe is committed.
+
+        Args:
+            *scopes: The scopes the write touches.
+        """
+        updated_at = _utcnow()
+        for scopes_chunk in _chunked(sorted(set(scopes)), SQL_PARAMETER_CHUNK_SIZE):
+            version_upsert = sqlite_insert(DataVersion).values(
+                [{'scope': scope, 'version': 1, 'updated_at': updated_at} for scope in scopes_chunk]
+            )
+            self.db.session.execute(version_upsert.on_conflict_do_update(
+                index_elements=[DataVersion.scope],
+                set_={'version': DataVersion.version + 1, 'updated_at': version_upsert.excluded.updated_at}
+            ))
+
+    def _read_rows(self, query) -> list:
+        """Run a Core select on the session's connection and return its rows.
+
+        The statement bypasses the ORM entirely: nothing is added to the
+        identity map and no attribute instrumentation runs. It still shares
+        the session's transaction, so uncommitted writes are visible.
+
+        Args:
+            query: A select() of table columns.
+
+        Returns:
+            list[Row]: The result rows (named tuples).
+        """
+        return self.db.session.connection().execute(query).all()
 
     def get_all_users(self) -> list[User]:
         """Fetch all users from the database.
 
         Returns:
-            list[User]: List of all User objects, or empty list if error occurs.
+            list[User]: List of all users, or empty list if error occurs.
         """
         try:
             return self.db.session.query(User).all()
@@ -49,7 +189,7 @@ class SQLiteDataManager(DataManagerInterface):
         """Fetch all movies from the database.
 
         Returns:
-            list[Movie]: List of all Movie objects, or empty list if error occurs.
+            list[Movie]: List of all movies, or empty list if error occurs.
         """
         try:
             return self.db.session.query(Movie).all()
@@ -57,6 +197,81 @@ class SQLiteDataManager(DataManagerInterface):
             logger.error(f"Error fetching movies: {db_error}", exc_info=True)
             return []
 
+    def get_users_page(self, limit: int | None = None, cursor: str | None = None) -> Page:
+        """Fetch one page of users ordered by ID using keyset pagination.
+
+        Args:
+            limit: Maximum number of users to return (clamped to MAX_PAGE_SIZE).
+            cursor: The next_cursor of the previous page, or None for the first page.
+
+        Returns:
+            Page: The users on this page, as read-only UserSnapshot objects, and the
+                cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        page_size = clamp_page_size(limit)
+        query = select(*USER_ROW_COLUMNS).order_by(User.id).limit(page_size + 1)
+        if cursor:
+            _, last_id = decode_cursor(cursor, 'id:asc')
+            query = query.where(User.id > last_id)
+        try:
+            users = [UserSnapshot(*user_row) for user_row in self._read_rows(query)]
+        except SQLAlchemyError as db_error:
+            logger.error(f"Error fetching users page: {db_error}", exc_info=True)
+            return Page([], None)
+
+        if len(users) <= page_size:
+            return Page(users, None)
+        users = users[:page_size]
+        return Page(users, encode_cursor('id:asc', users[-1].id, users[-1].id))
+
+    def get_movies_page(self, limit: int | None = None, cursor: str | None = None,
+                        sort: str = 'id', descending: bool = False) -> Page:
+        """Fetch one page of movies using keyset pagination.
+
+        Movies are ordered by the sort column with the movie ID as tie-breaker,
+        so pages stay stable while rows are inserted or deleted.
+
+        Args:
+            limit: Maximum number of movies to return (clamped to MAX_PAGE_SIZE).
+            cursor: The next_cursor of the previous page, or None for the first page.
+            sort: One of MOVIE_SORT_COLUMNS ('id', 'title', 'year', 'rating').
+            descending: Whether to sort in descending order.
+
+        Returns:
+            Page: The movies on this page, as read-only MovieSnapshot objects, and
+                the cursor of the next page.
+
+        Raises:
+            ValueError: If the sort key or the cursor is invalid.
+        """
+        if sort not in MOVIE_SORT_COLUMNS:
+            raise ValueError(f"Invalid sort '{sort}'. Use one of: {', '.join(MOVIE_SORT_COLUMNS)}")
+        sort_column = getattr(Movie, MOVIE_SORT_COLUMNS[sort])
+        sort_key = f"{sort}:{'desc' if descending else 'asc'}"
+        page_size = clamp_page_size(limit)
+
+        order_columns = [Movie.id] if sort_column is Movie.id else [sort_column, Movie.id]
+        if descending:
+            order_columns = [column.desc() for column in order_columns]
+        query = select(*MOVIE_ROW_COLUMNS).order_by(*order_columns)
+        if cursor:
+            last_value, last_id = decode_cursor(cursor, sort_key)
+            query = query.where(keyset_filter(sort_column, Movie.id, last_value, last_id, descending))
+        try:
+            movies = [MovieSnapshot(*movie_row) for movie_row in self._read_rows(query.limit(page_size + 1))]
+        except SQLAlchemyError as db_error:
+            logger.error(f"Error fetching movies page: {db_error}", exc_info=True)
+            return Page([], None)
+
+        if len(movies) <= page_size:
+            return Page(movies, None)
+        movies = movies[:page_size]
+        last_movie = movies[-1]
+        return Page(movies, encode_cursor(sort_key, getattr(last_movie, sort_column.key), last_movie.id))
+
     def get_user_movies(self, user_id: int) -> list[dict]:
         """Fetch all movies associated with a user along with their user ratings.
 
@@ -68,51 +283,216 @@ class SQLiteDataManager(DataManagerInterface):
                 Each dictionary contains: id, title, release_year, poster, director,
                 rating (IMDB), and user_rating (personal). Returns empty list on error.
         """
+        user_movies_table = UserMovies.__table__
         try:
-            query_results = (
-                self.db.session.query(Movie, UserMovies.user_rating)
-                .join(UserMovies, UserMovies.movie_id == Movie.id)
-                .filter(UserMovies.user_id == user_id)
-                .all()
+            movie_rows = self._read_rows(
+                select(*MOVIE_ROW_COLUMNS, user_movies_table.c.user_rating)
+                .join(user_movies_table, user_movies_table.c.movie_id == Movie.__table__.c.id)
+                .where(user_movies_table.c.user_id == user_id)
             )
-            # Convert to list of dictionaries with movie attributes and user_rating
-            movies_list = []
-            for movie_obj, user_rating_value in query_results:
-                movie_data = {
-                    'id': movie_obj.id,
-                    'title': movie_obj.title,
-                    'release_year': movie_obj.release_year,
-                    'poster': movie_obj.poster,
-                    'director': movie_obj.director,
-                    'rating': movie_obj.rating,  # Keep original IMDB rating
-                    'user_rating': user_rating_value  # User's personal rating
-                }
-                movies_list.append(movie_data)
-            return movies_list
+            return [movie_row._asdict() for movie_row in movie_rows]
         except SQLAlchemyError as db_error:
             logger.error(f"Error fetching user movies for user {user_id}: {db_error}", exc_info=True)
             return []
 
-    def get_user(self, user_id: int) -> User:
-        """Fetch a user by ID from the database.
+    def get_user_with_movies(self, user_id: int, limit: int | None = None,
+                             cursor: str | None = None) -> UserMoviesPage:
+        """Fetch a user and one page of their movies with ratings in a single query.
+
+        The user is LEFT JOINed to their links and movies, so the user row
+        comes back even when the page is empty. The cursor condition sits in
+        the join, and rows are ordered by movie ID, which the
+        (user_id, movie_id) index returns in order. Only the displayed columns
+        are selected and returned as tuples, without ORM objects.
 
         Args:
             user_id: The unique identifier of the user.
+            limit: Maximum number of movies to return (clamped to MAX_PAGE_SIZE).
+            cursor: The next_cursor of the previous page, or None for the first page.
 
         Returns:
-            User: The User object if found.
+            UserMoviesPage: The user, the movies on this page and the cursor of the next page.
+
+        Raises:
+            ValueError: If the user is not found, the cursor is invalid or the query fails.
+        """
+        page_size = clamp_page_size(limit)
+        last_movie_id = decode_cursor(cursor, 'movie_id:asc')[1] if cursor else 0
+        query = (
+            select(User.id, User.name, Movie.id, Movie.title, Movie.release_year, Movie.poster,
+                   Movie.director, Movie.rating, UserMovies.user_rating)
+            .select_from(User)
+            .outerjoin(UserMovies, and_(UserMovies.user_id == User.id, UserMovies.movie_id > last_movie_id))
+            .outerjoin(Movie, Movie.id == UserMovies.movie_id)
+            .where(User.id == user_id)
+            .order_by(UserMovies.movie_id)
+            .limit(page_size + 1)
+        )
+        try:
+            rows = self.db.session.execute(query).all()
+        except SQLAlchemyError as db_error:
+            logger.error(f"Error fetching user page for user {user_id}: {db_error}", exc_info=True)
+            raise ValueError(f"Could not load movies of user {user_id}") from db_error
+        if not rows:
+            raise ValueError(f"No user found with ID {user_id}")
+
+        user = UserSnapshot(rows[0][0], rows[0][1])
+        movies = [UserMovieRow._make(row[2:]) for row in rows if row[2] is not None]
+        if len(movies) <= page_size:
+            return UserMoviesPage(user, movies, None)
+        movies = movies[:page_size]
+        return UserMoviesPage(user, movies, encode_cursor('movie_id:asc', movies[-1].id, movies[-1].id))
+
+    def search_movies(self, search_text: str, limit: int | None = None, cursor: str | None = None) -> Page:
+        """Full-text search movies by title and director, best matches first.
+
+        Uses the movie_fts FTS5 index with prefix matching on every word and
+        BM25 ranking (title matches weigh more than director matches). Pages
+        continue after the (rank, id) of the previous page's last movie.
+
+        Args:
+            search_text: The words to search for.
+            limit: Maximum number of movies to return (clamped to MAX_PAGE_SIZE).
+            cursor: The next_cursor of the previous page, or None for the first page.
+
+        Returns:
+            Page: The matching movies on this page, as read-only MovieSnapshot objects,
+                and the cursor of the next page.
+
+        Raises:
+            ValueError: If the query has no searchable words or the cursor is invalid.
+        """
+        match_query = build_match_query(search_text)
+        sort_key = f"search:{match_query}"
+        page_size = clamp_page_size(limit)
+
+        query = (
+            select(*MOVIE_ROW_COLUMNS, movie_fts.c.rank)
+            .join(movie_fts, movie_fts.c.rowid == Movie.id)
+            .where(movie_fts.c.movie_fts.match(match_query))
+            .order_by(movie_fts.c.rank, movie_fts.c.rowid)
+            .limit(page_size + 1)
+        )
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, sort_key)
+            query = query.where(or_(movie_fts.c.rank > last_rank,
+                                    and_(movie_fts.c.rank == last_rank, movie_fts.c.rowid > last_id)))
+        try:
+            ranked_movies = self.db.session.execute(query).all()
+        except SQLAlchemyError as db_error:
+            logger.error(f"Error searching movies for '{search_text}': {db_error}", exc_info=True)
+            return Page([], None)
+
+        movies = [MovieSnapshot(*movie_row[:-1]) for movie_row in ranked_movies[:page_size]]
+        if len(ranked_movies) <= page_size:
+            return Page(movies, None)
+        return Page(movies, encode_cursor(sort_key, ranked_movies[page_size - 1].rank, movies[-1].id))
+
+    def suggest_titles(self, prefix: str, limit: int | None = None) -> list[Suggestion]:
+        """Suggest catalog titles starting with the text typed so far.
+
+        Answers come from title_index, an in-memory sorted index that is
+        loaded on first use and kept current by the write methods of this
+        data manager. Titles match with or without a leading article.
+
+        Args:
+            prefix: The beginning of a title.
+            limit: Maximum number of suggestions (clamped to MAX_SUGGESTIONS).
+
+        Returns:
+            list[Suggestion]: Matching movies in alphabetical order.
+        """
+        limit = DEFAULT_SUGGESTIONS if limit is None else max(1, min(limit, MAX_SUGGESTIONS))
+        self.title_index.refresh_if_stale(self._load_title_index)
+        return self.title_index.suggest(prefix, limit)
+
+    def _load_title_index(self) -> list[tuple]:
+        """Read (id, title, release_year) of every movie for the title index."""
+        return self.db.session.execute(select(Movie.id, Movie.title, Movie.release_year)).all()
+
+    def iter_movies(self, batch_size: int = EXPORT_BATCH_SIZE):
+        """Stream every movie in the catalog ordered by ID.
+
+        Rows are read as plain columns in batches of batch_size, so neither
+        the result set nor ORM objects accumulate in memory.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor at a time.
+
+        Yields:
+            dict: id, title, release_year, poster, director and rating of one movie.
+        """
+        query = (
+            select(*MOVIE_EXPORT_COLUMNS)
+            .order_by(Movie.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for movie_row in self.db.session.execute(query):
+            yield movie_row._asdict()
+
+    def iter_user_movies(self, user_id: int, batch_size: int = EXPORT_BATCH_SIZE):
+        """Stream the movies in a user's collection ordered by movie ID.
+
+        Args:
+            user_id: The unique identifier of the user.
+            batch_size: Number of rows fetched from the cursor at a time.
+
+        Yields:
+            dict: The movie columns plus the user's personal user_rating.
+        """
+        query = (
+            select(*MOVIE_EXPORT_COLUMNS, UserMovies.user_rating)
+            .join(UserMovies, UserMovies.movie_id == Movie.id)
+            .where(UserMovies.user_id == user_id)
+            .order_by(Movie.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for movie_row in self.db.session.execute(query):
+            yield movie_row._asdict()
+
+    def get_user(self, user_id: int) -> UserSnapshot:
+        """Fetch a user by ID.
+
+        Served from the identity cache when possible; the result is an
+        immutable snapshot, not a session-bound User.
+
+        Args:
+            user_id: The unique identifier of the user.
+
+        Returns:
+            UserSnapshot: The user if found.
 
         Raises:
             ValueError: If user with the given ID is not found.
         """
+        return self.user_cache.get_or_load(user_id, self._load_user_snapshot)
+
+    def _load_user_snapshot(self, user_id: int) -> UserSnapshot:
+        """Read a user's columns into a snapshot (identity cache loader)."""
         try:
-            user_obj = self.db.session.query(User).filter(User.id == user_id).one_or_none()
-            if not user_obj:
-                raise ValueError(f"No user found with ID {user_id}")
-            return user_obj
+            user_row = self.db.session.execute(
+                select(User.id, User.name).where(User.id == user_id)
+            ).one_or_none()
         except SQLAlchemyError as db_error:
             # Re-raise as ValueError for consistency
             raise ValueError(f"No user found with ID {user_id}") from db_error
+        if user_row is None:
+            raise ValueError(f"No user found with ID {user_id}")
+        return UserSnapshot(*user_row)
+
+    def _get_user_for_update(self, user_id: int) -> User:
+        """Fetch the session-bound User for a write, bypassing the identity cache.
+
+        Raises:
+            ValueError: If user with the given ID is not found.
+        """
+        try:
+            user_obj = self.db.session.get(User, user_id)
+        except SQLAlchemyError as db_error:
+            raise ValueError(f"No user found with ID {user_id}") from db_error
+        if user_obj is None:
+            raise ValueError(f"No user found with ID {user_id}")
+        return user_obj
 
     def add_user(self, user_name: str) -> str:
         """Add a new user to the database.
@@ -130,6 +510,7 @@ class SQLiteDataManager(DataManagerInterface):
             raise ValueError("User name cannot be empty")
         new_user = User(name=user_name)
         self.db.session.add(new_user)
+        self._bump_data_versions(DataVersion.USERS)
         self.db.session.commit()
         return user_name
 
@@ -147,10 +528,12 @@ class SQLiteDataManager(DataManagerInterface):
             ValueError: If user is not found or update fails.
         """
         try:
-            # get_user raises ValueError if user not found
-            user_to_update = self.get_user(user_id)
+            # Raises ValueError if user not found
+            user_to_update = self._get_user_for_update(user_id)
             user_to_update.name = user_name
+            self._bump_data_versions(DataVersion.USERS, DataVersion.user_scope(user_id))
             self.db.session.commit()
+            self.user_cache.invalidate(user_id)
             return f"User '{user_name}' was updated successfully!"
 
         except SQLAlchemyError as db_error:
@@ -161,7 +544,7 @@ class SQLiteDataManager(DataManagerInterface):
         """Delete a user from the database.
 
         Also deletes associated user-movie links and removes movies that
-        are no longer associated with any users.
+        are no longer associated with any users, all in one transaction.
 
         Args:
             user_id: The unique identifier of the user to delete.
@@ -172,36 +555,88 @@ class SQLiteDataManager(DataManagerInterface):
         Raises:
             ValueError: If user is not found or deletion fails.
         """
+        user_to_delete = self._get_user_for_update(user_id)
+        deleted_user_name = user_to_delete.name
         try:
-            user_to_delete = self.get_user(user_id)
-            if not user_to_delete:
-                raise ValueError(f"No user found with ID {user_id}")
+            deleted_movie_ids = self._delete_users_and_orphaned_movies([user_id])
+            self.db.session.commit()
+            self.user_cache.invalidate(user_id)
+            self.movie_cache.invalidate(*deleted_movie_ids)
+            self.title_index.invalidate()
+            return deleted_user_name
 
-            # Get all movie IDs associated with the user
-            user_movie_links = self.db.session.query(UserMovies).filter_by(user_id=user_id).all()
-            associated_movie_ids = [user_movie.movie_id for user_movie in user_movie_links]
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while deleting user with ID {user_id}: {db_error}")
 
-            # Delete the user's entries in UserMovies
-            self.db.session.query(UserMovies).filter_by(user_id=user_id).delete()
+    def delete_users(self, user_ids: list[int]) -> list[str]:
+        """Delete many users, their links and their orphaned movies in one transaction.
 
-            # Delete the user
-            deleted_user_name = user_to_delete.name
-            self.db.session.delete(user_to_delete)
-            self.db.session.commit()
+        IDs that do not exist are ignored.
 
-            # Delete movies that are no longer associated with any users
-            for movie_id in associated_movie_ids:
-                remaining_links = self.db.session.query(UserMovies).filter_by(movie_id=movie_id).first()
-                if not remaining_links:
-                    self.db.session.query(Movie).filter_by(id=movie_id).delete()
+        Args:
+            user_ids: The unique identifiers of the users to delete.
 
-            self.db.session.commit()
+        Returns:
+            list[str]: The names of the users that were deleted.
 
-            return deleted_user_name
+        Raises:
+            ValueError: If deletion fails.
+        """
+        unique_user_ids = list(set(user_ids))
+        if not unique_user_ids:
+            return []
+        try:
+            deleted_user_names = []
+            for user_ids_chunk in _chunked(unique_user_ids, SQL_PARAMETER_CHUNK_SIZE):
+                deleted_user_names.extend(
+                    user_name for (user_name,) in
+                    self.db.session.execute(select(User.name).where(User.id.in_(user_ids_chunk)))
+                )
+            deleted_movie_ids = self._delete_users_and_orphaned_movies(unique_user_ids)
+            self.db.session.commit()
+            self.user_cache.invalidate(*unique_user_ids)
+            self.movie_cache.invalidate(*deleted_movie_ids)
+            self.title_index.invalidate()
+            return deleted_user_names
 
         except SQLAlchemyError as db_error:
             self.db.session.rollback()
-            raise ValueError(f"Error occurred while deleting user with ID {user_id}: {db_error}")
+            raise ValueError(f"Error occurred while deleting users: {db_error}")
+
+    def _delete_users_and_orphaned_movies(self, user_ids: list[int]) -> list[int]:
+        """Delete users, their links and movies left without links (uncommitted).
+
+        Collects the users' movie ids with one query, deletes the links and the
+        users with one statement each, then removes the orphaned movies with
+        DELETE ... WHERE id IN (...) AND NOT EXISTS (remaining link).
+
+        Args:
+            user_ids: The unique identifiers of the users to delete.
+
+        Returns:
+            list[int]: The ids of the users' movies, which may have been deleted.
+        """
+        candidate_movie_ids = []
+        for user_ids_chunk in _chunked(user_ids, SQL_PARAMETER_CHUNK_SIZE):
+            candidate_movie_ids.extend(
+                movie_id for (movie_id,) in self.db.session.execute(
+                    select(UserMovies.movie_id).where(UserMovies.user_id.in_(user_ids_chunk)).distinct()
+                )
+            )
+            self.db.session.execute(delete(UserMovies).where(UserMovies.user_id.in_(user_ids_chunk)))
+            self.db.session.execute(delete(User).where(User.id.in_(user_ids_chunk)))
+
+        for movie_ids_chunk in _chunked(sorted(set(candidate_movie_ids)), SQL_PARAMETER_CHUNK_SIZE):
+            self.db.session.execute(
+                delete(Movie).where(
+                    Movie.id.in_(movie_ids_chunk),
+                    ~exists().where(UserMovies.movie_id == Movie.id)
+                )
+            )
+        self._bump_data_versions(DataVersion.USERS, DataVersion.MOVIES,
+                                 *(DataVersion.user_scope(user_id) for user_id in user_ids))
+        return candidate_movie_ids
 
     def get_user_by_name(self, user_name: str) -> User:
         """Get a user by their name.
@@ -221,26 +656,36 @@ class SQLiteDataManager(DataManagerInterface):
         except SQLAlchemyError as db_error:
             raise SQLAlchemyError(f"Error fetching user by name: {db_error}") from db_error
 
-    def get_movie(self, movie_id: int) -> Movie:
-        """Get a movie object from the database by ID.
+    def get_movie(self, movie_id: int) -> MovieSnapshot:
+        """Get a movie by ID.
+
+        Served from the identity cache when possible; the result is an
+        immutable snapshot, not a session-bound Movie.
 
         Args:
             movie_id: The unique identifier of the movie.
 
         Returns:
-            Movie: The Movie object if found.
+            MovieSnapshot: The movie if found.
 
         Raises:
             ValueError: If movie with the given ID is not found.
         """
+        return self.movie_cache.get_or_load(movie_id, self._load_movie_snapshot)
+
+    def _load_movie_snapshot(self, movie_id: int) -> MovieSnapshot:
+        """Read a movie's columns into a snapshot (identity cache loader)."""
         try:
-            movie_obj = self.db.session.query(Movie).filter(Movie.id == movie_id).one_or_none()
-            if not movie_obj:
-                raise ValueError(f"No movie found with ID {movie_id}")
-            return movie_obj
+            movie_row = self.db.session.execute(
+                select(Movie.id, Movie.title, Movie.release_year, Movie.poster, Movie.director, Movie.rating)
+                .where(Movie.id == movie_id)
+            ).one_or_none()
         except SQLAlchemyError as db_error:
             # Re-raise as ValueError for consistency
             raise ValueError(f"No movie found with ID {movie_id}") from db_error
+        if movie_row is None:
+            raise ValueError(f"No movie found with ID {movie_id}")
+        return MovieSnapshot(*movie_row)
 
     def get_user_movie_rating(self, user_id: int, movie_id: int) -> float | None:
         """Get a user's rating for a specific movie.
@@ -265,15 +710,127 @@ class SQLiteDataManager(DataManagerInterface):
         except SQLAlchemyError as db_error:
             raise SQLAlchemyError(f"Error fetching user movie rating: {db_error}") from db_error
 
+    def find_movie_by_title(self, title: str, release_year: int | None = None) -> Movie | None:
+        """Look a title up in the local catalog.
+
+        Titles match ignoring case, whitespace and leading or trailing
+        articles. A trailing "(1999)" in the title is used as the year hint
+        when release_year is not given.
+
+        Args:
+            title: The title as entered by the user.
+            release_year: Optional release year the movie must have.
+
+        Returns:
+            Movie | None: The only matching movie, or None if there is no match
+                or the title is ambiguous (e.g. remakes without a year hint).
+        """
+        bare_title, year_hint = split_title_year(title)
+        release_year = release_year if release_year is not None else year_hint
+        query = select(Movie).where(Movie.normalized_title == normalize_catalog_title(bare_title))
+        if release_year is not None:
+            query = query.where(Movie.release_year == release_year)
+        matches = self.db.session.scalars(query.limit(2)).all()
+        return matches[0] if len(matches) == 1 else None
+
+    def _find_movies_by_titles(self, titles: list[str]) -> dict[str, Movie]:
+        """Resolve many titles against the local catalog with one query per chunk.
+
+        Args:
+            titles: The titles as entered by the user.
+
+        Returns:
+            dict[str, Movie]: The titles that matched exactly one movie.
+        """
+        lookups = {}
+        for title in titles:
+            bare_title, year_hint = split_title_year(title)
+            lookups[title] = (normalize_catalog_title(bare_title), year_hint)
+
+        candidates = {}
+        title_keys = list({title_key for title_key, _ in lookups.values()})
+        for title_keys_chunk in _chunked(title_keys, SQL_PARAMETER_CHUNK_SIZE):
+            for movie_obj in self.db.session.scalars(
+                select(Movie).where(Movie.normalized_title.in_(title_keys_chunk))
+            ):
+                candidates.setdefault(movie_obj.normalized_title, []).append(movie_obj)
+
+        resolved_movies = {}
+        for title, (title_key, year_hint) in lookups.items():
+            matches = [movie_obj for movie_obj in candidates.get(title_key, [])
+                       if year_hint is None or movie_obj.release_year == year_hint]
+            if len(matches) == 1:
+                resolved_movies[title] = matches[0]
+        return resolved_movies
+
+    def _link_movie(self, user_id: int, movie: Movie, imdb_rating_value) -> bool:
+        """Link a movie to a user unless already linked (uncommitted).
+
+        Returns:
+            bool: True if a new link was created.
+        """
+        new_link_id = self.db.session.execute(
+            sqlite_insert(UserMovies)
+            .values(user_id=user_id, movie_id=movie.id,
+                    user_rating=self._initial_user_rating(imdb_rating_value))
+            .on_conflict_do_nothing(index_elements=[UserMovies.user_id, UserMovies.movie_id])
+            .returning(UserMovies.id)
+        ).scalar_one_or_none()
+        return new_link_id is not None
+
+    @staticmethod
+    def _omdb_movie_values(omdb_movie_data: dict) -> dict:
+        """Map OMDb movie data onto Movie column values."""
+        return {
+            'title': omdb_movie_data.get('title'),
+            'release_year': omdb_movie_data.get('release_year', None),
+            'director': omdb_movie_data.get('director', None),
+            'rating': omdb_movie_data.get('rating', None),
+            'poster': omdb_movie_data.get('poster', None),
+        }
+
+    def _upsert_movie(self, movie_values: dict) -> Movie:
+        """Insert a movie, or refresh the metadata of the existing one (uncommitted).
+
+        Uses INSERT ... ON CONFLICT (title, release_year) DO UPDATE, so a
+        concurrent insert of the same movie cannot make the statement fail.
+        The conflict branch also makes RETURNING yield the existing row
+        (DO NOTHING would return no row). Movies without a release year
+        conflict on the partial index of titles WHERE release_year IS NULL
+        instead, since NULLs never conflict in the (title, release_year) index.
+
+        Args:
+            movie_values: Movie column values, as built by _omdb_movie_values.
+
+        Returns:
+            Movie: The inserted or updated movie.
+        """
+        movie_upsert = sqlite_insert(Movie).values(movie_values)
+        if movie_values.get('release_year') is None:
+            conflict_target = {'index_elements': [Movie.title], 'index_where': Movie.release_year.is_(None)}
+        else:
+            conflict_target = {'index_elements': [Movie.title, Movie.release_year]}
+        movie_upsert = movie_upsert.on_conflict_do_update(
+            **conflict_target,
+            set_={column: movie_upsert.excluded[column] for column in ('director', 'rating', 'poster')}
+        ).returning(Movie)
+        return self.db.session.scalars(movie_upsert, execution_options={'populate_existing': True}).one()
+
     def add_movie(self, user_id: int, title: str) -> dict:
         """Add a movie to a user's collection.
 
-        Fetches movie data from OMDb API and creates the movie if it doesn't exist.
-        Links the movie to the user with an initial rating.
+        Titles already in the local catalog are linked without calling OMDb
+        (see find_movie_by_title) unless always_refresh is set. Otherwise the
+        movie data is fetched from OMDb and the movie is upserted on
+        (title, release_year) with refreshed metadata. The movie and the link
+        are written with INSERT ... ON CONFLICT and committed together, so
+        concurrent adds of the same title cannot create duplicate movies.
+        The poster of a movie written from OMDb data is then fetched into the
+        local poster store in the background.
 
         Args:
             user_id: The unique identifier of the user.
-            title: The title of the movie to add.
+            title: The title of the movie to add, optionally ending in a "(1999)" year hint.
 
         Returns:
             dict: Dictionary with 'message' key ('added', 'linked', 'not_found') and 'movie' key.
@@ -281,72 +838,209 @@ class SQLiteDataManager(DataManagerInterface):
         Raises:
             ValueError: If movie cannot be added due to validation or database errors.
         """
+        try:
+            local_movie = None if self.always_refresh else self.find_movie_by_title(title)
+            if local_movie is not None:
+                link_created = self._link_movie(user_id, local_movie, local_movie.rating)
+                if link_created:
+                    self._bump_data_versions(DataVersion.user_scope(user_id))
+                self.db.session.commit()
+                return {"message": "added" if link_created else "linked", "movie": local_movie}
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while adding movie: {db_error}")
+
         # Fetch movie data from OMDb API
-        omdb_movie_data = fetch_movie_data(title)
+        # A "(1999)" year hint narrows the lookup to that release
+        omdb_movie_data = fetch_movie_data(*split_title_year(title))
         if not omdb_movie_data:
             return {"message": "not_found", "movie": None}
 
-        # Extract movie information from API response
-        movie_title_from_api = omdb_movie_data.get('title')
-        movie_director = omdb_movie_data.get('director', None)
         imdb_rating_value = omdb_movie_data.get('rating', None)
-        movie_poster_url = omdb_movie_data.get('poster', None)
-        movie_release_year = omdb_movie_data.get('release_year', None)
-
-        # Check if the movie already exists in the database
-        existing_movie = (
-            self.db.session.query(Movie)
-            .filter_by(title=movie_title_from_api, release_year=movie_release_year)
-            .first()
-        )
-        if not existing_movie:
-            # Create a new movie and add it to the database
-            new_movie = Movie(
-                title=movie_title_from_api,
-                release_year=movie_release_year,
-                director=movie_director,
-                rating=imdb_rating_value,
-                poster=movie_poster_url,
-            )
-            try:
-                self.db.session.add(new_movie)
-                self.db.session.commit()
-                existing_movie = new_movie
-            except SQLAlchemyError as db_error:
-                self.db.session.rollback()
-                raise ValueError(f"Error occurred while adding movie: {db_error}")
-
-        # Check if the movie is already linked to the user
-        existing_user_movie_link = (
-            self.db.session.query(UserMovies)
-            .filter_by(user_id=user_id, movie_id=existing_movie.id)
-            .first()
-        )
-        if existing_user_movie_link:
-            return {"message": "linked", "movie": existing_movie}
+        try:
+            movie = self._upsert_movie(self._omdb_movie_values(omdb_movie_data))
+            link_created = self._link_movie(user_id, movie, imdb_rating_value)
+            # The upsert may have refreshed catalog metadata shown in every collection
+            self._bump_data_versions(DataVersion.MOVIES, DataVersion.user_scope(user_id))
+            index_entry = (movie.id, movie.title, movie.release_year)
+            poster_url = movie.poster
+            self.db.session.commit()
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while adding movie: {db_error}")
+        self.movie_cache.invalidate(index_entry[0])
+        self.title_index.add(*index_entry)
+        # Warm the local poster copy so the first page showing the movie does not wait for it
+        poster_store.prefetch(poster_url)
+
+        return {"message": "added" if link_created else "linked", "movie": movie}
 
-        # Link the movie to the user with initial rating from the movie
-        # Convert rating to float if it's a string
-        initial_user_rating = imdb_rating_value
+    @staticmethod
+    def _initial_user_rating(imdb_rating_value) -> float | None:
+        """Convert an OMDb rating into the initial personal rating of a new link.
+
+        Args:
+            imdb_rating_value: The IMDB rating as returned by OMDb (usually a string).
+
+        Returns:
+            float | None: The rating as a float, or None if it is missing or not numeric.
+        """
         if isinstance(imdb_rating_value, str):
             try:
-                initial_user_rating = float(imdb_rating_value) if imdb_rating_value else None
+                return float(imdb_rating_value) if imdb_rating_value else None
             except (ValueError, TypeError):
-                initial_user_rating = None
-        
-        user_movie_link = UserMovies(
-            user_id=user_id, 
-            movie_id=existing_movie.id,
-            user_rating=initial_user_rating
+                return None
+        return imdb_rating_value
+
+    def add_movies(self, user_id: int, titles: list[str]) -> list[dict]:
+        """Add many movies to a user's collection in one transaction.
+
+        Resolves titles against the local catalog first and only looks the
+        rest up on OMDb, concurrently. Movies OMDb returns are written with the
+        same INSERT ... ON CONFLICT upsert as add_movie, and links with
+        ON CONFLICT DO NOTHING, all in one transaction. Concurrent adds of the
+        same movies therefore cannot make the batch fail.
+
+        Args:
+            user_id: The unique identifier of the user.
+            titles: The titles of the movies to add.
+
+        Returns:
+            list[dict]: One dictionary per input title, in input order, with 'title',
+                'message' ('added', 'linked', 'not_found') and 'movie' keys.
+
+        Raises:
+            ValueError: If the movies cannot be added due to database errors.
+        """
+        try:
+            local_movies = {} if self.always_refresh else self._find_movies_by_titles(titles)
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while adding movies: {db_error}")
+
+        # Titles with a year hint are looked up as (title, year), so "Dune (1984)" and "Dune (2021)" stay distinct
+        remote_lookups = {}
+        for title in titles:
+            if title not in local_movies:
+                bare_title, release_year = split_title_year(title)
+                remote_lookups[title] = bare_title if release_year is None else (bare_title, release_year)
+        omdb_results = fetch_movies_data(list(remote_lookups.values()))
+        omdb_results = {title: omdb_results.get(movie_lookup) for title, movie_lookup in remote_lookups.items()}
+
+        try:
+            batch_results = []
+            upserted_movies = {}
+            for title in titles:
+                if title in local_movies:
+                    batch_results.append({"title": title, "message": None, "movie": local_movies[title]})
+                    continue
+                omdb_movie_data = omdb_results.get(title)
+                if not omdb_movie_data:
+                    batch_results.append({"title": title, "message": "not_found", "movie": None})
+                    continue
+
+                movie_values = self._omdb_movie_values(omdb_movie_data)
+                movie_key = (movie_values['title'], str(movie_values['release_year']))
+                movie_obj = upserted_movies.get(movie_key)
+                if movie_obj is None:
+                    movie_obj = self._upsert_movie(movie_values)
+                    upserted_movies[movie_key] = movie_obj
+                batch_results.append({"title": title, "message": None, "movie": movie_obj})
+
+            linked_movie_ids = set()
+            for result in batch_results:
+                movie_obj = result["movie"]
+                if movie_obj is None:
+                    continue
+                if movie_obj.id in linked_movie_ids:
+                    result["message"] = "linked"
+                    continue
+                linked_movie_ids.add(movie_obj.id)
+                result["message"] = "added" if self._link_movie(user_id, movie_obj, movie_obj.rating) else "linked"
+
+            if upserted_movies:
+                # The upserts may have refreshed catalog metadata shown in every collection
+                self._bump_data_versions(DataVersion.MOVIES)
+            if any(result["message"] == "added" for result in batch_results):
+                self._bump_data_versions(DataVersion.user_scope(user_id))
+            # Read before commit, which expires the objects
+            index_entries = [(movie_obj.id, movie_obj.title, movie_obj.release_year)
+                             for movie_obj in upserted_movies.values()]
+            poster_urls = [movie_obj.poster for movie_obj in upserted_movies.values()]
+            self.db.session.commit()
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while adding movies: {db_error}")
+
+        self.movie_cache.invalidate(*(movie_id for movie_id, _, _ in index_entries))
+        for index_entry in index_entries:
+            self.title_index.add(*index_entry)
+        for poster_url in poster_urls:
+            poster_store.prefetch(poster_url)
+        return batch_results
+
+    def upsert_movies(self, movie_rows: list[dict]) -> dict:
+        """Insert or update catalog movies keyed by (title, release_year).
+
+        Rows are written with multi-row INSERT ... ON CONFLICT DO UPDATE
+        statements in a single transaction, so movies added concurrently by
+        add_movie or another import cannot make the chunk fail. Rows without
+        a release year conflict on the partial index of year-less titles.
+        Updates only overwrite columns for which the row carries a value.
+        When the same key appears more than once, the last row wins.
+
+        Args:
+            movie_rows: Dictionaries with 'title', 'release_year', 'poster',
+                'director' and 'rating' keys; 'rating' must not be None.
+
+        Returns:
+            dict: Counts of 'inserted' and 'updated' movies.
+
+        Raises:
+            ValueError: If the rows cannot be written.
+        """
+        rows_by_key = {(row['title'], row['release_year']): row for row in movie_rows}
+        if not rows_by_key:
+            return {'inserted': 0, 'updated': 0}
+
+        movie_table = Movie.__table__
+        conflict_targets = (
+            ([row for (_, release_year), row in rows_by_key.items() if release_year is not None],
+             {'index_elements': [movie_table.c.title, movie_table.c.release_year]}),
+            ([row for (_, release_year), row in rows_by_key.items() if release_year is None],
+             {'index_elements': [movie_table.c.title], 'index_where': movie_table.c.release_year.is_(None)}),
         )
         try:
-            self.db.session.add(user_movie_link)
+            # Bumping first takes SQLite's write lock, so no other writer can add
+            # movies before the upserts: returned IDs above max_id are inserts
+            self._bump_data_versions(DataVersion.MOVIES)
+            max_id = self.db.session.execute(select(func.max(movie_table.c.id))).scalar() or 0
+            written_ids = []
+            for target_rows, conflict_target in conflict_targets:
+                if not target_rows:
+                    continue
+                movie_upsert = sqlite_insert(movie_table)
+                movie_upsert = movie_upsert.on_conflict_do_update(
+                    **conflict_target,
+                    set_={column: func.coalesce(movie_upsert.excluded[column], movie_table.c[column])
+                          for column in UPSERT_UPDATE_COLUMNS}
+                ).returning(movie_table.c.id)
+                # executemany with RETURNING is batched into multi-row statements by SQLAlchemy
+                written_ids.extend(self.db.session.execute(
+                    movie_upsert, [{column: row.get(column) for column in UPSERT_COLUMNS} for row in target_rows]
+                ).scalars())
             self.db.session.commit()
         except SQLAlchemyError as db_error:
             self.db.session.rollback()
-            raise ValueError(f"Error occurred while linking movie to user: {db_error}")
+            raise ValueError(f"Error occurred while importing movies: {db_error}")
 
-        return {"message": "added", "movie": existing_movie}
+        updated_ids = [movie_id for movie_id in written_ids if movie_id <= max_id]
+        inserted_count = len(written_ids) - len(updated_ids)
+        self.movie_cache.invalidate(*updated_ids)
+        if inserted_count:
+            self.title_index.invalidate()
+
+        return {'inserted': inserted_count, 'updated': len(updated_ids)}
 
     def delete_movie(self, user_id: int, movie_id: int) -> Movie:
         """Delete a movie from a user's collection.
@@ -388,8 +1082,13 @@ class SQLiteDataManager(DataManagerInterface):
             # Delete the movie if no other user is associated
             if other_users_count == 0:
                 self.db.session.delete(movie_obj)
+                self._bump_data_versions(DataVersion.MOVIES)
+            self._bump_data_versions(DataVersion.user_scope(user_id))
 
             self.db.session.commit()
+            if other_users_count == 0:
+                self.movie_cache.invalidate(movie_id)
+                self.title_index.discard(movie_id)
             return movie_obj
 
         except SQLAlchemyError as db_error:
@@ -422,6 +1121,7 @@ class SQLiteDataManager(DataManagerInterface):
             # Update the user's rating in the linking table
             if rating is not None:
                 user_movie_link.user_rating = rating
+                self._bump_data_versions(DataVersion.user_scope(user_id))
 
             self.db.session.commit()
 
@@ -429,3 +1129,124 @@ class SQLiteDataManager(DataManagerInterface):
             logger.error(f"Error occurred while updating movie rating for user {user_id}: {db_error}", exc_info=True)
             self.db.session.rollback()
             raise ValueError(f"Error occurred while updating movie rating: {db_error}")
+
+    def create_job(self, kind: str, user_id: int, title: str, dedupe_key: str) -> tuple[Job, bool]:
+        """Enqueue a job unless an equivalent one is already queued or running.
+
+        Duplicates are detected atomically by the partial unique index on
+        active jobs' dedupe_key, so concurrent requests coalesce as well.
+
+        Args:
+            kind: The type of work, e.g. 'add_movie'.
+            user_id: The user the job acts for.
+            title: The movie title to process.
+            dedupe_key: Key identifying equivalent jobs.
+
+        Returns:
+            tuple[Job, bool]: The job, and whether it was newly created.
+
+        Raises:
+            ValueError: If the job cannot be stored.
+        """
+        active_job_query = select(Job).where(Job.dedupe_key == dedupe_key,
+                                             Job.status.in_(Job.ACTIVE_STATUSES))
+        active_job = self.db.session.scalars(active_job_query).first()
+        if active_job:
+            return active_job, False
+
+        job = Job(kind=kind, user_id=user_id, title=title, dedupe_key=dedupe_key, status=Job.QUEUED)
+        try:
+            self.db.session.add(job)
+            self.db.session.commit()
+            return job, True
+        except IntegrityError:
+            # Another request enqueued the same job between our SELECT and INSERT
+            self.db.session.rollback()
+            active_job = self.db.session.scalars(active_job_query).first()
+            if active_job:
+                return active_job, False
+            raise ValueError(f"Error occurred while enqueuing job for '{title}'")
+        except SQLAlchemyError as db_error:
+            self.db.session.rollback()
+            raise ValueError(f"Error occurred while enqueuing job: {db_error}")
+
+    def get_job(self, job_id: int) -> Job:
+        """Fetch a job by ID.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Returns:
+            Job: The Job object.
+
+        Raises:
+            ValueError: If no job with the given ID exists.
+        """
+        job = self.db.session.get(Job, job_id)
+        if job is None:
+            raise ValueError(f"No job found with ID {job_id}")
+        return job
+
+    def claim_job(self, job_id: int) -> bool:
+        """Atomically move a queued job to 'running'.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Returns:
+            bool: True if this caller claimed the job, False if it was not queued
+                (already claimed by another worker, finished or deleted).
+        """
+        claim_result = self.db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == Job.QUEUED)
+            .values(status=Job.RUNNING, attempts=Job.attempts + 1, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.session.commit()
+        return claim_result.rowcount == 1
+
+    def finish_job(self, job_id: int, status: str, result_message: str | None = None,
+                   movie_id: int | None = None, error: str | None = None) -> None:
+        """Record the outcome of a running job.
+
+        Args:
+            job_id: The unique identifier of the job.
+            status: Job.SUCCEEDED or Job.FAILED.
+            result_message: The outcome reported by the data manager.
+            movie_id: The movie the job resolved to, if any.
+            error: The error message of a failed job.
+        """
+        self.db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == Job.RUNNING)
+            .values(status=status, result_message=result_message, movie_id=movie_id,
+                    error=error, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.session.commit()
+
+    def requeue_stale_jobs(self, stale_after_seconds: float) -> list[int]:
+        """Requeue jobs abandoned by a stopped worker and list all queued jobs.
+
+        Jobs stay 'running' if the process died mid-job; they are queued again
+        once they have not been updated for stale_after_seconds.
+
+        Args:
+            stale_after_seconds: Age after which a running job is considered abandoned.
+
+        Returns:
+            list[int]: IDs of queued jobs, oldest first.
+        """
+        self.db.session.execute(
+            update(Job)
+            .where(Job.status == Job.RUNNING,
+                   Job.updated_at < func.datetime('now', f'-{int(stale_after_seconds)} seconds'))
+            .values(status=Job.QUEUED, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.session.commit()
+        return list(self.db.session.scalars(
+            select(Job.id).where(Job.status == Job.QUEUED).order_by(Job.id)
+        ))
+
@@ -0,0 +1,195 @@
+import os
+import time
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+from datamanager.titles import normalize_catalog_title
+from services.cache import normalize_title
+
+# Seconds after which the index is reloaded, picking up writes made by other processes
+SUGGEST_INDEX_TTL = float(os.getenv("SUGGEST_INDEX_TTL", "300"))
+
+# Number of suggestions returned by default and at most
+DEFAULT_SUGGESTIONS = 10
+MAX_SUGGESTIONS = 25
+
+
+class Suggestion(NamedTuple):
+    """A catalog title offered for a typed prefix."""
+    movie_id: int
+    title: str
+    release_year: int | None
+
+
+def _title_keys(title: str) -> set[str]:
+    """Return the keys a title is found under: as written and without its article.
+
+    "The Matrix" is indexed as "the matrix" and "matrix", so both "the ma"
+    and "ma" suggest it.
+    """
+    return {normalize_title(title), normalize_catalog_title(title)}
+
+
+class TitleIndex:
+    """In-memory prefix index over catalog titles.
+
+    Keys are kept in a sorted list, so a prefix lookup is one bisect plus a
+    scan over the matching run. Single movies are added or removed in place
+    as the catalog changes; bulk writes call invalidate() and the index is
+    reloaded on the next lookup. The index is also reloaded every ttl
+    seconds, because writes made by other processes do not reach it.
+
+    Attributes:
+        ttl: Seconds after which the index is considered stale.
+    """
+
+    def __init__(self, ttl: float = SUGGEST_INDEX_TTL):
+        """Initialize an empty, unloaded index.
+
+        Args:
+            ttl: Seconds after which the index is considered stale.
+        """
+        self.ttl = ttl
+        self._keys = []
+        self._key_movie_ids = []
+        self._movies = {}
+        self._loaded_at = None
+        self._has_data = False
+        self._version = 0
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._movies)
+
+    def is_stale(self) -> bool:
+        """Return whether the index must be (re)loaded before it is trusted."""
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next refresh_if_stale() reloads it."""
+        with self._lock:
+            self._version += 1
+            self._loaded_at = None
+
+    def clear(self) -> None:
+        """Drop all entries and mark the index as never loaded."""
+        with self._lock:
+            self._keys, self._key_movie_ids, self._movies = [], [], {}
+            self._version += 1
+            self._loaded_at = None
+            self._has_data = False
+
+    def load(self, movies) -> None:
+        """Replace the index contents.
+
+        Args:
+            movies: Iterable of (movie_id, title, release_year) tuples.
+        """
+        with self._lock:
+            version_at_start = self._version
+        entries = []
+        indexed_movies = {}
+        for movie_id, title, release_year in movies:
+            indexed_movies[movie_id] = Suggestion(movie_id, title, release_year)
+            entries.extend((title_key, movie_id) for title_key in _title_keys(title))
+        entries.sort()
+
+        with self._lock:
+            self._keys = [title_key for title_key, _ in entries]
+            self._key_movie_ids = [movie_id for _, movie_id in entries]
+            self._movies = indexed_movies
+            self._has_data = True
+            # Changes made while loading may be missing from the snapshot; reload next time
+            self._loaded_at = time.monotonic() if self._version == version_at_start else None
+
+    def refresh_if_stale(self, load_movies) -> None:
+        """Reload the index when it is stale.
+
+        Only one thread reloads at a time. Other threads keep answering from
+        the previous contents, except before the first load, when they wait.
+
+        Args:
+            load_movies: Callable returning an iterable of (movie_id, title, release_year).
+        """
+        if not self.is_stale():
+            return
+        if not self._load_lock.acquire(blocking=not self._has_data):
+            return
+        try:
+            if self.is_stale():
+                self.load(load_movies())
+        finally:
+            self._load_lock.release()
+
+    def add(self, movie_id: int, title: str, release_year: int | None) -> None:
+        """Index a movie, replacing any previous entry for the same ID.
+
+        Args:
+            movie_id: The unique identifier of the movie.
+            title: The movie title.
+            release_year: The release year, or None.
+        """
+        with self._lock:
+            self._version += 1
+            self._discard_locked(movie_id)
+            self._movies[movie_id] = Suggestion(movie_id, title, release_year)
+            for title_key in _title_keys(title):
+                position = bisect_left(self._keys, title_key)
+                # Equal keys stay ordered by movie id, like after a full load
+                while (position < len(self._keys) and self._keys[position] == title_key
+                       and self._key_movie_ids[position] < movie_id):
+                    position += 1
+                self._keys.insert(position, title_key)
+                self._key_movie_ids.insert(position, movie_id)
+
+    def discard(self, movie_id: int) -> None:
+        """Remove a movie from the index if present.
+
+        Args:
+            movie_id: The unique identifier of the movie.
+        """
+        with self._lock:
+            self._version += 1
+            self._discard_locked(movie_id)
+
+    def _discard_locked(self, movie_id: int) -> None:
+        """Remove a movie's keys; the caller holds the lock."""
+        suggestion = self._movies.pop(movie_id, None)
+        if suggestion is None:
+            return
+        for title_key in _title_keys(suggestion.title):
+            position = bisect_left(self._keys, title_key)
+            while position < len(self._keys) and self._keys[position] == title_key:
+                if self._key_movie_ids[position] == movie_id:
+                    del self._keys[position]
+                    del self._key_movie_ids[position]
+                    break
+                position += 1
+
+    def suggest(self, prefix: str, limit: int = DEFAULT_SUGGESTIONS) -> list[Suggestion]:
+        """Return movies whose title, with or without its article, starts with prefix.
+
+        Args:
+            prefix: The text typed so far.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            list[Suggestion]: Matching movies in alphabetical key order.
+        """
+        prefix_key = normalize_title(prefix)
+        if not prefix_key:
+            return []
+        suggestions = []
+        seen_movie_ids = set()
+        with self._lock:
+            position = bisect_left(self._keys, prefix_key)
+            while (position < len(self._keys) and len(suggestions) < limit
+                   and self._keys[position].startswith(prefix_key)):
+                movie_id = self._key_movie_ids[position]
+                if movie_id not in seen_movie_ids:
+                    seen_movie_ids.add(movie_id)
+                    suggestions.append(self._movies[movie_id])
+                position += 1
+        return suggestions
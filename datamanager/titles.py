@@ -0,0 +1,41 @@
+import re
+
+from services.cache import normalize_title
+
+# Leading and trailing (", The") English articles ignored when matching titles
+_LEADING_ARTICLE = re.compile(r'^(?:the|an|a)\s+(?=\S)')
+_TRAILING_ARTICLE = re.compile(r',\s*(?:the|an|a)$')
+# A trailing "(1999)" year hint, as in "Inception (2010)"
+_YEAR_HINT = re.compile(r'^(?P<title>.*\S)\s*\((?P<year>\d{4})\)$')
+
+
+def normalize_catalog_title(title: str) -> str:
+    """Return the key used to match a title against the local catalog.
+
+    Matching ignores case, repeated whitespace and a leading or trailing
+    article, so "The Matrix", "the  matrix" and "Matrix, The" share a key.
+
+    Args:
+        title: The movie title.
+
+    Returns:
+        str: The normalized title.
+    """
+    normalized = normalize_title(title)
+    normalized = _TRAILING_ARTICLE.sub('', normalized)
+    return _LEADING_ARTICLE.sub('', normalized)
+
+
+def split_title_year(title: str) -> tuple[str, int | None]:
+    """Split an optional trailing year hint off a title.
+
+    Args:
+        title: The title as entered, e.g. "Dune (2021)".
+
+    Returns:
+        tuple[str, int | None]: The title without the hint, and the year or None.
+    """
+    match = _YEAR_HINT.match(title.strip())
+    if not match:
+        return title.strip(), None
+    return match.group('title'), int(match.group('year'))
@@ -0,0 +1,98 @@
+"""Gunicorn settings for serving the app in production.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting can be overridden with the GUNICORN_* environment variables
+below. `kill -HUP <master pid>` replaces the workers gracefully; because the
+app is preloaded in the master, code changes need a restart (or USR2 + QUIT
+for a zero-downtime binary upgrade).
+"""
+import os
+import glob
+
+
+def _cpu_count() -> int:
+    """Return the CPUs this process may run on (respects container CPU sets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting, treating an empty value as unset."""
+    value = os.getenv(name, '').strip()
+    return int(value) if value else default
+
+
+CPU_COUNT = _cpu_count()
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Processes scale CPU-bound work (template rendering, JSON) across cores; threads
+# cover requests waiting on OMDb, Gemini or SQLite locks inside each process
+workers = _env_int('GUNICORN_WORKERS', CPU_COUNT * 2 + 1)
+threads = _env_int('GUNICORN_THREADS', 4)
+worker_class = 'gthread'
+
+# Import the app once in the master; workers share its memory pages copy-on-write
+preload_app = True
+
+timeout = _env_int('GUNICORN_TIMEOUT', 60)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+# Recycle workers periodically so slow leaks cannot accumulate; jitter avoids simultaneous restarts
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 2000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 200)
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG') or None
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+# Workers share /metrics through snapshot files; this must be set before the app is imported
+os.environ.setdefault('METRICS_DIR', '/tmp/movieweb-metrics')
+# Threads do not survive fork(): the job queue is started in each worker, never in the master
+os.environ['JOB_QUEUE_AUTOSTART'] = 'false'
+
+
+def on_starting(server):
+    """Remove metric snapshots left by a previous server run."""
+    for snapshot_path in glob.glob(os.path.join(os.environ['METRICS_DIR'], '*.json')):
+        os.unlink(snapshot_path)
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections and start its job queue.
+
+    Connections opened by the master while preloading must not be shared
+    between processes. The master never starts the job queue (see
+    JOB_QUEUE_AUTOSTART above); each worker starts its own pool, which also
+    resumes pending jobs.
+    """
+    from extensions import db
+    from services.job_queue import job_queue
+    from wsgi import app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            # close=False leaves the master's connections alone and drops them from this pool
+            engine.dispose(close=False)
+    job_queue.start()
+
+
+def worker_exit(server, worker):
+    """Write a final metrics snapshot so the worker's counters outlive it."""
+    from services.metrics import registry
+
+    registry.write_snapshot()
+
+
+def child_exit(server, worker):
+    """Fold the exited worker's metrics snapshot into the aggregate of exited workers.
+
+    Runs in the master, one worker at a time, so recycling workers under
+    max_requests leaves one aggregate file instead of a file per pid.
+    """
+    from services.metrics import registry
+
+    registry.retire_process(worker.pid)
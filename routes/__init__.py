@@ -3,6 +3,8 @@ from .movie import movie_bp
 from .user import user_bp
 from .errors import errors_bp
 from .api import api_bp
+from .posters import posters_bp
+from .metrics import metrics_bp
 
 def register_blueprints(app):
     """Register all Flask blueprints with the application.
@@ -14,4 +16,6 @@ def register_blueprints(app):
     app.register_blueprint(movie_bp)
     app.register_blueprint(user_bp)
     app.register_blueprint(errors_bp)
-    app.register_blueprint(api_bp)
\ No newline at end of file
+    app.register_blueprint(api_bp)
+    app.register_blueprint(posters_bp)
+    app.register_blueprint(metrics_bp)
\ No newline at end of file
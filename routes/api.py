@@ -1,35 +1,166 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context, url_for
 from werkzeug.exceptions import BadRequest
 from sqlalchemy.exc import SQLAlchemyError
 import sqlalchemy
 
 from datamanager import data_manager as data
+from datamanager.data_models import DataVersion
+from datamanager.suggest import DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS
+from datamanager.titles import normalize_catalog_title
 from services.gemini_api import get_similar_movies
+from services.omdb_api import search_movie_titles
+from services.export import EXPORT_FORMATS, export_chunks
+from services.http_cache import CacheValidators, apply_validators, is_not_modified, validators_for
+from services.job_queue import job_queue, is_async_requested
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Maximum number of titles accepted by one batch import request
+MAX_BATCH_TITLES = 500
+
+# Columns written by the export endpoints, in output order
+MOVIE_EXPORT_FIELDS = ['id', 'title', 'release_year', 'poster', 'director', 'rating']
+USER_MOVIE_EXPORT_FIELDS = MOVIE_EXPORT_FIELDS + ['user_rating']
+
+
+def _export_response(rows, fieldnames: list[str], filename: str) -> Response:
+    """Stream rows as an attachment in the format given by the ?format= argument.
+
+    Raises:
+        ValueError: If the requested format is not supported.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    chunks = export_chunks(rows, export_format, fieldnames)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename={filename}.{export_format}'}
+    )
+
+
+def _cache_validators(*scopes: str) -> CacheValidators:
+    """Read the validators of a response built from the given data scopes.
+
+    Called before the response's own queries, so a write committed in between
+    can only make the response newer than its validators, never older.
+    """
+    return validators_for(data.get_data_versions(scopes))
+
+
+def _not_modified_response(validators: CacheValidators) -> Response:
+    """Build a 304 Not Modified response carrying the current validators."""
+    return apply_validators(Response(status=304), validators)
+
+
+def _serialize_job(job) -> dict:
+    """Convert a Job object into a JSON-serializable dictionary."""
+    return {
+        'id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'user_id': job.user_id,
+        'title': job.title,
+        'result': job.result_message,
+        'movie_id': job.movie_id,
+        'error': job.error,
+        'attempts': job.attempts,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'updated_at': job.updated_at.isoformat() if job.updated_at else None
+    }
+
+
+def _serialize_movie(movie) -> dict:
+    """Convert a Movie object into a JSON-serializable dictionary."""
+    return {
+        'id': movie.id,
+        'title': movie.title,
+        'release_year': movie.release_year,
+        'director': movie.director,
+        'rating': movie.rating,
+        'poster': movie.poster
+    }
+
 
 @api_bp.route('/users', methods=['GET'])
 def list_users():
-    """List all users in the system.
+    """List one page of users in the system.
+
+    Query Parameters:
+        limit: Number of users per page.
+        cursor: The next_cursor of the previous page.
 
     Returns:
-        Response: JSON response with list of users and count, or error message.
+        Response: JSON response with the page of users, count and next_cursor, 304 if the
+            client's ETag/Last-Modified is current, or error message.
     """
     try:
-        users = data.get_all_users()
+        validators = _cache_validators(DataVersion.USERS)
+        if is_not_modified(request, validators):
+            return _not_modified_response(validators)
+        users_page = data.get_users_page(limit=request.args.get('limit', type=int),
+                                         cursor=request.args.get('cursor'))
         users_list = [
             {
                 'id': user.id,
                 'name': user.name
             }
-            for user in users
+            for user in users_page.items
         ]
-        return jsonify({
+        return apply_validators(jsonify({
             'success': True,
             'users': users_list,
-            'count': len(users_list)
-        }), 200
+            'count': len(users_list),
+            'next_cursor': users_page.next_cursor
+        }), validators), 200
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 400
+    except Exception as unexpected_error:
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
+@api_bp.route('/movies', methods=['GET'])
+def list_movies():
+    """List one page of movies in the database.
+
+    Query Parameters:
+        limit: Number of movies per page.
+        cursor: The next_cursor of the previous page.
+        sort: Sort key ('id', 'title', 'year' or 'rating').
+        order: 'asc' or 'desc'.
+
+    Returns:
+        Response: JSON response with the page of movies, count and next_cursor, 304 if the
+            client's ETag/Last-Modified is current, or error message.
+    """
+    try:
+        order = request.args.get('order', 'asc')
+        if order not in ('asc', 'desc'):
+            raise ValueError("Invalid order. Use 'asc' or 'desc'")
+        validators = _cache_validators(DataVersion.MOVIES)
+        if is_not_modified(request, validators):
+            return _not_modified_response(validators)
+        movies_page = data.get_movies_page(limit=request.args.get('limit', type=int),
+                                           cursor=request.args.get('cursor'),
+                                           sort=request.args.get('sort', 'id'),
+                                           descending=order == 'desc')
+        movies_list = [_serialize_movie(movie) for movie in movies_page.items]
+        return apply_validators(jsonify({
+            'success': True,
+            'movies': movies_list,
+            'count': len(movies_list),
+            'next_cursor': movies_page.next_cursor
+        }), validators), 200
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 400
     except Exception as unexpected_error:
         return jsonify({
             'success': False,
@@ -39,28 +170,38 @@ def list_users():
 
 @api_bp.route('/users/<int:user_id>/movies', methods=['GET'])
 def get_user_movies(user_id):
-    """List a user's favorite movies (movie collection).
+    """List one page of a user's favorite movies (movie collection).
+
+    Query Parameters:
+        limit: Number of movies per page.
+        cursor: The next_cursor of the previous page.
 
     Args:
         user_id: The unique identifier of the user.
 
     Returns:
-        Response: JSON response with user's movies and count, or error message.
+        Response: JSON response with the page of the user's movies, count and next_cursor,
+            304 if the client's ETag/Last-Modified is current, or error message.
     """
     try:
-        # Verify user exists
-        user = data.get_user(user_id)
-        
-        # Get user's movies
-        movies = data.get_user_movies(user_id)
-        
-        return jsonify({
+        # The collection changes with the user's links and name, and with catalog metadata
+        validators = _cache_validators(DataVersion.user_scope(user_id), DataVersion.MOVIES)
+        if is_not_modified(request, validators):
+            return _not_modified_response(validators)
+
+        # The user and the page of movies come from one query
+        user_page = data.get_user_with_movies(user_id, limit=request.args.get('limit', type=int),
+                                              cursor=request.args.get('cursor'))
+        movies = [movie._asdict() for movie in user_page.movies]
+
+        return apply_validators(jsonify({
             'success': True,
             'user_id': user_id,
-            'user_name': user.name,
+            'user_name': user_page.user.name,
             'movies': movies,
-            'count': len(movies)
-        }), 200
+            'count': len(movies),
+            'next_cursor': user_page.next_cursor
+        }), validators), 200
     except ValueError as value_error:
         return jsonify({
             'success': False,
@@ -73,6 +214,59 @@ def get_user_movies(user_id):
         }), 500
 
 
+@api_bp.route('/users/<int:user_id>/movies/export', methods=['GET'])
+def export_user_movies(user_id):
+    """Stream a user's movie collection as NDJSON or CSV.
+
+    Args:
+        user_id: The unique identifier of the user.
+
+    Query Parameters:
+        format: 'ndjson' (default) or 'csv'.
+
+    Returns:
+        Response: Streamed export of the user's movies and ratings, or error message.
+    """
+    try:
+        data.get_user(user_id)
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 404
+
+    try:
+        return _export_response(data.iter_user_movies(user_id), USER_MOVIE_EXPORT_FIELDS,
+                                f'user_{user_id}_movies')
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 400
+
+
+@api_bp.route('/export/movies', methods=['GET'])
+def export_movies():
+    """Stream the whole movie catalog as NDJSON or CSV.
+
+    Rows are read from the database in batches while the response is being
+    sent, so memory use does not grow with the size of the catalog.
+
+    Query Parameters:
+        format: 'ndjson' (default) or 'csv'.
+
+    Returns:
+        Response: Streamed export of all movies, or error message.
+    """
+    try:
+        return _export_response(data.iter_movies(), MOVIE_EXPORT_FIELDS, 'movies')
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 400
+
+
 @api_bp.route('/users/<int:user_id>/movies', methods=['POST'])
 def add_user_movie(user_id):
     """Add a new favorite movie to a user's collection.
@@ -115,6 +309,17 @@ def add_user_movie(user_id):
                 'error': 'Title is required'
             }), 400
         
+        if is_async_requested(request.args.get('async'), current_app.config['ADD_MOVIE_ASYNC']):
+            job, created = job_queue.enqueue_add_movie(user_id, movie_title)
+            status_url = url_for('api.get_job', job_id=job.id)
+            return jsonify({
+                'success': True,
+                'message': (f"Movie '{movie_title}' queued" if created
+                            else f"Movie '{movie_title}' is already being added"),
+                'job': _serialize_job(job),
+                'status_url': status_url
+            }), 202, {'Location': status_url}
+
         # Add movie using existing data manager method
         add_movie_result = data.add_movie(user_id, movie_title)
         
@@ -135,14 +340,7 @@ def add_user_movie(user_id):
             return jsonify({
                 'success': True,
                 'message': f"Movie '{movie_title}' added successfully",
-                'movie': {
-                    'id': added_movie.id,
-                    'title': added_movie.title,
-                    'release_year': added_movie.release_year,
-                    'director': added_movie.director,
-                    'rating': added_movie.rating,
-                    'poster': added_movie.poster
-                }
+                'movie': _serialize_movie(added_movie)
             }), 201
         
         return jsonify({
@@ -173,6 +371,228 @@ def add_user_movie(user_id):
         }), 500
 
 
+@api_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id):
+    """Report the status of a background job, such as an asynchronous add-movie request.
+
+    Args:
+        job_id: The unique identifier of the job.
+
+    Returns:
+        Response: JSON response with the job status and result, or error message.
+    """
+    try:
+        job = data.get_job(job_id)
+        job_data = _serialize_job(job)
+        if job.movie_id is not None:
+            try:
+                job_data['movie'] = _serialize_movie(data.get_movie(job.movie_id))
+            except ValueError:
+                # The movie was removed after the job finished
+                job_data['movie'] = None
+        return jsonify({
+            'success': True,
+            'job': job_data
+        }), 200
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 404
+    except Exception as unexpected_error:
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
+@api_bp.route('/users/<int:user_id>/movies/batch', methods=['POST'])
+def add_user_movies_batch(user_id):
+    """Add many movies to a user's collection in one request.
+
+    Titles are resolved through OMDb concurrently and all new movies and
+    links are stored in a single transaction.
+
+    Args:
+        user_id: The unique identifier of the user.
+
+    Request Body:
+        JSON with 'titles' field containing a list of movie titles.
+
+    Returns:
+        Response: JSON response with a per-title status report, or error message.
+    """
+    try:
+        # Verify user exists
+        data.get_user(user_id)
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 404
+
+    try:
+        json_request_data = request.get_json(silent=True)
+        if json_request_data is None:
+            return jsonify({
+                'success': False,
+                'error': 'Request body must be valid JSON'
+            }), 400
+
+        movie_titles = json_request_data.get('titles') if isinstance(json_request_data, dict) else None
+        if not isinstance(movie_titles, list) or not movie_titles:
+            return jsonify({
+                'success': False,
+                'error': 'Titles must be a non-empty list'
+            }), 400
+
+        if len(movie_titles) > MAX_BATCH_TITLES:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_TITLES} titles can be imported per request'
+            }), 400
+
+        if not all(isinstance(title, str) and title.strip() for title in movie_titles):
+            return jsonify({
+                'success': False,
+                'error': 'Every title must be a non-empty string'
+            }), 400
+
+        batch_results = data.add_movies(user_id, [title.strip() for title in movie_titles])
+
+        status_counts = {'added': 0, 'linked': 0, 'not_found': 0}
+        results_list = []
+        for result in batch_results:
+            status_counts[result['message']] += 1
+            results_list.append({
+                'title': result['title'],
+                'status': result['message'],
+                'movie': _serialize_movie(result['movie']) if result['movie'] else None
+            })
+
+        return jsonify({
+            'success': True,
+            'user_id': user_id,
+            'results': results_list,
+            'counts': status_counts
+        }), 200
+
+    except Exception as unexpected_error:
+        # add_movies raises ValueError when the batch cannot be written
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
+@api_bp.route('/diagnostics/database', methods=['GET'])
+def database_diagnostics():
+    """Report the active SQLite PRAGMA values and connection pool status.
+
+    Returns:
+        Response: JSON response with configured and active pragmas, or error message.
+    """
+    try:
+        diagnostics = data.get_database_diagnostics()
+        return jsonify({
+            'success': True,
+            **diagnostics
+        }), 200
+    except Exception as unexpected_error:
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
+@api_bp.route('/movies/suggest', methods=['GET'])
+def suggest_movies():
+    """Suggest movie titles for the add-movie form as the user types.
+
+    Catalog titles come from the in-memory title index. With ?omdb=1, slots
+    the catalog cannot fill are filled with (cached) OMDb title search
+    results that are not already in the catalog.
+
+    Query Parameters:
+        prefix: The beginning of a title.
+        limit: Maximum number of suggestions (default 10, max 25).
+        omdb: '1' to merge in OMDb search results.
+
+    Returns:
+        Response: JSON response with suggestions (movie_id, title, release_year, source), or error message.
+    """
+    try:
+        prefix = request.args.get('prefix', '').strip()
+        limit = max(1, min(request.args.get('limit', DEFAULT_SUGGESTIONS, type=int), MAX_SUGGESTIONS))
+        suggestions = [
+            {'movie_id': suggestion.movie_id, 'title': suggestion.title,
+             'release_year': suggestion.release_year, 'source': 'catalog'}
+            for suggestion in data.suggest_titles(prefix, limit)
+        ] if prefix else []
+
+        if prefix and len(suggestions) < limit and request.args.get('omdb', '').lower() in ('1', 'true', 'yes'):
+            seen_movies = {(normalize_catalog_title(suggestion['title']), suggestion['release_year'])
+                           for suggestion in suggestions}
+            for search_result in search_movie_titles(prefix):
+                year_text = str(search_result['release_year'])[:4]
+                release_year = int(year_text) if year_text.isdigit() else None
+                movie_key = (normalize_catalog_title(search_result['title']), release_year)
+                if movie_key in seen_movies:
+                    continue
+                seen_movies.add(movie_key)
+                suggestions.append({'movie_id': None, 'title': search_result['title'],
+                                    'release_year': release_year, 'source': 'omdb'})
+                if len(suggestions) >= limit:
+                    break
+
+        return jsonify({
+            'success': True,
+            'prefix': prefix,
+            'suggestions': suggestions
+        }), 200
+    except Exception as unexpected_error:
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
+@api_bp.route('/movies/search', methods=['GET'])
+def search_movies():
+    """Full-text search the movie catalog by title and director.
+
+    Query Parameters:
+        q: The search words; each word matches as a prefix.
+        limit: Number of movies per page.
+        cursor: The next_cursor of the previous page.
+
+    Returns:
+        Response: JSON response with the best-matching movies, count and next_cursor, or error message.
+    """
+    try:
+        search_text = request.args.get('q', '').strip()
+        movies_page = data.search_movies(search_text, limit=request.args.get('limit', type=int),
+                                         cursor=request.args.get('cursor'))
+        movies_list = [_serialize_movie(movie) for movie in movies_page.items]
+        return jsonify({
+            'success': True,
+            'query': search_text,
+            'movies': movies_list,
+            'count': len(movies_list),
+            'next_cursor': movies_page.next_cursor
+        }), 200
+    except ValueError as value_error:
+        return jsonify({
+            'success': False,
+            'error': str(value_error)
+        }), 400
+    except Exception as unexpected_error:
+        return jsonify({
+            'success': False,
+            'error': str(unexpected_error)
+        }), 500
+
+
 @api_bp.route('/movies/recommendations', methods=['GET'])
 def get_movie_recommendations():
     """Get AI-powered movie recommendations based on a movie title.
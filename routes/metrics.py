@@ -0,0 +1,105 @@
+import time
+
+from flask import Blueprint, Response, g, has_app_context, request
+from sqlalchemy import event
+
+from extensions import db
+from services import metrics
+from services.metrics import registry, CONTENT_TYPE
+from services.omdb_api import omdb_cache, omdb_search_cache
+from services.gemini_api import recommendation_cache
+from services.fragment_cache import fragment_cache
+from datamanager import data_manager
+
+metrics_bp = Blueprint('metrics', __name__)
+
+# Endpoint label of requests that matched no route (keeps label values bounded)
+UNMATCHED_ENDPOINT = 'unmatched'
+
+
+def _collect_cache_counters():
+    """Read the hit and miss counters of the application's caches."""
+    for cache_name, cache in (('omdb', omdb_cache), ('omdb_search', omdb_search_cache),
+                              ('gemini', recommendation_cache), ('user_identity', data_manager.user_cache),
+                              ('movie_identity', data_manager.movie_cache)):
+        cache_stats = cache.stats()
+        yield metrics.cache_hits_total, (cache_name,), cache_stats['hits']
+        yield metrics.cache_misses_total, (cache_name,), cache_stats['misses']
+    yield metrics.cache_hits_total, ('fragment',), fragment_cache.hits
+    yield metrics.cache_misses_total, ('fragment',), fragment_cache.renders
+
+
+def _add_cache_hit_ratios(samples: dict) -> None:
+    """Derive each cache's hit ratio from the merged hit and miss counters."""
+    for (name, labelvalues), hits in list(samples.items()):
+        if name != metrics.cache_hits_total.name:
+            continue
+        lookups = hits + samples.get((metrics.cache_misses_total.name, labelvalues), 0)
+        samples[(metrics.cache_hit_ratio.name, labelvalues)] = hits / lookups if lookups else 0.0
+
+
+def _collect_pool_status():
+    """Read the status of the current application's connection pool."""
+    if not has_app_context():
+        return
+    pool = db.engine.pool
+    if hasattr(pool, 'checkedout'):
+        yield metrics.db_pool_checked_out, (), pool.checkedout()
+    if hasattr(pool, 'size'):
+        yield metrics.db_pool_size, (), pool.size()
+    if hasattr(pool, 'overflow'):
+        yield metrics.db_pool_overflow, (), max(0, pool.overflow())
+
+
+registry.register_collector(_collect_cache_counters)
+registry.register_collector(_collect_pool_status)
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    """Count a connection checkout (SQLAlchemy pool event)."""
+    metrics.db_pool_checkouts_total.inc()
+
+
+@metrics_bp.record_once
+def _instrument_database(state):
+    """Count connection checkouts of the application's engine."""
+    with state.app.app_context():
+        event.listen(db.engine, 'checkout', _count_checkout)
+
+
+@metrics_bp.before_app_request
+def _start_request_metrics():
+    """Count the request as in progress and start its latency timer."""
+    g.metrics_started_at = time.perf_counter()
+    metrics.http_requests_in_progress.inc()
+
+
+@metrics_bp.after_app_request
+def _record_request_metrics(response):
+    """Record the request's latency and outcome by endpoint."""
+    started_at = g.get('metrics_started_at')
+    if started_at is not None:
+        endpoint = request.endpoint or UNMATCHED_ENDPOINT
+        metrics.http_request_duration_seconds.observe(time.perf_counter() - started_at, endpoint, request.method)
+        metrics.http_requests_total.inc(endpoint, request.method, str(response.status_code))
+    registry.maybe_write_snapshot()
+    return response
+
+
+@metrics_bp.teardown_app_request
+def _finish_request_metrics(error=None):
+    """Stop counting the request as in progress, even if it failed."""
+    if g.pop('metrics_started_at', None) is not None:
+        metrics.http_requests_in_progress.dec()
+
+
+@metrics_bp.route('/metrics')
+def metrics_endpoint():
+    """Expose the metrics of all worker processes in the Prometheus text format.
+
+    Returns:
+        Response: The exposition text.
+    """
+    samples = registry.collect()
+    _add_cache_hit_ratios(samples)
+    return Response(registry.render(samples), content_type=CONTENT_TYPE)
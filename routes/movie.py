@@ -1,24 +1,60 @@
 import sqlalchemy
-from flask import Blueprint, render_template, jsonify, request, redirect, url_for
+from flask import Blueprint, current_app, render_template, jsonify, request, redirect, url_for
+from markupsafe import Markup
 from sqlalchemy.exc import SQLAlchemyError
 
 from datamanager import data_manager as data
+from datamanager.data_models import DataVersion
+from services.fragment_cache import fragment_cache
+from services.http_cache import version_token
+from services.job_queue import job_queue, is_async_requested
 
 movie_bp = Blueprint('movie', __name__)
 
 
 @movie_bp.route('/movies')
 def show_movies():
-    """Display all movies in the database.
+    """Display one page of movies in the database, or of search results.
+
+    Query Parameters:
+        q: Optional search words; results are ranked by relevance.
+        limit: Number of movies per page.
+        cursor: Cursor of the page to display, from the previous page's next link.
+        sort: Sort key ('id', 'title', 'year' or 'rating'), ignored when searching.
+        order: 'asc' or 'desc'.
 
     Returns:
-        Response: Rendered movies template with list of all movies, or error response.
+        Response: Rendered movies template with the page of movies, or error response.
     """
+    search_text = request.args.get('q', '').strip()
+    sort = request.args.get('sort', 'id')
+    order = 'desc' if request.args.get('order') == 'desc' else 'asc'
+    limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor')
+
+    def render_movie_cards() -> dict:
+        if search_text:
+            movies_page = data.search_movies(search_text, limit=limit, cursor=cursor)
+        else:
+            movies_page = data.get_movies_page(limit=limit, cursor=cursor, sort=sort, descending=order == 'desc')
+        return {
+            'html': render_template('partials/movie_cards.html', movies=movies_page.items, q=search_text or None),
+            'next_cursor': movies_page.next_cursor
+        }
+
     try:
-        movies = data.get_all_movies()
-        return render_template('movies.html', movies=movies)
+        # The catalog version is part of the key, so catalog writes invalidate the cards
+        catalog_version = version_token(data.get_data_versions([DataVersion.MOVIES]))
+        fragment = fragment_cache.get_or_render(
+            f"movie_cards:{catalog_version}:{search_text}|{sort}|{order}|{limit}|{cursor}", render_movie_cards
+        )
+    except ValueError as value_error:
+        return jsonify({'error': str(value_error)}), 400
     except Exception as unexpected_error:
         return jsonify({'error': str(unexpected_error)}), 404
+    return render_template('movies.html', movie_cards=Markup(fragment['html']),
+                           next_cursor=fragment['next_cursor'],
+                           sort=sort, order=order, limit=limit, q=search_text or None)
 
 
 @movie_bp.route('/users/<int:user_id>/add_movie', methods=['GET', 'POST'])
@@ -47,6 +83,13 @@ def add_movie(user_id):
                                    message="Title is required.")
 
         try:
+            if is_async_requested(request.args.get('async'), current_app.config['ADD_MOVIE_ASYNC']):
+                job, created = job_queue.enqueue_add_movie(user_id, title)
+                queued_message = (f"Movie '{title}' is being added in the background (job #{job.id})."
+                                  if created else f"Movie '{title}' is already being added (job #{job.id}).")
+                return render_template('add_movie.html', user=user, user_id=user_id,
+                                       message=queued_message), 202
+
             # Attempt to add the movie
             result = data.add_movie(user_id, title)
 
@@ -0,0 +1,83 @@
+import os
+
+from flask import Blueprint, abort, current_app, request, send_file, url_for
+
+from datamanager import data_manager as data
+from services.posters import (poster_store, is_poster_url, poster_version,
+                              POSTER_WIDTHS, POSTER_MAX_AGE, POSTER_PLACEHOLDER_MAX_AGE)
+
+posters_bp = Blueprint('posters', __name__)
+
+PLACEHOLDER_FILENAME = os.path.join('images', 'poster-placeholder.svg')
+
+
+@posters_bp.app_template_global()
+def poster_src(movie_id: int, poster_url: str | None, width: int | None = None) -> str:
+    """Return the /posters link of a movie, versioned by its poster URL.
+
+    Args:
+        movie_id: The unique identifier of the movie.
+        poster_url: The movie's remote poster URL ("N/A" or None if it has none).
+        width: Desired image width in pixels, or None for the original.
+
+    Returns:
+        str: The URL to use as an <img> source.
+    """
+    query_args = {}
+    if is_poster_url(poster_url):
+        query_args['v'] = poster_version(poster_url)
+    if width is not None:
+        query_args['w'] = width
+    return url_for('posters.poster', movie_id=movie_id, **query_args)
+
+
+@posters_bp.app_template_global()
+def poster_srcset(movie_id: int, poster_url: str | None) -> str:
+    """Return an <img> srcset listing the poster at every thumbnail width.
+
+    Args:
+        movie_id: The unique identifier of the movie.
+        poster_url: The movie's remote poster URL ("N/A" or None if it has none).
+
+    Returns:
+        str: Comma-separated "<url> <width>w" candidates.
+    """
+    return ', '.join(f"{poster_src(movie_id, poster_url, width)} {width}w" for width in POSTER_WIDTHS)
+
+
+@posters_bp.route('/posters/<int:movie_id>')
+def poster(movie_id):
+    """Serve a movie's poster from the local poster store.
+
+    The remote poster is fetched on first use. Links carrying the current
+    version (?v=, see poster_src) are cached by browsers as immutable; a
+    placeholder image is served, briefly cached, when the movie has no
+    poster or it cannot be fetched.
+
+    Args:
+        movie_id: The unique identifier of the movie.
+
+    Query parameters:
+        v: Poster version from poster_src.
+        w: Desired width in pixels, rounded up to a thumbnail width.
+
+    Returns:
+        Response: The image, or 404 if the movie does not exist.
+    """
+    try:
+        movie = data.get_movie(movie_id)
+    except ValueError:
+        abort(404)
+    poster_url = movie.poster
+
+    poster_file = poster_store.get_poster(poster_url, request.args.get('w', type=int))
+    if poster_file is None:
+        return send_file(os.path.join(current_app.static_folder, PLACEHOLDER_FILENAME),
+                         mimetype='image/svg+xml', max_age=POSTER_PLACEHOLDER_MAX_AGE)
+
+    is_current_version = request.args.get('v') == poster_version(poster_url)
+    response = send_file(poster_file.path, mimetype=poster_file.mimetype, conditional=True,
+                         max_age=POSTER_MAX_AGE if is_current_version else POSTER_PLACEHOLDER_MAX_AGE)
+    if is_current_version:
+        response.cache_control.immutable = True
+    return response
@@ -1,5 +1,6 @@
 import sqlalchemy
 from flask import Blueprint, render_template, jsonify, request, redirect, url_for
+from markupsafe import Markup
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -14,21 +15,31 @@ def _validate_username(name: str) -> str | None:
     return None
 
 from datamanager import data_manager as data
+from datamanager.data_models import DataVersion
+from datamanager.snapshots import UserSnapshot
+from services.fragment_cache import fragment_cache
+from services.http_cache import version_token
 
 user_bp = Blueprint('user', __name__)
 
 
 @user_bp.route('/users')
 def show_users():
-    """Display all users in the system.
+    """Display one page of users in the system.
+
+    Query Parameters:
+        limit: Number of users per page.
+        cursor: Cursor of the page to display, from the previous page's next link.
 
     Returns:
-        Response: Rendered users template with list of users.
+        Response: Rendered users template with the page of users.
     """
+    limit = request.args.get('limit', type=int)
     try:
-        users = data.get_all_users()
-        message = "No users found." if not users else None
-        return render_template('users.html', users=users, message=message)
+        users_page = data.get_users_page(limit=limit, cursor=request.args.get('cursor'))
+        message = "No users found." if not users_page.items else None
+        return render_template('users.html', users=users_page.items, message=message,
+                               next_cursor=users_page.next_cursor, limit=limit)
     except Exception as unexpected_error:
         return render_template("users.html", users=[], message=str(unexpected_error))
 
@@ -74,7 +85,11 @@ def add_user():
 
 @user_bp.route('/users/<int:user_id>', methods=['GET'])
 def user_movies(user_id):
-    """Display all movies associated with a specific user.
+    """Display one page of the movies associated with a specific user.
+
+    Query Parameters:
+        limit: Number of movies per page.
+        cursor: Cursor of the page to display, from the previous page's next link.
 
     Args:
         user_id: The unique identifier of the user.
@@ -82,18 +97,32 @@ def user_movies(user_id):
     Returns:
         Response: Rendered user_movies template with user's movie collection.
     """
-    try:
-        # Fetch user details
-        user = data.get_user(user_id)
-
-        # Fetch user movies
-        movies = data.get_user_movies(user_id)
-        if not movies:
-            return render_template('user_movies.html',
-                                   user=user, movies=None)
+    limit = request.args.get('limit', type=int)
+    cursor = request.args.get('cursor')
+
+    def render_movie_cards() -> dict:
+        # The user and the page of movies come from one query
+        user_page = data.get_user_with_movies(user_id, limit=limit, cursor=cursor)
+        return {
+            'html': render_template('partials/user_movie_cards.html',
+                                    user=user_page.user, movies=user_page.movies),
+            'next_cursor': user_page.next_cursor,
+            'user_name': user_page.user.name
+        }
 
+    try:
+        # The cards show the user's links and name and catalog metadata; their
+        # versions are part of the key, so writes to any of them invalidate it
+        collection_version = version_token(
+            data.get_data_versions([DataVersion.user_scope(user_id), DataVersion.MOVIES])
+        )
+        fragment = fragment_cache.get_or_render(
+            f"user_movie_cards:{user_id}:{collection_version}:{limit}|{cursor}", render_movie_cards
+        )
         return render_template('user_movies.html',
-                               user=user, movies=movies)
+                               user=UserSnapshot(user_id, fragment['user_name']),
+                               movie_cards=Markup(fragment['html']),
+                               next_cursor=fragment['next_cursor'], limit=limit)
 
     except ValueError as value_error:
         return render_template("user_movies.html",
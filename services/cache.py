@@ -0,0 +1,588 @@
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# Sentinel returned on a cache miss, so that None can be cached as a real value
+MISSING = object()
+
+_TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def normalize_title(movie_title: str) -> str:
+    """Normalize a movie title into a cache key.
+
+    Lookups are case-insensitive and ignore surrounding and repeated whitespace,
+    so "The Matrix", "the  matrix" and " THE MATRIX " share one cache entry.
+
+    Args:
+        movie_title: The title as entered by the user.
+
+    Returns:
+        str: The normalized title.
+    """
+    return " ".join(movie_title.split()).casefold()
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Attributes:
+        max_size: Maximum number of entries kept before the least recently used is evicted.
+        ttl: Default time-to-live of an entry, in seconds.
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that found no live entry.
+        evictions: Number of entries dropped to stay within max_size.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries; 0 disables the cache.
+            ttl: Default time-to-live of an entry, in seconds.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=MISSING):
+        """Return the live value for a key and mark it as recently used.
+
+        Args:
+            key: The cache key.
+            default: Value returned when there is no live entry.
+
+        Returns:
+            The cached value, or default on a miss.
+        """
+        value, _ = self.get_with_expiry(key)
+        return default if value is MISSING else value
+
+    def get_with_expiry(self, key) -> tuple:
+        """Return the live value for a key together with its expiry time.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            tuple: (value, expires_at) where expires_at is a time.monotonic() timestamp,
+                or (MISSING, None) on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cache_entry = self._entries.get(key)
+            if cache_entry is None:
+                self.misses += 1
+                return MISSING, None
+            expires_at, value = cache_entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return MISSING, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value, expires_at
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """Store a value, evicting the least recently used entries if needed.
+
+        Args:
+            key: The cache key.
+            value: The value to store (may be None).
+            ttl: Time-to-live in seconds; defaults to the cache TTL.
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        """Remove a key from the cache if present.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return the cache counters.
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SQLiteCacheStore:
+    """Persistent key/value cache stored in a table of a standalone SQLite file.
+
+    Values are serialized as JSON. Expired rows are ignored on read and purged
+    periodically on write, and the table is trimmed to max_entries by expiry time.
+    Database errors are logged and treated as cache misses, so a broken cache file
+    never breaks the caller.
+
+    Attributes:
+        path: Path to the SQLite cache file.
+        table: Name of the table holding the entries.
+        max_entries: Maximum number of rows kept in the table.
+    """
+
+    PRUNE_EVERY = 100  # Writes between two expiry/size prunes
+
+    def __init__(self, path: str, table: str = 'cache_entries', max_entries: int = 100000):
+        """Open (and create if needed) the cache file and table.
+
+        Args:
+            path: Path to the SQLite cache file.
+            table: Name of the table holding the entries.
+            max_entries: Maximum number of rows kept in the table.
+
+        Raises:
+            ValueError: If table is not a valid SQL identifier.
+        """
+        if not _TABLE_NAME_PATTERN.match(table):
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes_since_prune = 0
+
+        cache_directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(cache_directory, exist_ok=True)
+        connection = self._connect()
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_expires_at ON {table} (expires_at)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the calling thread's connection to the cache file."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get_with_expiry(self, key: str) -> tuple:
+        """Return the live value for a key together with its expiry time.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            tuple: (value, expires_at) where expires_at is a time.time() timestamp,
+                or (MISSING, None) on a miss or database error.
+        """
+        try:
+            cache_row = self._connect().execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as cache_error:
+            logger.warning(f"Cache read failed for '{key}' in {self.path}: {cache_error}")
+            return MISSING, None
+        if cache_row is None or cache_row[1] <= time.time():
+            return MISSING, None
+        return json.loads(cache_row[0]), cache_row[1]
+
+    def get(self, key: str, default=MISSING):
+        """Return the live value for a key.
+
+        Args:
+            key: The cache key.
+            default: Value returned when there is no live entry.
+
+        Returns:
+            The cached value, or default on a miss.
+        """
+        value, _ = self.get_with_expiry(key)
+        return default if value is MISSING else value
+
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store a JSON-serializable value.
+
+        Args:
+            key: The cache key.
+            value: The value to store (may be None).
+            ttl: Time-to-live in seconds.
+        """
+        try:
+            connection = self._connect()
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + ttl)
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_EVERY:
+                self._writes_since_prune = 0
+                self.prune()
+        except sqlite3.Error as cache_error:
+            logger.warning(f"Cache write failed for '{key}' in {self.path}: {cache_error}")
+
+    def prune(self) -> None:
+        """Delete expired rows and trim the table down to max_entries."""
+        connection = self._connect()
+        connection.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        connection.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the store if present.
+
+        Args:
+            key: The cache key.
+        """
+        try:
+            self._connect().execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        except sqlite3.Error as cache_error:
+            logger.warning(f"Cache delete failed for '{key}' in {self.path}: {cache_error}")
+
+    def clear(self) -> None:
+        """Remove all entries from the store."""
+        try:
+            self._connect().execute(f"DELETE FROM {self.table}")
+        except sqlite3.Error as cache_error:
+            logger.warning(f"Cache clear failed for {self.path}: {cache_error}")
+
+
+class FileCacheStore:
+    """Persistent key/value cache with one JSON file per entry in a directory.
+
+    File names are hashes of the keys. Entries are written to a temporary
+    file and renamed into place, so readers in any process see either the
+    old or the new value. A file's modification time is set to its expiry
+    time; expired files are ignored on read and the directory is pruned to
+    max_entries periodically on write. OS errors are logged and treated as
+    cache misses.
+
+    Attributes:
+        directory: Directory holding the entry files.
+        max_entries: Maximum number of files kept.
+    """
+
+    PRUNE_EVERY = 100  # Writes between two expiry/size prunes
+
+    def __init__(self, directory: str, max_entries: int = 10000):
+        """Create the cache directory if needed.
+
+        Args:
+            directory: Directory holding the entry files.
+            max_entries: Maximum number of files kept.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes_since_prune = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Return the file path of a key."""
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def get_with_expiry(self, key: str) -> tuple:
+        """Return the live value for a key together with its expiry time.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            tuple: (value, expires_at) where expires_at is a time.time() timestamp,
+                or (MISSING, None) on a miss or read error.
+        """
+        entry_path = self._path(key)
+        try:
+            expires_at = os.stat(entry_path).st_mtime
+            if expires_at <= time.time():
+                return MISSING, None
+            with open(entry_path, encoding='utf-8') as entry_file:
+                return json.load(entry_file), expires_at
+        except FileNotFoundError:
+            return MISSING, None
+        except (OSError, ValueError) as cache_error:
+            logger.warning(f"Cache read failed for '{key}' in {self.directory}: {cache_error}")
+            return MISSING, None
+
+    def get(self, key: str, default=MISSING):
+        """Return the live value for a key.
+
+        Args:
+            key: The cache key.
+            default: Value returned when there is no live entry.
+
+        Returns:
+            The cached value, or default on a miss.
+        """
+        value, _ = self.get_with_expiry(key)
+        return default if value is MISSING else value
+
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store a JSON-serializable value.
+
+        Args:
+            key: The cache key.
+            value: The value to store (may be None).
+            ttl: Time-to-live in seconds.
+        """
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'w', encoding='utf-8') as entry_file:
+                    json.dump(value, entry_file)
+                expires_at = time.time() + ttl
+                os.utime(temporary_path, (expires_at, expires_at))
+                os.replace(temporary_path, self._path(key))
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_EVERY:
+                self._writes_since_prune = 0
+                self.prune()
+        except OSError as cache_error:
+            logger.warning(f"Cache write failed for '{key}' in {self.directory}: {cache_error}")
+
+    def _entry_files(self) -> list[tuple[float, str]]:
+        """Return (expires_at, path) of every entry file."""
+        entry_files = []
+        with os.scandir(self.directory) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.name.endswith('.json'):
+                    try:
+                        entry_files.append((directory_entry.stat().st_mtime, directory_entry.path))
+                    except FileNotFoundError:
+                        continue
+        return entry_files
+
+    def prune(self) -> None:
+        """Delete expired files and trim the directory down to max_entries."""
+        now = time.time()
+        entry_files = sorted(self._entry_files(), reverse=True)
+        for index, (expires_at, entry_path) in enumerate(entry_files):
+            if index >= self.max_entries or expires_at <= now:
+                try:
+                    os.unlink(entry_path)
+                except FileNotFoundError:
+                    pass
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the store if present.
+
+        Args:
+            key: The cache key.
+        """
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as cache_error:
+            logger.warning(f"Cache delete failed for '{key}' in {self.directory}: {cache_error}")
+
+    def clear(self) -> None:
+        """Remove all entries from the store."""
+        try:
+            for _, entry_path in self._entry_files():
+                try:
+                    os.unlink(entry_path)
+                except FileNotFoundError:
+                    pass
+        except OSError as cache_error:
+            logger.warning(f"Cache clear failed for {self.directory}: {cache_error}")
+
+
+class TieredCache:
+    """In-process LRU in front of an optional persistent SQLite store.
+
+    Lookups try memory first, then the store; store hits are promoted into
+    memory for the rest of their lifetime. Writes go to both tiers.
+
+    Attributes:
+        memory: The in-process TTLCache tier.
+        store: The SQLiteCacheStore tier, or None for memory-only caching.
+        misses: Number of lookups that missed both tiers.
+        store_hits: Number of lookups answered by the persistent store.
+    """
+
+    def __init__(self, memory: TTLCache, store: SQLiteCacheStore = None):
+        """Initialize the tiered cache.
+
+        Args:
+            memory: The in-process TTLCache tier.
+            store: Optional SQLiteCacheStore tier.
+        """
+        self.memory = memory
+        self.store = store
+        self.misses = 0
+        self.store_hits = 0
+
+    def get(self, key: str, default=MISSING):
+        """Return the live value for a key from the fastest tier holding it.
+
+        Args:
+            key: The cache key.
+            default: Value returned when no tier has a live entry.
+
+        Returns:
+            The cached value, or default on a miss.
+        """
+        value = self.memory.get(key)
+        if value is not MISSING:
+            return value
+        if self.store is not None:
+            value, expires_at = self.store.get_with_expiry(key)
+            if value is not MISSING:
+                self.store_hits += 1
+                self.memory.set(key, value, ttl=expires_at - time.time())
+                return value
+        self.misses += 1
+        return default
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        """Store a value in every tier.
+
+        Args:
+            key: The cache key.
+            value: The value to store (may be None; must be JSON-serializable with a store).
+            ttl: Time-to-live in seconds; defaults to the memory tier TTL.
+        """
+        ttl = self.memory.ttl if ttl is None else ttl
+        self.memory.set(key, value, ttl=ttl)
+        if self.store is not None:
+            self.store.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from every tier.
+
+        Args:
+            key: The cache key.
+        """
+        self.memory.delete(key)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self) -> None:
+        """Remove all entries from every tier and reset the counters."""
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+        self.misses = 0
+        self.store_hits = 0
+
+    def stats(self) -> dict:
+        """Return combined hit/miss counters for both tiers.
+
+        Returns:
+            dict: hits, misses, hit_ratio, store_hits, persistent and the memory tier stats.
+        """
+        hits = self.memory.hits + self.store_hits
+        lookups = hits + self.misses
+        return {
+            'hits': hits,
+            'misses': self.misses,
+            'hit_ratio': hits / lookups if lookups else 0.0,
+            'store_hits': self.store_hits,
+            'persistent': self.store is not None,
+            'memory': self.memory.stats(),
+        }
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function, *args):
+        """Run function(*args) unless a call for key is already running.
+
+        Args:
+            key: Identifies calls that may share a result.
+            function: The function to run.
+            *args: Arguments passed to function.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+            future.set_result(result)
+            return result
+        except BaseException as call_error:
+            future.set_exception(call_error)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self, key) -> bool:
+        """Return whether a call for key is currently running.
+
+        Args:
+            key: The call key.
+
+        Returns:
+            bool: True if a call is in flight.
+        """
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,84 @@
+import io
+import csv
+import json
+
+# Supported export formats mapped to their response MIME types
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+# Rows serialized into one chunk of the streamed response
+EXPORT_CHUNK_ROWS = 500
+
+
+def _chunks(lines, chunk_rows: int):
+    """Join consecutive lines into chunks of at most chunk_rows lines."""
+    buffered_lines = []
+    for line in lines:
+        buffered_lines.append(line)
+        if len(buffered_lines) >= chunk_rows:
+            yield ''.join(buffered_lines)
+            buffered_lines.clear()
+    if buffered_lines:
+        yield ''.join(buffered_lines)
+
+
+def ndjson_chunks(rows, chunk_rows: int = EXPORT_CHUNK_ROWS):
+    """Serialize rows as newline-delimited JSON, one object per line.
+
+    Args:
+        rows: Iterable of dictionaries.
+        chunk_rows: Number of rows joined into each yielded chunk.
+
+    Yields:
+        str: A chunk of NDJSON text.
+    """
+    return _chunks((json.dumps(row, ensure_ascii=False) + '\n' for row in rows), chunk_rows)
+
+
+def csv_chunks(rows, fieldnames: list[str], chunk_rows: int = EXPORT_CHUNK_ROWS):
+    """Serialize rows as CSV with a header line.
+
+    Args:
+        rows: Iterable of dictionaries keyed by fieldnames.
+        fieldnames: The column names, in output order.
+        chunk_rows: Number of rows written into each yielded chunk.
+
+    Yields:
+        str: A chunk of CSV text; the first chunk starts with the header.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+
+    def csv_lines():
+        yield buffer.getvalue()
+        for row in rows:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(row)
+            yield buffer.getvalue()
+
+    return _chunks(csv_lines(), chunk_rows)
+
+
+def export_chunks(rows, export_format: str, fieldnames: list[str]):
+    """Serialize rows in the requested export format.
+
+    Args:
+        rows: Iterable of dictionaries keyed by fieldnames.
+        export_format: One of EXPORT_FORMATS.
+        fieldnames: The column names, in output order (used for CSV).
+
+    Returns:
+        Iterator[str]: The serialized chunks.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if export_format == 'ndjson':
+        return ndjson_chunks(rows)
+    if export_format == 'csv':
+        return csv_chunks(rows, fieldnames)
+    raise ValueError(f"Invalid format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}")
@@ -0,0 +1,132 @@
+import os
+import logging
+
+from services.cache import MISSING, TTLCache, FileCacheStore
+
+# Where rendered fragments are kept: 'memory' (per process), 'filesystem' (shared) or 'none'
+FRAGMENT_CACHE_BACKEND = os.getenv("FRAGMENT_CACHE_BACKEND", "memory")
+FRAGMENT_CACHE_TTL = int(os.getenv("FRAGMENT_CACHE_TTL", "3600"))
+# Entries kept by the memory backend and files kept by the filesystem backend
+FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", "512"))
+FRAGMENT_CACHE_DIR = os.getenv(
+    "FRAGMENT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'fragment_cache')
+)
+
+FRAGMENT_CACHE_BACKENDS = ('memory', 'filesystem', 'none')
+
+logger = logging.getLogger(__name__)
+
+
+def create_fragment_backend(backend_name: str, directory: str = FRAGMENT_CACHE_DIR,
+                            size: int = FRAGMENT_CACHE_SIZE, ttl: float = FRAGMENT_CACHE_TTL):
+    """Create the store behind the fragment cache.
+
+    Args:
+        backend_name: One of FRAGMENT_CACHE_BACKENDS.
+        directory: Directory of the filesystem backend.
+        size: Maximum number of entries kept.
+        ttl: Default time-to-live of an entry, in seconds.
+
+    Returns:
+        TTLCache | FileCacheStore | None: The store, or None to disable caching.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend_name == 'memory':
+        return TTLCache(max_size=size, ttl=ttl)
+    if backend_name == 'filesystem':
+        return FileCacheStore(directory, max_entries=size)
+    if backend_name == 'none':
+        return None
+    raise ValueError(f"Invalid fragment cache backend '{backend_name}'. "
+                     f"Use one of: {', '.join(FRAGMENT_CACHE_BACKENDS)}")
+
+
+class FragmentCache:
+    """Cache of rendered page fragments.
+
+    Callers put the versions of the data a fragment shows into its key (see
+    DataVersion), so writes through the data manager invalidate fragments by
+    bumping those versions, in every process. Superseded entries are never
+    read again and age out of the backend.
+
+    Attributes:
+        backend: The TTLCache or FileCacheStore holding fragments, or None when disabled.
+        ttl: Time-to-live of a fragment, in seconds.
+        hits: Number of fragments served from the cache.
+        renders: Number of fragments rendered.
+    """
+
+    def __init__(self, ttl: float = FRAGMENT_CACHE_TTL):
+        """Initialize a disabled cache; init_app selects the backend.
+
+        Args:
+            ttl: Time-to-live of a fragment, in seconds.
+        """
+        self.backend = None
+        self.ttl = ttl
+        self.hits = 0
+        self.renders = 0
+
+    def init_app(self, app):
+        """Select the backend from the FRAGMENT_CACHE_* configuration.
+
+        Args:
+            app: The Flask application instance.
+
+        Raises:
+            ValueError: If FRAGMENT_CACHE_BACKEND is unknown.
+        """
+        self.backend = create_fragment_backend(
+            app.config.setdefault('FRAGMENT_CACHE_BACKEND', FRAGMENT_CACHE_BACKEND),
+            directory=app.config.setdefault('FRAGMENT_CACHE_DIR', FRAGMENT_CACHE_DIR),
+            ttl=self.ttl
+        )
+
+    def get_or_render(self, key: str, render):
+        """Return the cached fragment for key, rendering and storing it on a miss.
+
+        Args:
+            key: Identifies the fragment, including the versions of its data.
+            render: Callable returning the fragment; it must be JSON-serializable
+                for the filesystem backend. Exceptions propagate and nothing is cached.
+
+        Returns:
+            The fragment.
+        """
+        if self.backend is not None:
+            fragment = self.backend.get(key)
+            if fragment is not MISSING:
+                self.hits += 1
+                return fragment
+        fragment = render()
+        self.renders += 1
+        if self.backend is not None:
+            self.backend.set(key, fragment, ttl=self.ttl)
+        return fragment
+
+    def clear(self) -> None:
+        """Remove all fragments and reset the counters."""
+        if self.backend is not None:
+            self.backend.clear()
+        self.hits = 0
+        self.renders = 0
+
+    def stats(self) -> dict:
+        """Return the cache counters.
+
+        Returns:
+            dict: backend, hits, renders and hit_ratio.
+        """
+        lookups = self.hits + self.renders
+        return {
+            'backend': type(self.backend).__name__ if self.backend is not None else None,
+            'hits': self.hits,
+            'renders': self.renders,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+
+fragment_cache = FragmentCache()
@@ -1,7 +1,14 @@
 import os
+import time
 import logging
 import json
 import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from services.cache import MISSING, TTLCache, SQLiteCacheStore, TieredCache, SingleFlight, normalize_title
+from services.instrumentation import timed_external
+from services.metrics import external_call_duration_seconds, external_call_errors_total
 
 try:
     import google.generativeai as genai
@@ -13,16 +20,55 @@ except ImportError:
 # Get the API key from environment variables
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Use Gemini model - gemini-flash-latest is free tier compatible
+# gemini-2.0-flash has limit 0 for free tier, so we use the "latest" variant
+# Available models can be checked with: genai.list_models()
+GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-flash-latest")
+
+# Recommendation cache settings (in seconds). Entries are fresh for GEMINI_CACHE_TTL,
+# then served stale for up to GEMINI_CACHE_STALE_TTL more while a background refresh
+# runs. GEMINI_CACHE_PATH enables the on-disk tier that survives restarts.
+GEMINI_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", "86400"))
+GEMINI_CACHE_STALE_TTL = int(os.getenv("GEMINI_CACHE_STALE_TTL", "604800"))
+GEMINI_CACHE_SIZE = int(os.getenv("GEMINI_CACHE_SIZE", "1024"))
+GEMINI_CACHE_PATH = os.getenv("GEMINI_CACHE_PATH")
+GEMINI_CACHE_MAX_ENTRIES = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", "50000"))
+# Seconds a failed call (quota or rate limit, unusable answer) keeps further calls for that title from being made
+GEMINI_CACHE_NEGATIVE_TTL = int(os.getenv("GEMINI_CACHE_NEGATIVE_TTL", "60"))
+
 logger = logging.getLogger(__name__)
 
 if GEMINI_AVAILABLE and GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+recommendation_cache = TieredCache(
+    TTLCache(max_size=GEMINI_CACHE_SIZE, ttl=GEMINI_CACHE_TTL + GEMINI_CACHE_STALE_TTL),
+    SQLiteCacheStore(GEMINI_CACHE_PATH, table='gemini_recommendations',
+                     max_entries=GEMINI_CACHE_MAX_ENTRIES) if GEMINI_CACHE_PATH else None
+)
+
+# Titles whose last call failed; kept in memory only, so a restart retries them
+recommendation_failures = TTLCache(max_size=GEMINI_CACHE_SIZE, ttl=GEMINI_CACHE_NEGATIVE_TTL)
+
+# Concurrent requests for the same title share one upstream call
+_recommendation_flights = SingleFlight()
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gemini-refresh')
+
+
+@lru_cache(maxsize=1)
+def _get_model(model_name: str = GEMINI_MODEL_NAME):
+    """Return the shared GenerativeModel instance, creating it on first use."""
+    return genai.GenerativeModel(model_name)
+
 
 def get_similar_movies(movie_title: str) -> list[str] | None:
     """Get AI-powered movie recommendations based on a movie title.
 
     Uses Google Gemini API to generate similar movie recommendations.
+    Results are cached by normalized title. A stale cached answer is returned
+    immediately while a background refresh fetches a new one, and concurrent
+    misses for the same title share a single Gemini call. After a failed call
+    the title is not sent to Gemini again for GEMINI_CACHE_NEGATIVE_TTL seconds.
 
     Args:
         movie_title: The title of the movie to find similar movies for.
@@ -41,7 +87,72 @@ def get_similar_movies(movie_title: str) -> list[str] | None:
     if not movie_title or not movie_title.strip():
         logger.warning("Empty movie title provided")
         return None
-    
+
+    cache_key = normalize_title(movie_title)
+    cached_entry = recommendation_cache.get(cache_key)
+    if cached_entry is not MISSING:
+        if time.time() - cached_entry['fetched_at'] >= GEMINI_CACHE_TTL:
+            _schedule_refresh(cache_key, movie_title)
+        return list(cached_entry['movies'])
+
+    if recommendation_failures.get(cache_key) is not MISSING:
+        logger.debug(f"Not asking Gemini for '{movie_title}' again after a recent failure")
+        return None
+    return _load_recommendations(cache_key, movie_title)
+
+
+def _load_recommendations(cache_key: str, movie_title: str) -> list[str] | None:
+    """Fetch recommendations through the single-flight group and cache them.
+
+    Args:
+        cache_key: The normalized title.
+        movie_title: The title to get recommendations for.
+
+    Returns:
+        list[str] | None: A copy of the recommendations, or None if the call failed.
+    """
+    recommendations_list = _recommendation_flights.do(cache_key, _fetch_and_cache, cache_key, movie_title)
+    return list(recommendations_list) if recommendations_list else recommendations_list
+
+
+def _fetch_and_cache(cache_key: str, movie_title: str) -> list[str] | None:
+    """Call Gemini and cache the answer, or remember the failure for GEMINI_CACHE_NEGATIVE_TTL seconds."""
+    recommendations_list = _fetch_similar_movies(movie_title)
+    if recommendations_list:
+        recommendation_cache.set(cache_key, {'movies': recommendations_list, 'fetched_at': time.time()})
+        recommendation_failures.delete(cache_key)
+    else:
+        recommendation_failures.set(cache_key, True, ttl=GEMINI_CACHE_NEGATIVE_TTL)
+    return recommendations_list
+
+
+def _schedule_refresh(cache_key: str, movie_title: str):
+    """Refresh a stale cache entry in the background unless a refresh is running or recently failed.
+
+    Args:
+        cache_key: The normalized title.
+        movie_title: The title to get recommendations for.
+
+    Returns:
+        Future | None: The scheduled refresh, or None if one was already in flight
+            or the last call for this title failed less than GEMINI_CACHE_NEGATIVE_TTL seconds ago.
+    """
+    if _recommendation_flights.in_flight(cache_key) or recommendation_failures.get(cache_key) is not MISSING:
+        return None
+    logger.debug(f"Serving stale recommendations for '{movie_title}' while refreshing")
+    return _refresh_executor.submit(_load_recommendations, cache_key, movie_title)
+
+
+@timed_external('gemini')
+def _fetch_similar_movies(movie_title: str) -> list[str] | None:
+    """Request recommendations for a movie title from the Gemini API.
+
+    Args:
+        movie_title: The title of the movie to find similar movies for.
+
+    Returns:
+        list[str] | None: List of recommended movie titles, or None if error occurred.
+    """
     try:
         # Create prompt for Gemini
         prompt = f"""Based on the movie "{movie_title}", suggest 5 similar movies that a viewer would likely enjoy.
@@ -57,11 +168,13 @@ Focus on movies that are similar in:
 
 Return the movies as a JSON array only."""
 
-        # Use Gemini model - gemini-flash-latest is free tier compatible
-        # gemini-2.0-flash has limit 0 for free tier, so we use the "latest" variant
-        # Available models can be checked with: genai.list_models()
-        model = genai.GenerativeModel('gemini-flash-latest')
-        response = model.generate_content(prompt)
+        # Reuse one model instance instead of building it per request
+        model = _get_model()
+        started_at = time.perf_counter()
+        try:
+            response = model.generate_content(prompt)
+        finally:
+            external_call_duration_seconds.observe(time.perf_counter() - started_at, 'gemini')
 
         # Extract text from response, handling multi-part content
         try:
@@ -105,6 +218,7 @@ Return the movies as a JSON array only."""
                 return None
             
     except Exception as api_error:
+        external_call_errors_total.inc('gemini')
         error_message = str(api_error)
         # Check for quota/rate limit errors
         if "429" in error_message or "quota" in error_message.lower() or "ResourceExhausted" in error_message:
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+
+class CacheValidators(NamedTuple):
+    """HTTP validators of a response derived from data versions."""
+    etag: str
+    last_modified: datetime | None
+
+
+def version_token(versions: dict) -> str:
+    """Condense data versions into a short token that changes whenever they do.
+
+    The token hashes every scope's counter together with the time it last
+    changed, so counters that restart in a recreated database do not
+    reproduce old tokens.
+
+    Args:
+        versions: (version, updated_at) per scope, as returned by
+            data_manager.get_data_versions().
+
+    Returns:
+        str: A hex token, used as ETag and in fragment cache keys.
+    """
+    version_text = ';'.join(
+        f"{scope}={version}@{updated_at.isoformat() if updated_at else ''}"
+        for scope, (version, updated_at) in sorted(versions.items())
+    )
+    return hashlib.blake2b(version_text.encode(), digest_size=12).hexdigest()
+
+
+def validators_for(versions: dict) -> CacheValidators:
+    """Derive an ETag and Last-Modified time from data versions.
+
+    Args:
+        versions: (version, updated_at) per scope, as returned by
+            data_manager.get_data_versions().
+
+    Returns:
+        CacheValidators: The ETag (unquoted, see version_token) and the latest
+            change time (UTC), or None if no scope has been written yet.
+    """
+    etag = version_token(versions)
+    change_times = [updated_at for _, updated_at in versions.values() if updated_at is not None]
+    last_modified = max(change_times).replace(tzinfo=timezone.utc) if change_times else None
+    return CacheValidators(etag, last_modified)
+
+
+def is_not_modified(request, validators: CacheValidators) -> bool:
+    """Return whether a conditional GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the request carries no If-None-Match header (RFC 9110, section 13.2.2).
+
+    Args:
+        request: The incoming request.
+        validators: The validators of the current representation.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(validators.etag)
+    if request.if_modified_since and validators.last_modified:
+        return validators.last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def apply_validators(response, validators: CacheValidators):
+    """Attach validators to a response and require revalidation before reuse.
+
+    Args:
+        response: The response to a GET request.
+        validators: The validators of the response's representation.
+
+    Returns:
+        The same response.
+    """
+    response.set_etag(validators.etag)
+    if validators.last_modified:
+        response.last_modified = validators.last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
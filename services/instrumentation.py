@@ -0,0 +1,249 @@
+import os
+import json
+import time
+import functools
+from collections import Counter
+from contextvars import ContextVar
+
+from flask import before_render_template, template_rendered, current_app, g, request
+from sqlalchemy import event
+
+from extensions import db
+
+# Send per-request timings to clients in a Server-Timing header
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+# Log one JSON line with the timings of every request (INFO level)
+REQUEST_LOG_ENABLED = os.getenv("REQUEST_LOG_ENABLED", "true").lower() in ("1", "true", "yes")
+# Warn about likely N+1 query patterns once a request runs this many queries
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "25"))
+
+# Services timed by timed_external(), in Server-Timing order
+EXTERNAL_SERVICES = ('omdb', 'gemini')
+
+_current_timings = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Work done while handling one request.
+
+    Attributes:
+        queries: Number of SQL statements executed.
+        db_time: Seconds spent executing them (cursor.execute; fetching rows and
+            building ORM objects count towards the request total only).
+        statement_counts: Executions per SQL statement text.
+        external_time: Seconds spent per external service.
+        external_calls: Calls per external service.
+        render_time: Seconds spent rendering templates.
+    """
+
+    __slots__ = ('started_at', 'queries', 'db_time', 'statement_counts', 'external_time',
+                 'external_calls', 'render_time', 'active_services', 'render_starts')
+
+    def __init__(self):
+        """Start timing a request."""
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.statement_counts = Counter()
+        self.external_time = dict.fromkeys(EXTERNAL_SERVICES, 0.0)
+        self.external_calls = dict.fromkeys(EXTERNAL_SERVICES, 0)
+        self.render_time = 0.0
+        self.active_services = set()
+        self.render_starts = []
+
+    def elapsed(self) -> float:
+        """Return the seconds since the request started."""
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        """Return the timings as a Server-Timing header value (durations in milliseconds)."""
+        metrics = [f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"']
+        for service in EXTERNAL_SERVICES:
+            if self.external_calls[service]:
+                metrics.append(f'{service};dur={self.external_time[service] * 1000:.1f}')
+        metrics.append(f'render;dur={self.render_time * 1000:.1f}')
+        metrics.append(f'total;dur={self.elapsed() * 1000:.1f}')
+        return ', '.join(metrics)
+
+    def as_dict(self) -> dict:
+        """Return the timings as a flat dictionary (durations in milliseconds)."""
+        timings = {
+            'duration_ms': round(self.elapsed() * 1000, 1),
+            'queries': self.queries,
+            'db_ms': round(self.db_time * 1000, 1),
+            'render_ms': round(self.render_time * 1000, 1),
+        }
+        for service in EXTERNAL_SERVICES:
+            timings[f'{service}_calls'] = self.external_calls[service]
+            timings[f'{service}_ms'] = round(self.external_time[service] * 1000, 1)
+        return timings
+
+
+def current_timings() -> RequestTimings | None:
+    """Return the timings of the request being handled, or None outside requests."""
+    return _current_timings.get()
+
+
+def timed_external(service: str):
+    """Decorate a function calling an external service so its time is charged to the request.
+
+    Nested calls for the same service (a batch lookup calling single lookups)
+    are counted once. Calls made outside a request, including from worker
+    threads, are not recorded.
+
+    Args:
+        service: One of EXTERNAL_SERVICES.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timings = _current_timings.get()
+            if timings is None or service in timings.active_services:
+                return function(*args, **kwargs)
+            timings.active_services.add(service)
+            started_at = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings.external_time[service] += time.perf_counter() - started_at
+                timings.external_calls[service] += 1
+                timings.active_services.discard(service)
+        return wrapper
+    return decorator
+
+
+def _before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    """Remember when a statement started (SQLAlchemy event)."""
+    if _current_timings.get() is not None:
+        connection.info.setdefault('query_started_at', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+    """Charge a finished statement to the current request (SQLAlchemy event)."""
+    timings = _current_timings.get()
+    started_at_stack = connection.info.get('query_started_at')
+    if timings is None or not started_at_stack:
+        return
+    timings.db_time += time.perf_counter() - started_at_stack.pop()
+    timings.queries += 1
+    timings.statement_counts[statement] += 1
+
+
+def _before_render_template(sender, template, context, **extra):
+    """Remember when a template render started (Flask signal)."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.render_starts.append(time.perf_counter())
+
+
+def _template_rendered(sender, template, context, **extra):
+    """Charge a finished template render to the current request (Flask signal)."""
+    timings = _current_timings.get()
+    if timings is not None and timings.render_starts:
+        timings.render_time += time.perf_counter() - timings.render_starts.pop()
+
+
+class RequestInstrumentation:
+    """Per-request query count, database, external API and render timings.
+
+    Timings are collected through SQLAlchemy cursor events, Flask's template
+    signals and timed_external(), and reported at the end of each request
+    as a Server-Timing header and a JSON log line. Requests running at least
+    n_plus_one_threshold queries log a warning naming the most repeated
+    statement, the usual sign of a query issued once per row.
+
+    The settings are read from SERVER_TIMING_ENABLED, REQUEST_LOG_ENABLED and
+    N_PLUS_ONE_THRESHOLD in the application config; the attributes are their
+    defaults.
+
+    Attributes:
+        server_timing: Whether responses carry a Server-Timing header.
+        log_requests: Whether a JSON line is logged per request.
+        n_plus_one_threshold: Query count that triggers the N+1 warning.
+    """
+
+    def __init__(self, server_timing: bool = SERVER_TIMING_ENABLED, log_requests: bool = REQUEST_LOG_ENABLED,
+                 n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        """Initialize the defaults; init_app hooks the application.
+
+        Args:
+            server_timing: Whether responses carry a Server-Timing header.
+            log_requests: Whether a JSON line is logged per request.
+            n_plus_one_threshold: Query count that triggers the N+1 warning.
+        """
+        self.server_timing = server_timing
+        self.log_requests = log_requests
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def init_app(self, app):
+        """Register the request hooks, template signals and query events.
+
+        Args:
+            app: The Flask application instance.
+        """
+        app.config.setdefault('SERVER_TIMING_ENABLED', self.server_timing)
+        app.config.setdefault('REQUEST_LOG_ENABLED', self.log_requests)
+        app.config.setdefault('N_PLUS_ONE_THRESHOLD', self.n_plus_one_threshold)
+
+        with app.app_context():
+            engine = db.engine
+        if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        before_render_template.connect(_before_render_template, app)
+        template_rendered.connect(_template_rendered, app)
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._end_request)
+
+    @staticmethod
+    def _start_request() -> None:
+        """Start collecting timings for the request."""
+        g.request_timings_token = _current_timings.set(RequestTimings())
+
+    @staticmethod
+    def _finish_request(response):
+        """Report the request's timings.
+
+        Args:
+            response: The response about to be sent.
+
+        Returns:
+            Response: The response, with a Server-Timing header if enabled.
+        """
+        timings = _current_timings.get()
+        if timings is None:
+            return response
+        config = current_app.config
+        if config['SERVER_TIMING_ENABLED']:
+            response.headers['Server-Timing'] = timings.server_timing()
+        if config['REQUEST_LOG_ENABLED']:
+            current_app.logger.info(json.dumps({
+                'event': 'request',
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                **timings.as_dict(),
+            }))
+        if timings.queries >= config['N_PLUS_ONE_THRESHOLD']:
+            statement, executions = timings.statement_counts.most_common(1)[0]
+            current_app.logger.warning(
+                f"Possible N+1 queries: {request.method} {request.path} ran {timings.queries} queries; "
+                f"executed {executions} times: {' '.join(statement.split())[:200]}"
+            )
+        return response
+
+    @staticmethod
+    def _end_request(error=None) -> None:
+        """Stop collecting timings, even if the request failed."""
+        token = g.pop('request_timings_token', None)
+        if token is not None:
+            _current_timings.reset(token)
+
+
+request_instrumentation = RequestInstrumentation()
@@ -0,0 +1,184 @@
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
+
+from datamanager import data_manager as data
+from datamanager.data_models import Job
+from extensions import db
+from services.cache import normalize_title
+
+# Worker threads per process running queued jobs
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "4"))
+# Seconds after which a 'running' job left by a stopped process is queued again
+JOB_STALE_AFTER = float(os.getenv("JOB_STALE_AFTER", "600"))
+# Start the worker pool when the app is created. Servers that load the app before
+# forking workers (gunicorn preload_app) turn this off and call start() in each worker.
+JOB_QUEUE_AUTOSTART = os.getenv("JOB_QUEUE_AUTOSTART", "true").lower() in ("1", "true", "yes")
+# Make add-movie requests asynchronous by default (otherwise opt in with ?async=1)
+ADD_MOVIE_ASYNC = os.getenv("ADD_MOVIE_ASYNC", "false").lower() in ("1", "true", "yes")
+
+ADD_MOVIE_JOB = 'add_movie'
+
+logger = logging.getLogger(__name__)
+
+
+def add_movie_dedupe_key(user_id: int, title: str) -> str:
+    """Return the key under which equivalent add-movie jobs coalesce."""
+    return f"{ADD_MOVIE_JOB}:{user_id}:{normalize_title(title)}"
+
+
+def is_async_requested(query_value: str | None, default: bool) -> bool:
+    """Decide whether a request runs asynchronously from its ?async= argument.
+
+    Args:
+        query_value: The raw ?async= value, or None if absent.
+        default: The configured default (ADD_MOVIE_ASYNC).
+
+    Returns:
+        bool: True for '1', 'true' or 'yes'; the default when the argument is absent.
+    """
+    if query_value is None:
+        return default
+    return query_value.lower() in ('1', 'true', 'yes')
+
+
+class JobQueue:
+    """In-process worker pool for jobs persisted in the job table.
+
+    Jobs are stored before they are submitted, so queued work survives a
+    restart: init_app requeues jobs left behind by a previous process. A
+    worker claims a job with an atomic UPDATE, so a job runs at most once
+    even when several processes share the database.
+
+    Attributes:
+        app: The Flask application jobs run under.
+        max_workers: Number of worker threads.
+        stale_after: Seconds after which an abandoned running job is requeued.
+    """
+
+    def __init__(self, max_workers: int = JOB_QUEUE_WORKERS, stale_after: float = JOB_STALE_AFTER):
+        self.app = None
+        self.max_workers = max_workers
+        self.stale_after = stale_after
+        self._executor = None
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Bind the queue to the application and, unless JOB_QUEUE_AUTOSTART is off, start it.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.app = app
+        app.config.setdefault('ADD_MOVIE_ASYNC', ADD_MOVIE_ASYNC)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if app.config.setdefault('JOB_QUEUE_AUTOSTART', JOB_QUEUE_AUTOSTART):
+            self.start()
+
+    def start(self):
+        """Start the worker pool and resume pending jobs.
+
+        Until the queue is started, enqueued jobs are only stored; start()
+        picks them up with the other queued jobs.
+        """
+        app = self.app
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job-worker')
+        with app.app_context():
+            # Fresh databases get their tables later (migrations or tests)
+            if not inspect(db.engine).has_table(Job.__tablename__):
+                return
+            try:
+                pending_job_ids = data.requeue_stale_jobs(self.stale_after)
+            except SQLAlchemyError as db_error:
+                logger.error(f"Could not resume pending jobs: {db_error}", exc_info=True)
+                return
+        if pending_job_ids:
+            logger.info(f"Resuming {len(pending_job_ids)} pending jobs")
+        for job_id in pending_job_ids:
+            self._submit(job_id)
+
+    def enqueue_add_movie(self, user_id: int, title: str) -> tuple[Job, bool]:
+        """Queue adding a movie to a user's collection.
+
+        If the same title is already queued or running for the user, the
+        existing job is returned instead of creating a new one.
+
+        Args:
+            user_id: The unique identifier of the user.
+            title: The title of the movie to add.
+
+        Returns:
+            tuple[Job, bool]: The job, and whether it was newly created.
+
+        Raises:
+            ValueError: If the job cannot be stored.
+        """
+        job, created = data.create_job(ADD_MOVIE_JOB, user_id, title, add_movie_dedupe_key(user_id, title))
+        if created:
+            self._submit(job.id)
+        return job, created
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait for all submitted jobs to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if every job finished within the timeout.
+        """
+        with self._lock:
+            futures = set(self._futures)
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def _submit(self, job_id: int) -> None:
+        """Hand a job to the worker pool (it stays queued until start() if there is none)."""
+        if self._executor is None:
+            return
+        future = self._executor.submit(self._run, job_id)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future) -> None:
+        """Forget a finished future."""
+        with self._lock:
+            self._futures.discard(future)
+
+    def _run(self, job_id: int) -> None:
+        """Claim and execute one job inside an application context."""
+        with self.app.app_context():
+            try:
+                if not data.claim_job(job_id):
+                    return
+                job = data.get_job(job_id)
+                if job.kind != ADD_MOVIE_JOB:
+                    data.finish_job(job_id, Job.FAILED, error=f"Unknown job kind '{job.kind}'")
+                    return
+                try:
+                    result = data.add_movie(job.user_id, job.title)
+                except ValueError as value_error:
+                    data.finish_job(job_id, Job.FAILED, error=str(value_error))
+                    return
+                movie_id = result['movie'].id if result['movie'] else None
+                data.finish_job(job_id, Job.SUCCEEDED, result_message=result['message'], movie_id=movie_id)
+            except Exception as unexpected_error:
+                logger.error(f"Job {job_id} failed: {unexpected_error}", exc_info=True)
+                db.session.rollback()
+                try:
+                    data.finish_job(job_id, Job.FAILED, error=str(unexpected_error))
+                except SQLAlchemyError:
+                    logger.error(f"Could not record failure of job {job_id}", exc_info=True)
+
+
+job_queue = JobQueue()
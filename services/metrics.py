@@ -0,0 +1,404 @@
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from bisect import bisect_left
+
+# Directory shared by all worker processes of one deployment for metric snapshots.
+# Leave unset for a single process; clear it when the server starts.
+METRICS_DIR = os.getenv("METRICS_DIR")
+# Seconds between snapshot writes of a worker process (only with METRICS_DIR)
+METRICS_SNAPSHOT_INTERVAL = float(os.getenv("METRICS_SNAPSHOT_INTERVAL", "5"))
+# Snapshot file holding the summed counters and histograms of exited processes
+EXITED_SNAPSHOT_FILE = 'exited.json'
+
+METRICS_PREFIX = 'movieweb_'
+# Latency histogram bucket bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+COUNTER = 'counter'
+GAUGE = 'gauge'
+HISTOGRAM = 'histogram'
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+logger = logging.getLogger(__name__)
+
+
+class Metric:
+    """A named metric whose samples are kept per thread by a MetricsRegistry.
+
+    Attributes:
+        name: Full metric name, including METRICS_PREFIX.
+        help: One-line description.
+        kind: COUNTER, GAUGE or HISTOGRAM.
+        labelnames: Names of the labels; samples pass values in the same order.
+        buckets: Upper bounds of a histogram's buckets.
+    """
+
+    def __init__(self, registry, name: str, help: str, kind: str, labelnames: tuple = (),
+                 buckets: tuple = LATENCY_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+
+    def inc(self, *labelvalues, amount: float = 1) -> None:
+        """Add amount to a counter or gauge sample (negative amounts only for gauges)."""
+        shard = self.registry.thread_shard()
+        key = (self.name, labelvalues)
+        shard[key] = shard.get(key, 0) + amount
+
+    def dec(self, *labelvalues, amount: float = 1) -> None:
+        """Subtract amount from a gauge sample."""
+        self.inc(*labelvalues, amount=-amount)
+
+    def observe(self, value: float, *labelvalues) -> None:
+        """Record one observation in a histogram."""
+        shard = self.registry.thread_shard()
+        key = (self.name, labelvalues)
+        counts = shard.get(key)
+        if counts is None:
+            # One slot per bucket, one for +Inf, then the sum of observed values
+            counts = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+
+def _merge_into(totals: dict, key, value) -> None:
+    """Add a counter/gauge value or histogram counts to totals[key]; value is never aliased."""
+    current = totals.get(key)
+    if current is None:
+        totals[key] = list(value) if isinstance(value, list) else value
+    elif isinstance(value, list):
+        for position, count in enumerate(value):
+            current[position] += count
+    else:
+        totals[key] = current + value
+
+
+def _read_samples(snapshot_path: str) -> list:
+    """Return the [name, labelvalues, value] samples of a snapshot file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON.
+    """
+    with open(snapshot_path, encoding='utf-8') as snapshot_file:
+        return json.load(snapshot_file)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a process with the given id exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape_label(value) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames: tuple, labelvalues: tuple, extra: str = '') -> str:
+    """Return a {name="value",...} label set, or '' without labels."""
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping integers free of a trailing '.0'."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Process-wide metrics with lock-free updates and multi-process aggregation.
+
+    Every thread updates its own dictionary of samples, so incrementing a
+    counter or observing a latency is a couple of dictionary operations and
+    never waits for a lock. Shards are only summed when metrics are read,
+    and the samples of finished threads are folded into a retired shard.
+
+    Values that already exist elsewhere (cache hit counters, pool status)
+    are read by collectors at snapshot time instead of being updated on
+    every operation.
+
+    With a directory, each process periodically writes its snapshot to
+    <directory>/<pid>.json and collect() merges all snapshots, so any
+    worker can answer a scrape for the whole server. Counters and
+    histograms of exited processes are kept (they are cumulative), their
+    gauges are dropped. retire_process() folds an exited process's
+    snapshot into EXITED_SNAPSHOT_FILE, so recycled workers do not leave
+    one file each behind.
+
+    Attributes:
+        directory: Snapshot directory shared by worker processes, or None.
+        snapshot_interval: Seconds between periodic snapshot writes.
+    """
+
+    def __init__(self, directory: str | None = METRICS_DIR, snapshot_interval: float = METRICS_SNAPSHOT_INTERVAL):
+        """Initialize an empty registry.
+
+        Args:
+            directory: Snapshot directory shared by worker processes, or None.
+            snapshot_interval: Seconds between periodic snapshot writes.
+        """
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self._metrics = {}
+        self._collectors = []
+        self._shards = []
+        self._retired = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._last_snapshot_at = None
+
+    def _register(self, name: str, help: str, kind: str, labelnames: tuple, **options) -> Metric:
+        """Create a metric, or return the existing one of the same name."""
+        full_name = METRICS_PREFIX + name
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = Metric(self, full_name, help, kind, labelnames, **options)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple = ()) -> Metric:
+        """Define a monotonically increasing counter."""
+        return self._register(name, help, COUNTER, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: tuple = ()) -> Metric:
+        """Define a gauge; values of live processes are summed."""
+        return self._register(name, help, GAUGE, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Metric:
+        """Define a histogram with the given bucket upper bounds."""
+        return self._register(name, help, HISTOGRAM, labelnames, buckets=buckets)
+
+    def register_collector(self, collector) -> None:
+        """Add a callable run at snapshot time.
+
+        Args:
+            collector: Callable returning an iterable of (metric, labelvalues, value)
+                samples; they replace, rather than add to, earlier collected values.
+        """
+        self._collectors.append(collector)
+
+    def thread_shard(self) -> dict:
+        """Return the calling thread's sample dictionary."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def snapshot(self) -> dict:
+        """Return this process's current samples.
+
+        Returns:
+            dict: Mapping of (metric name, label values) to a value, or to
+                histogram bucket counts followed by the sum.
+        """
+        totals = {}
+        with self._lock:
+            live_shards = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live_shards.append((thread, shard))
+                else:
+                    for key, value in shard.items():
+                        _merge_into(self._retired, key, value)
+            self._shards = live_shards
+            for key, value in self._retired.items():
+                _merge_into(totals, key, value)
+        for _, shard in live_shards:
+            # Copying a dict is atomic under the GIL; the owner thread may keep writing
+            for key, value in shard.copy().items():
+                _merge_into(totals, key, value)
+        for collector in self._collectors:
+            try:
+                for metric, labelvalues, value in collector():
+                    totals[(metric.name, tuple(labelvalues))] = value
+            except Exception as collector_error:
+                logger.error(f"Metrics collector {collector!r} failed: {collector_error}", exc_info=True)
+        return totals
+
+    def _write_samples(self, file_name: str, samples: dict) -> bool:
+        """Atomically replace a snapshot file of the shared directory.
+
+        Args:
+            file_name: Name of the file inside the directory.
+            samples: Samples keyed like snapshot().
+
+        Returns:
+            bool: True if the file was written.
+        """
+        serialized = [[name, list(labelvalues), value] for (name, labelvalues), value in samples.items()]
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as snapshot_file:
+                json.dump(serialized, snapshot_file)
+            os.replace(temporary_path, os.path.join(self.directory, file_name))
+            return True
+        except OSError as write_error:
+            logger.warning(f"Could not write metrics snapshot {file_name}: {write_error}")
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+            return False
+
+    def write_snapshot(self) -> None:
+        """Write this process's snapshot to the shared directory, if configured."""
+        if not self.directory:
+            return
+        self._last_snapshot_at = time.monotonic()
+        self._write_samples(f"{os.getpid()}.json", self.snapshot())
+
+    def retire_process(self, pid: int) -> None:
+        """Fold the snapshot of an exited process into EXITED_SNAPSHOT_FILE and remove it.
+
+        Its counters and histograms are added to the aggregate and its gauges
+        are dropped, so collect() reports the same totals from one file less.
+        The aggregate is read, updated and replaced without a lock: call this
+        from a single process, such as the gunicorn master's child_exit hook.
+
+        Args:
+            pid: The process id of the exited process.
+        """
+        if not self.directory:
+            return
+        snapshot_path = os.path.join(self.directory, f"{pid}.json")
+        try:
+            samples = _read_samples(snapshot_path)
+        except FileNotFoundError:
+            return
+        except (ValueError, OSError) as read_error:
+            logger.warning(f"Could not read metrics snapshot of exited process {pid}: {read_error}")
+            return
+
+        totals = {}
+        try:
+            for name, labelvalues, value in _read_samples(os.path.join(self.directory, EXITED_SNAPSHOT_FILE)):
+                _merge_into(totals, (name, tuple(labelvalues)), value)
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as read_error:
+            logger.warning(f"Could not read metrics of exited processes: {read_error}")
+            return
+        for name, labelvalues, value in samples:
+            metric = self._metrics.get(name)
+            if metric is not None and metric.kind != GAUGE:
+                _merge_into(totals, (name, tuple(labelvalues)), value)
+
+        if self._write_samples(EXITED_SNAPSHOT_FILE, totals):
+            os.unlink(snapshot_path)
+
+    def maybe_write_snapshot(self) -> None:
+        """Write a snapshot if snapshot_interval has passed since the last one."""
+        if not self.directory:
+            return
+        if self._last_snapshot_at is None or time.monotonic() - self._last_snapshot_at >= self.snapshot_interval:
+            self.write_snapshot()
+
+    def collect(self) -> dict:
+        """Return the samples of every process sharing the snapshot directory.
+
+        Returns:
+            dict: Merged samples, keyed like snapshot().
+        """
+        if not self.directory:
+            return self.snapshot()
+        self.write_snapshot()
+        totals = {}
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                # The aggregate of exited processes holds no gauges
+                pid = None if file_name == EXITED_SNAPSHOT_FILE else int(file_name[:-len('.json')])
+                samples = _read_samples(os.path.join(self.directory, file_name))
+            except (ValueError, OSError):
+                continue
+            process_alive = pid is not None and (pid == os.getpid() or _pid_alive(pid))
+            for name, labelvalues, value in samples:
+                metric = self._metrics.get(name)
+                if metric is None or (metric.kind == GAUGE and not process_alive):
+                    continue
+                _merge_into(totals, (name, tuple(labelvalues)), value)
+        return totals
+
+    def render(self, samples: dict | None = None) -> str:
+        """Return samples in the Prometheus text exposition format.
+
+        Args:
+            samples: Samples keyed like snapshot(); defaults to collect().
+
+        Returns:
+            str: The exposition text.
+        """
+        samples = self.collect() if samples is None else samples
+        samples_by_metric = {}
+        for (name, labelvalues), value in samples.items():
+            samples_by_metric.setdefault(name, []).append((labelvalues, value))
+
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for labelvalues, value in sorted(samples_by_metric.get(name, ()), key=lambda sample: sample[0]):
+                if metric.kind != HISTOGRAM:
+                    lines.append(f"{name}{_format_labels(metric.labelnames, labelvalues)} {_format_value(value)}")
+                    continue
+                cumulative_count = 0
+                for upper_bound, count in zip(metric.buckets + (float('inf'),), value[:-1]):
+                    cumulative_count += count
+                    le = '+Inf' if upper_bound == float('inf') else _format_value(upper_bound)
+                    bucket_labels = _format_labels(metric.labelnames, labelvalues, f'le="{le}"')
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative_count}")
+                label_set = _format_labels(metric.labelnames, labelvalues)
+                lines.append(f"{name}_sum{label_set} {_format_value(value[-1])}")
+                lines.append(f"{name}_count{label_set} {cumulative_count}")
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        """Drop all samples of this process (metric definitions and collectors are kept)."""
+        with self._lock:
+            for _, shard in self._shards:
+                shard.clear()
+            self._retired.clear()
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    'http_requests_total', 'HTTP requests handled.', ('endpoint', 'method', 'status'))
+http_request_duration_seconds = registry.histogram(
+    'http_request_duration_seconds', 'HTTP request latency in seconds.', ('endpoint', 'method'))
+http_requests_in_progress = registry.gauge(
+    'http_requests_in_progress', 'HTTP requests being handled.')
+external_call_duration_seconds = registry.histogram(
+    'external_call_duration_seconds', 'Latency of calls to external APIs in seconds.', ('service',))
+external_call_errors_total = registry.counter(
+    'external_call_errors_total', 'Calls to external APIs that failed.', ('service',))
+db_pool_checkouts_total = registry.counter(
+    'db_pool_checkouts_total', 'Database connections checked out of the pool.')
+db_pool_checked_out = registry.gauge(
+    'db_pool_checked_out', 'Database connections currently checked out.')
+db_pool_size = registry.gauge(
+    'db_pool_size', 'Configured database connection pool size.')
+db_pool_overflow = registry.gauge(
+    'db_pool_overflow', 'Database connections open beyond the pool size.')
+cache_hits_total = registry.counter('cache_hits_total', 'Cache lookups answered from the cache.', ('cache',))
+cache_misses_total = registry.counter('cache_misses_total', 'Cache lookups that missed.', ('cache',))
+cache_hit_ratio = registry.gauge('cache_hit_ratio', 'Share of cache lookups answered from the cache.', ('cache',))
@@ -1,20 +1,116 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from requests.exceptions import HTTPError, ConnectionError, Timeout
+from requests.exceptions import RequestException
+
+from services.cache import MISSING, TTLCache, SQLiteCacheStore, TieredCache, normalize_title
+from services.omdb_client import OMDbClient, CircuitBreaker
+from services.instrumentation import timed_external
 
 # Get the API key from environment variables
 OMDB_API_KEY = os.getenv("OMDB_API_KEY")
 
+# Response cache settings (TTLs in seconds); OMDB_CACHE_PATH enables the on-disk tier
+OMDB_CACHE_TTL = int(os.getenv("OMDB_CACHE_TTL", "86400"))
+OMDB_CACHE_NEGATIVE_TTL = int(os.getenv("OMDB_CACHE_NEGATIVE_TTL", "3600"))
+OMDB_CACHE_SIZE = int(os.getenv("OMDB_CACHE_SIZE", "2048"))
+OMDB_CACHE_PATH = os.getenv("OMDB_CACHE_PATH")
+OMDB_CACHE_MAX_ENTRIES = int(os.getenv("OMDB_CACHE_MAX_ENTRIES", "100000"))
+
+# HTTP client settings (timeouts and backoff in seconds)
+OMDB_API_URL = os.getenv("OMDB_API_URL", "http://www.omdbapi.com/")
+OMDB_POOL_CONNECTIONS = int(os.getenv("OMDB_POOL_CONNECTIONS", "4"))
+OMDB_POOL_MAXSIZE = int(os.getenv("OMDB_POOL_MAXSIZE", "16"))
+OMDB_CONNECT_TIMEOUT = float(os.getenv("OMDB_CONNECT_TIMEOUT", "3.05"))
+OMDB_READ_TIMEOUT = float(os.getenv("OMDB_READ_TIMEOUT", "10"))
+OMDB_MAX_RETRIES = int(os.getenv("OMDB_MAX_RETRIES", "2"))
+OMDB_BACKOFF_BASE = float(os.getenv("OMDB_BACKOFF_BASE", "0.25"))
+OMDB_BREAKER_THRESHOLD = int(os.getenv("OMDB_BREAKER_THRESHOLD", "5"))
+OMDB_BREAKER_RESET_TIMEOUT = float(os.getenv("OMDB_BREAKER_RESET_TIMEOUT", "30"))
+
+# Resolve titles through OMDb even when they are already in the local catalog
+OMDB_ALWAYS_REFRESH = os.getenv("OMDB_ALWAYS_REFRESH", "false").lower() in ("1", "true", "yes")
+
+# Title searches (s=) used by suggestions; shorter prefixes match too much to be useful
+OMDB_SEARCH_CACHE_TTL = int(os.getenv("OMDB_SEARCH_CACHE_TTL", "86400"))
+OMDB_SEARCH_MIN_CHARS = int(os.getenv("OMDB_SEARCH_MIN_CHARS", "3"))
+
+# Concurrent lookups used by batch imports
+OMDB_BATCH_WORKERS = int(os.getenv("OMDB_BATCH_WORKERS", "8"))
+
+# OMDb's error message for unknown titles; these answers are cached (negative caching)
+OMDB_NOT_FOUND_ERROR = "Movie not found!"
+# Search answers that mean "no usable results" (cached like not-found answers)
+OMDB_EMPTY_SEARCH_ERRORS = (OMDB_NOT_FOUND_ERROR, "Too many results.")
+
 logger = logging.getLogger(__name__)
 
+omdb_cache = TieredCache(
+    TTLCache(max_size=OMDB_CACHE_SIZE, ttl=OMDB_CACHE_TTL),
+    SQLiteCacheStore(OMDB_CACHE_PATH, table='omdb_cache',
+                     max_entries=OMDB_CACHE_MAX_ENTRIES) if OMDB_CACHE_PATH else None
+)
+
+omdb_search_cache = TieredCache(
+    TTLCache(max_size=OMDB_CACHE_SIZE, ttl=OMDB_SEARCH_CACHE_TTL),
+    SQLiteCacheStore(OMDB_CACHE_PATH, table='omdb_search_cache',
+                     max_entries=OMDB_CACHE_MAX_ENTRIES) if OMDB_CACHE_PATH else None
+)
+
+# Single I/O path to OMDb; its stats() expose pool and breaker state for metrics
+omdb_client = OMDbClient(
+    base_url=OMDB_API_URL,
+    pool_connections=OMDB_POOL_CONNECTIONS,
+    pool_maxsize=OMDB_POOL_MAXSIZE,
+    connect_timeout=OMDB_CONNECT_TIMEOUT,
+    read_timeout=OMDB_READ_TIMEOUT,
+    max_retries=OMDB_MAX_RETRIES,
+    backoff_base=OMDB_BACKOFF_BASE,
+    breaker=CircuitBreaker(failure_threshold=OMDB_BREAKER_THRESHOLD,
+                           reset_timeout=OMDB_BREAKER_RESET_TIMEOUT)
+)
+
+
+def omdb_cache_key(movie_title: str, release_year: int | None = None) -> str:
+    """Return the omdb_cache key of a title lookup, optionally narrowed to a release year.
+
+    Args:
+        movie_title: The title of the movie.
+        release_year: The release year, or None for OMDb's best match.
+
+    Returns:
+        str: The cache key.
+    """
+    cache_key = normalize_title(movie_title)
+    return cache_key if release_year is None else f"{cache_key}|{release_year}"
 
-def fetch_movie_data(movie_title: str) -> dict | None:
+
+@timed_external('omdb')
+def _omdb_get(query_parameters: dict):
+    """Send one OMDb request, charging its time to the current request (see omdb_client.get)."""
+    return omdb_client.get(query_parameters)
+
+
+def _cached_movie_data(cache_key: str):
+    """Return a copy of the cached answer for a lookup, None for a cached "not found", or MISSING."""
+    cached_movie_data = omdb_cache.get(cache_key)
+    if cached_movie_data is MISSING:
+        return MISSING
+    return dict(cached_movie_data) if cached_movie_data else None
+
+
+def fetch_movie_data(movie_title: str, release_year: int | None = None) -> dict | None:
     """Fetch movie data from the OMDb API by title.
 
+    Answers are served from `omdb_cache` when possible. Successful lookups are
+    cached for OMDB_CACHE_TTL seconds and "Movie not found!" answers for
+    OMDB_CACHE_NEGATIVE_TTL seconds; transport and parsing errors are not cached.
+
     Args:
         movie_title: The title of the movie to search for.
+        release_year: Only match a movie released in this year (OMDb's y=),
+            e.g. to tell "Dune" (1984) from "Dune" (2021).
 
     Returns:
         dict | None: Dictionary containing movie data with keys: title, director,
@@ -24,18 +120,23 @@ def fetch_movie_data(movie_title: str) -> dict | None:
         logger.error("OMDB_API_KEY is not set; cannot fetch movie data.")
         return None
 
-    omdb_api_url = f"http://www.omdbapi.com/?apikey={OMDB_API_KEY}&t={movie_title}"
+    cached_movie_data = _cached_movie_data(omdb_cache_key(movie_title, release_year))
+    if cached_movie_data is not MISSING:
+        logger.debug(f"OMDb cache hit for '{movie_title}'")
+        return cached_movie_data
+    return _load_movie_data(movie_title, release_year)
 
-    request_headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-                      '(KHTML, like Gecko) Chrome/85.0.4183.121 Safari/537.36',
-        'Accept-Language': 'en-US,en;q=0.5'
-    }
 
+def _load_movie_data(movie_title: str, release_year: int | None = None) -> dict | None:
+    """Request movie data from OMDb and cache the answer; see fetch_movie_data."""
+    cache_key = omdb_cache_key(movie_title, release_year)
     try:
-        http_response = requests.get(omdb_api_url, headers=request_headers)
-        http_response.raise_for_status()  # Raise HTTPError for bad responses (4xx, 5xx)
-    except (HTTPError, ConnectionError, Timeout) as request_error:
+        # Retries, timeouts and the circuit breaker are handled by the client
+        query_parameters = {'apikey': OMDB_API_KEY, 't': movie_title}
+        if release_year is not None:
+            query_parameters['y'] = release_year
+        http_response = _omdb_get(query_parameters)
+    except RequestException as request_error:
         logger.warning(f"OMDb API request error for '{movie_title}': {request_error}")
         return None
 
@@ -48,6 +149,8 @@ def fetch_movie_data(movie_title: str) -> dict | None:
     # Catch API error response
     if "Error" in omdb_response_data:
         logger.info(f"OMDb API error for '{movie_title}': {omdb_response_data['Error']}")
+        if omdb_response_data['Error'] == OMDB_NOT_FOUND_ERROR:
+            omdb_cache.set(cache_key, None, ttl=OMDB_CACHE_NEGATIVE_TTL)
         return None
 
     # Extract relevant movie data
@@ -58,4 +161,121 @@ def fetch_movie_data(movie_title: str) -> dict | None:
         'release_year': omdb_response_data.get('Year', ''),
         'poster': omdb_response_data.get('Poster', 'N/A')
     }
-    return formatted_movie_data
+    omdb_cache.set(cache_key, formatted_movie_data)
+    return dict(formatted_movie_data)
+
+
+def search_movie_titles(search_text: str) -> list[dict]:
+    """Search OMDb for movies whose title contains search_text (OMDb's s= search).
+
+    Results are cached in `omdb_search_cache` for OMDB_SEARCH_CACHE_TTL
+    seconds; "not found" and "too many results" answers are cached as empty
+    results for OMDB_CACHE_NEGATIVE_TTL seconds. Queries shorter than
+    OMDB_SEARCH_MIN_CHARS are not sent.
+
+    Args:
+        search_text: The (partial) title to search for.
+
+    Returns:
+        list[dict]: Up to one page of results with keys: title, release_year,
+            poster. Empty if nothing matched or an error occurred.
+    """
+    cache_key = normalize_title(search_text)
+    if not OMDB_API_KEY or len(cache_key) < OMDB_SEARCH_MIN_CHARS:
+        return []
+
+    cached_results = omdb_search_cache.get(cache_key)
+    if cached_results is not MISSING:
+        return [dict(result) for result in cached_results]
+
+    try:
+        http_response = _omdb_get({'apikey': OMDB_API_KEY, 's': search_text, 'type': 'movie'})
+        omdb_response_data = http_response.json()
+    except ValueError as json_parse_error:
+        # Checked first: requests' JSONDecodeError is also a RequestException
+        logger.error(f"Error parsing OMDb search response for '{search_text}': {json_parse_error}")
+        return []
+    except RequestException as request_error:
+        logger.warning(f"OMDb search request error for '{search_text}': {request_error}")
+        return []
+
+    if "Error" in omdb_response_data:
+        logger.debug(f"OMDb search error for '{search_text}': {omdb_response_data['Error']}")
+        if omdb_response_data['Error'] in OMDB_EMPTY_SEARCH_ERRORS:
+            omdb_search_cache.set(cache_key, [], ttl=OMDB_CACHE_NEGATIVE_TTL)
+        return []
+
+    search_results = [
+        {
+            'title': search_result.get('Title', ''),
+            'release_year': search_result.get('Year', ''),
+            'poster': search_result.get('Poster', 'N/A')
+        }
+        for search_result in omdb_response_data.get('Search', [])
+    ]
+    omdb_search_cache.set(cache_key, search_results)
+    return [dict(result) for result in search_results]
+
+
+def fetch_movies_data(movie_lookups: list[str | tuple[str, int]],
+                      max_workers: int = OMDB_BATCH_WORKERS) -> dict[str | tuple[str, int], dict | None]:
+    """Fetch movie data for many titles concurrently.
+
+    Cached answers are returned directly. Remaining lookups that share a
+    cache key are sent only once, and they run on a bounded thread pool so
+    a large batch cannot exhaust the OMDb client's connection pool.
+
+    Args:
+        movie_lookups: Titles, or (title, release_year) pairs to narrow a
+            lookup to one release year (see fetch_movie_data).
+        max_workers: Maximum number of concurrent OMDb requests.
+
+    Returns:
+        dict[str | tuple[str, int], dict | None]: Mapping of each input lookup
+            to its movie data (see fetch_movie_data), or None if not found or an error occurred.
+    """
+    def lookup_key(movie_lookup) -> str:
+        return omdb_cache_key(*movie_lookup) if isinstance(movie_lookup, tuple) else omdb_cache_key(movie_lookup)
+
+    lookups_by_key = {}
+    for movie_lookup in movie_lookups:
+        lookups_by_key.setdefault(lookup_key(movie_lookup), movie_lookup)
+    if not lookups_by_key:
+        return {}
+    if not OMDB_API_KEY:
+        logger.error("OMDB_API_KEY is not set; cannot fetch movie data.")
+        return dict.fromkeys(movie_lookups)
+
+    results_by_key, uncached_lookups = {}, {}
+    for cache_key, movie_lookup in lookups_by_key.items():
+        cached_movie_data = _cached_movie_data(cache_key)
+        if cached_movie_data is MISSING:
+            uncached_lookups[cache_key] = movie_lookup
+        else:
+            results_by_key[cache_key] = cached_movie_data
+    if uncached_lookups:
+        results_by_key.update(_load_movies_data(uncached_lookups, max_workers))
+
+    return {
+        movie_lookup: results_by_key[lookup_key(movie_lookup)]
+        for movie_lookup in movie_lookups
+    }
+
+
+@timed_external('omdb')
+def _load_movies_data(lookups_by_key: dict, max_workers: int) -> dict:
+    """Request uncached lookups on a thread pool, charged to the current request as one call.
+
+    Args:
+        lookups_by_key: Lookups (see fetch_movies_data) by cache key.
+        max_workers: Maximum number of concurrent OMDb requests.
+
+    Returns:
+        dict: Movie data (or None) by cache key.
+    """
+    def load(movie_lookup):
+        return _load_movie_data(*movie_lookup) if isinstance(movie_lookup, tuple) else _load_movie_data(movie_lookup)
+
+    unique_lookups = list(lookups_by_key.values())
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_lookups)))) as executor:
+        return dict(zip(lookups_by_key, executor.map(load, unique_lookups)))
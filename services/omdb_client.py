@@ -0,0 +1,303 @@
+import time
+import random
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
+
+from services.metrics import external_call_duration_seconds, external_call_errors_total
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of making a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After failure_threshold consecutive failures the breaker opens and requests
+    fail fast. Once reset_timeout seconds have passed, a single trial request is
+    let through (half-open); its outcome closes or re-opens the breaker.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the breaker.
+        reset_timeout: Seconds the breaker stays open before allowing a trial request.
+        consecutive_failures: Current run of failures.
+        times_opened: Number of times the breaker has opened.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            reset_timeout: Seconds the breaker stays open before allowing a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return the breaker state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be attempted now.
+
+        Returns:
+            bool: True when closed, or for the single trial request when half-open.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker if the threshold is reached."""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                    logger.warning(f"Circuit breaker opened after {self.consecutive_failures} failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Force the breaker back to the closed state and clear its counters."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.times_opened = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def stats(self) -> dict:
+        """Return the breaker state and counters.
+
+        Returns:
+            dict: state, consecutive_failures, failure_threshold, times_opened.
+        """
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'failure_threshold': self.failure_threshold,
+            'times_opened': self.times_opened,
+        }
+
+
+class OMDbClient:
+    """HTTP client for the OMDb API with connection pooling, retries and a circuit breaker.
+
+    Uses one keep-alive requests.Session whose HTTPAdapter pool is sized by
+    pool_connections/pool_maxsize. Connection errors, timeouts, 429 and 5xx
+    responses are retried up to max_retries times with jittered exponential
+    backoff; a request that still fails counts against the circuit breaker.
+
+    Attributes:
+        base_url: The OMDb API endpoint.
+        session: The pooled requests.Session.
+        breaker: The CircuitBreaker guarding the endpoint.
+        timeout: (connect, read) timeout in seconds passed to every request.
+        max_retries: Retries after the first attempt.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/85.0.4183.121 Safari/537.36',
+        'Accept-Language': 'en-US,en;q=0.5'
+    }
+
+    def __init__(self, base_url: str = 'http://www.omdbapi.com/', pool_connections: int = 4,
+                 pool_maxsize: int = 16, connect_timeout: float = 3.05, read_timeout: float = 10,
+                 max_retries: int = 2, backoff_base: float = 0.25, backoff_max: float = 4.0,
+                 breaker: CircuitBreaker = None):
+        """Create the pooled session.
+
+        Args:
+            base_url: The OMDb API endpoint.
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum connections kept alive per pool.
+            connect_timeout: Seconds to wait for a TCP connection.
+            read_timeout: Seconds to wait for response data.
+            max_retries: Retries after the first attempt.
+            backoff_base: Backoff ceiling for the first retry, doubled per retry.
+            backoff_max: Upper bound for a single backoff delay.
+            breaker: Circuit breaker to use; a default one is created if omitted.
+        """
+        self.base_url = base_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuits = 0
+
+        self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize, max_retries=0)
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return a full-jitter backoff delay for the given retry attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get(self, params: dict) -> requests.Response:
+        """Send a GET request to the OMDb endpoint.
+
+        Args:
+            params: Query string parameters (apikey, t, ...).
+
+        Returns:
+            requests.Response: The successful (2xx) response.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            HTTPError: If the final response has an error status.
+            ConnectionError: If the connection could not be established.
+            Timeout: If the server did not answer in time.
+            RequestException: For any other failure of the request (e.g. a
+                truncated or undecodable body, too many redirects).
+        """
+        if not self.breaker.allow_request():
+            self.short_circuits += 1
+            external_call_errors_total.inc('omdb')
+            raise CircuitOpenError("OMDb circuit breaker is open; failing fast")
+
+        started_at = time.perf_counter()
+        try:
+            return self._get_with_retries(params)
+        except RequestException:
+            external_call_errors_total.inc('omdb')
+            raise
+        finally:
+            external_call_duration_seconds.observe(time.perf_counter() - started_at, 'omdb')
+
+    def _get_with_retries(self, params: dict) -> requests.Response:
+        """Send the request, retrying transient failures; see get()."""
+        for attempt in range(self.max_retries + 1):
+            is_last_attempt = attempt == self.max_retries
+            try:
+                self.requests_sent += 1
+                http_response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+                if http_response.status_code in self.RETRY_STATUS_CODES and not is_last_attempt:
+                    logger.info(f"OMDb returned {http_response.status_code}; retrying")
+                else:
+                    http_response.raise_for_status()
+                    self.breaker.record_success()
+                    return http_response
+            except (ConnectionError, Timeout) as request_error:
+                if is_last_attempt:
+                    self.failures += 1
+                    self.breaker.record_failure()
+                    raise
+                logger.info(f"OMDb request failed ({request_error}); retrying")
+            except HTTPError as http_error:
+                status_code = getattr(http_error.response, 'status_code', None)
+                if status_code is None or status_code in self.RETRY_STATUS_CODES:
+                    self.failures += 1
+                    self.breaker.record_failure()
+                else:
+                    # Client errors mean the server is healthy
+                    self.breaker.record_success()
+                raise
+            except RequestException as request_error:
+                # ChunkedEncodingError, TooManyRedirects, InvalidURL, ...: not worth retrying
+                logger.info(f"OMDb request failed ({request_error})")
+                self.failures += 1
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Whatever else escapes must not leave a half-open trial unresolved
+                self.breaker.record_failure()
+                raise
+
+            self.retries += 1
+            time.sleep(self._backoff_delay(attempt))
+
+    def pool_stats(self) -> dict:
+        """Return the connection pool configuration and current usage.
+
+        Returns:
+            dict: pool_connections, pool_maxsize and per-host pools with
+                connections opened, requests served and idle connections.
+        """
+        host_pools = {}
+        pool_manager = self._adapter.poolmanager
+        for pool_key in list(pool_manager.pools.keys()):
+            connection_pool = pool_manager.pools.get(pool_key)
+            if connection_pool is None:
+                continue
+            idle_queue = getattr(connection_pool, 'pool', None)
+            host_pools[f"{connection_pool.scheme}://{connection_pool.host}:{connection_pool.port}"] = {
+                'connections_opened': connection_pool.num_connections,
+                'requests': connection_pool.num_requests,
+                'idle': idle_queue.qsize() if idle_queue is not None else 0,
+            }
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'hosts': host_pools,
+        }
+
+    def stats(self) -> dict:
+        """Return pool, breaker and request counters for metrics.
+
+        Returns:
+            dict: requests, retries, failures, short_circuits, pool and breaker.
+        """
+        return {
+            'requests': self.requests_sent,
+            'retries': self.retries,
+            'failures': self.failures,
+            'short_circuits': self.short_circuits,
+            'pool': self.pool_stats(),
+            'breaker': self.breaker.stats(),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the request counters and the circuit breaker."""
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.breaker.reset()
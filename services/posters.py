@@ -0,0 +1,312 @@
+import io
+import os
+import hashlib
+import logging
+import tempfile
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+from services.cache import MISSING, TTLCache, SingleFlight
+
+try:
+    from PIL import Image
+    PILLOW_AVAILABLE = True
+except ImportError:
+    Image = None
+    PILLOW_AVAILABLE = False
+
+# Where fetched posters and their thumbnails are stored
+POSTER_CACHE_DIR = os.getenv(
+    "POSTER_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'posters')
+)
+# Fetch settings (timeouts in seconds); larger downloads are abandoned
+POSTER_CONNECT_TIMEOUT = float(os.getenv("POSTER_CONNECT_TIMEOUT", "3.05"))
+POSTER_READ_TIMEOUT = float(os.getenv("POSTER_READ_TIMEOUT", "10"))
+POSTER_MAX_BYTES = int(os.getenv("POSTER_MAX_BYTES", str(5 * 1024 * 1024)))
+# Seconds a poster URL that could not be fetched is not retried
+POSTER_FAILURE_TTL = int(os.getenv("POSTER_FAILURE_TTL", "600"))
+# Fetch posters in the background when movies are added
+POSTER_PREFETCH = os.getenv("POSTER_PREFETCH", "true").lower() in ("1", "true", "yes")
+POSTER_PREFETCH_WORKERS = int(os.getenv("POSTER_PREFETCH_WORKERS", "2"))
+
+# Thumbnail widths in pixels; requested widths are rounded up to one of these.
+# 280 is the width of a movie card, 560 serves high-density screens.
+POSTER_WIDTHS = (140, 280, 560)
+POSTER_DEFAULT_WIDTH = 280
+POSTER_JPEG_QUALITY = 82
+
+# Cache lifetimes (in seconds) sent to browsers
+POSTER_MAX_AGE = 365 * 24 * 3600
+POSTER_PLACEHOLDER_MAX_AGE = 300
+
+POSTER_MIMETYPES = {
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'image/webp': 'webp',
+    'image/gif': 'gif',
+}
+_EXTENSION_MIMETYPES = {extension: mimetype for mimetype, extension in POSTER_MIMETYPES.items()}
+
+logger = logging.getLogger(__name__)
+
+
+class PosterFile(NamedTuple):
+    """A poster image on disk."""
+    path: str
+    mimetype: str
+
+
+def is_poster_url(poster_url: str | None) -> bool:
+    """Return whether a movie's poster value is a fetchable URL (OMDb uses "N/A" for none)."""
+    return bool(poster_url) and poster_url.startswith(('http://', 'https://'))
+
+
+def poster_version(poster_url: str) -> str:
+    """Return a short hash of a poster URL, used to version /posters/<movie_id> links.
+
+    A link carrying the current version may be cached forever by browsers: when
+    the movie's poster URL changes, pages link to a new version.
+    """
+    return hashlib.sha256(poster_url.encode('utf-8')).hexdigest()[:12]
+
+
+def snap_width(width: int | None) -> int | None:
+    """Round a requested width up to a thumbnail width.
+
+    Args:
+        width: The requested width in pixels, or None for the original image.
+
+    Returns:
+        int | None: The smallest POSTER_WIDTHS entry not below width, or None
+            (original image) when width is None or larger than all of them.
+    """
+    if width is None:
+        return None
+    for thumbnail_width in POSTER_WIDTHS:
+        if width <= thumbnail_width:
+            return thumbnail_width
+    return None
+
+
+def _write_atomically(path: str, content: bytes) -> None:
+    """Write content to path so that readers never see a partial file."""
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as temporary_file:
+            temporary_file.write(content)
+        os.replace(temporary_path, path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+        raise
+
+
+class PosterStore:
+    """Local, content-addressed copy of remote poster images.
+
+    Originals are stored once under the SHA-256 of their bytes, so movies
+    sharing an image share the file, and a small per-URL file records which
+    image a poster URL resolved to. Thumbnails are derived from the content
+    hash as well and are only produced when Pillow is installed; without it
+    the original is served for every width. Concurrent requests for the same
+    URL or thumbnail share a single fetch or resize.
+
+    Attributes:
+        directory: Root directory of the store.
+        prefetch_enabled: Whether prefetch() fetches posters in the background.
+        fetches: Number of posters downloaded.
+        fetch_failures: Number of downloads that failed.
+    """
+
+    def __init__(self, directory: str = POSTER_CACHE_DIR, prefetch_enabled: bool = POSTER_PREFETCH,
+                 max_bytes: int = POSTER_MAX_BYTES, failure_ttl: float = POSTER_FAILURE_TTL,
+                 prefetch_workers: int = POSTER_PREFETCH_WORKERS):
+        """Create the HTTP session; directories are created on first write.
+
+        Args:
+            directory: Root directory of the store.
+            prefetch_enabled: Whether prefetch() fetches posters in the background.
+            max_bytes: Largest poster downloaded, in bytes.
+            failure_ttl: Seconds a URL that could not be fetched is not retried.
+            prefetch_workers: Number of background fetch threads.
+        """
+        self.directory = directory
+        self.prefetch_enabled = prefetch_enabled
+        self.max_bytes = max_bytes
+        self.timeout = (POSTER_CONNECT_TIMEOUT, POSTER_READ_TIMEOUT)
+        self.fetches = 0
+        self.fetch_failures = 0
+        self._failed_urls = TTLCache(max_size=1024, ttl=failure_ttl)
+        self._single_flight = SingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers=prefetch_workers, thread_name_prefix='poster-prefetch')
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=prefetch_workers + 8, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def init_app(self, app):
+        """Configure the store from POSTER_CACHE_DIR and POSTER_PREFETCH.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.directory = app.config.setdefault('POSTER_CACHE_DIR', POSTER_CACHE_DIR)
+        self.prefetch_enabled = app.config.setdefault('POSTER_PREFETCH', POSTER_PREFETCH)
+        self._failed_urls.clear()
+
+    def _path(self, *parts: str) -> str:
+        """Return a path inside the store."""
+        return os.path.join(self.directory, *parts)
+
+    def _url_record_path(self, poster_url: str) -> str:
+        """Return the file recording which original a poster URL resolved to."""
+        return self._path('urls', hashlib.sha256(poster_url.encode('utf-8')).hexdigest())
+
+    def _lookup_original(self, poster_url: str) -> str | None:
+        """Return the stored original's file name for a URL, or None if not fetched yet."""
+        try:
+            with open(self._url_record_path(poster_url), encoding='ascii') as url_record:
+                original_name = url_record.read().strip()
+        except OSError:
+            return None
+        return original_name if os.path.exists(self._path('originals', original_name)) else None
+
+    def _fetch(self, poster_url: str) -> str | None:
+        """Download a poster and store it.
+
+        Returns:
+            str | None: The original's file name (<sha256>.<extension>), or None
+                if the download failed or did not return a supported image.
+        """
+        original_name = self._lookup_original(poster_url)
+        if original_name is not None:
+            return original_name
+        if self._failed_urls.get(poster_url) is not MISSING:
+            return None
+
+        try:
+            with self.session.get(poster_url, timeout=self.timeout, stream=True) as http_response:
+                http_response.raise_for_status()
+                mimetype = http_response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                extension = POSTER_MIMETYPES.get(mimetype)
+                if extension is None:
+                    raise ValueError(f"unsupported content type '{mimetype}'")
+                chunks = []
+                received_bytes = 0
+                for chunk in http_response.iter_content(chunk_size=64 * 1024):
+                    received_bytes += len(chunk)
+                    if received_bytes > self.max_bytes:
+                        raise ValueError(f"poster is larger than {self.max_bytes} bytes")
+                    chunks.append(chunk)
+            content = b''.join(chunks)
+            if not content:
+                raise ValueError("empty response")
+        except (RequestException, ValueError) as fetch_error:
+            self.fetch_failures += 1
+            self._failed_urls.set(poster_url, True)
+            logger.warning(f"Could not fetch poster {poster_url}: {fetch_error}")
+            return None
+
+        self.fetches += 1
+        original_name = f"{hashlib.sha256(content).hexdigest()}.{extension}"
+        original_path = self._path('originals', original_name)
+        os.makedirs(os.path.dirname(original_path), exist_ok=True)
+        os.makedirs(self._path('urls'), exist_ok=True)
+        if not os.path.exists(original_path):
+            _write_atomically(original_path, content)
+        _write_atomically(self._url_record_path(poster_url), original_name.encode('ascii'))
+        return original_name
+
+    def _thumbnail(self, original_name: str, width: int) -> PosterFile | None:
+        """Return the thumbnail of an original at a given width, creating it if needed.
+
+        Returns:
+            PosterFile | None: The thumbnail, or None when the original should be
+                served instead (Pillow missing, image not wider than width, or
+                an image Pillow cannot read).
+        """
+        if not PILLOW_AVAILABLE:
+            return None
+        content_hash = original_name.rsplit('.', 1)[0]
+        thumbnail_path = self._path('thumbnails', f"{content_hash}-{width}.jpg")
+        if os.path.exists(thumbnail_path):
+            return PosterFile(thumbnail_path, 'image/jpeg')
+        return self._single_flight.do(thumbnail_path, self._resize, original_name, width, thumbnail_path)
+
+    def _resize(self, original_name: str, width: int, thumbnail_path: str) -> PosterFile | None:
+        """Resize an original to width, keeping its aspect ratio, and store it as JPEG."""
+        try:
+            with Image.open(self._path('originals', original_name)) as image:
+                if image.width <= width:
+                    return None
+                height = max(1, round(image.height * width / image.width))
+                thumbnail = image.convert('RGB').resize((width, height), Image.LANCZOS)
+        except (OSError, ValueError) as image_error:
+            logger.warning(f"Could not resize poster {original_name}: {image_error}")
+            return None
+        thumbnail_bytes = io.BytesIO()
+        thumbnail.save(thumbnail_bytes, 'JPEG', quality=POSTER_JPEG_QUALITY, optimize=True, progressive=True)
+        os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+        _write_atomically(thumbnail_path, thumbnail_bytes.getvalue())
+        return PosterFile(thumbnail_path, 'image/jpeg')
+
+    def get_poster(self, poster_url: str, width: int | None = None) -> PosterFile | None:
+        """Return the local copy of a poster, fetching it on first use.
+
+        Args:
+            poster_url: The remote poster URL.
+            width: Desired width in pixels (see snap_width), or None for the original.
+
+        Returns:
+            PosterFile | None: The image to serve, or None if the poster is
+                unavailable and a placeholder should be shown.
+        """
+        if not is_poster_url(poster_url):
+            return None
+        original_name = self._lookup_original(poster_url)
+        if original_name is None:
+            original_name = self._single_flight.do(poster_url, self._fetch, poster_url)
+            if original_name is None:
+                return None
+
+        thumbnail_width = snap_width(width)
+        if thumbnail_width is not None:
+            thumbnail = self._thumbnail(original_name, thumbnail_width)
+            if thumbnail is not None:
+                return thumbnail
+        extension = original_name.rsplit('.', 1)[1]
+        return PosterFile(self._path('originals', original_name), _EXTENSION_MIMETYPES[extension])
+
+    def prefetch(self, poster_url: str | None):
+        """Fetch a poster and its card-sized thumbnail in the background.
+
+        Args:
+            poster_url: The remote poster URL; non-URLs such as "N/A" are ignored.
+
+        Returns:
+            Future | None: The background task, or None if nothing was scheduled.
+        """
+        if not self.prefetch_enabled or not is_poster_url(poster_url):
+            return None
+        return self._executor.submit(self._prefetch, poster_url)
+
+    def _prefetch(self, poster_url: str) -> None:
+        """Background task of prefetch(); errors are logged, never raised."""
+        try:
+            self.get_poster(poster_url, POSTER_DEFAULT_WIDTH)
+        except Exception as prefetch_error:
+            logger.error(f"Poster prefetch failed for {poster_url}: {prefetch_error}", exc_info=True)
+
+    def clear(self) -> None:
+        """Forget failed URLs and reset the counters; stored files are kept."""
+        self._failed_urls.clear()
+        self.fetches = 0
+        self.fetch_failures = 0
+
+
+poster_store = PosterStore()
@@ -0,0 +1,100 @@
+/**
+ * JavaScript for title suggestions on the add movie form
+ * Fills the title input's datalist from /api/movies/suggest while the user types
+ */
+
+// Milliseconds to wait after the last keystroke before fetching suggestions
+const SUGGEST_DEBOUNCE_MS = 200;
+
+// Minimum number of characters before suggestions are fetched
+const SUGGEST_MIN_CHARS = 2;
+
+/**
+ * Format a suggestion as the value submitted by the form
+ * A "(1999)" year hint lets the server pick the right movie among remakes
+ * @param {Object} suggestion - Suggestion with title and release_year
+ * @returns {string} - The option value
+ */
+function formatSuggestion(suggestion) {
+    return suggestion.release_year ? `${suggestion.title} (${suggestion.release_year})` : suggestion.title;
+}
+
+/**
+ * Fetch title suggestions for a prefix
+ * @param {string} prefix - The text typed so far
+ * @param {AbortSignal} signal - Aborts the request when a newer one starts
+ * @returns {Promise<Array<Object>>} - Promise resolving to the suggestions
+ */
+async function fetchSuggestions(prefix, signal) {
+    const response = await fetch(`/api/movies/suggest?omdb=1&prefix=${encodeURIComponent(prefix)}`, { signal });
+    const data = await response.json();
+
+    if (!response.ok || !data.success) {
+        throw new Error(data.error || 'Failed to fetch suggestions');
+    }
+
+    return data.suggestions;
+}
+
+/**
+ * Replace the options of a datalist
+ * @param {HTMLDataListElement} datalist - The datalist to fill
+ * @param {Array<Object>} suggestions - Suggestions with title and release_year
+ */
+function displaySuggestions(datalist, suggestions) {
+    datalist.replaceChildren(...suggestions.map((suggestion) => {
+        const option = document.createElement('option');
+        option.value = formatSuggestion(suggestion);
+        return option;
+    }));
+}
+
+/**
+ * Attach debounced suggestions to a title input
+ * @param {HTMLInputElement} input - The title input, with a list attribute naming its datalist
+ */
+function attachTitleSuggestions(input) {
+    const datalist = document.getElementById(input.getAttribute('list'));
+
+    if (!datalist) {
+        console.error('Suggestions datalist not found');
+        return;
+    }
+
+    let debounceTimer = null;
+    let pendingRequest = null;
+
+    input.addEventListener('input', () => {
+        clearTimeout(debounceTimer);
+        const prefix = input.value.trim();
+
+        if (prefix.length < SUGGEST_MIN_CHARS) {
+            displaySuggestions(datalist, []);
+            return;
+        }
+
+        debounceTimer = setTimeout(async () => {
+            // Only the latest request may update the list
+            if (pendingRequest) {
+                pendingRequest.abort();
+            }
+            pendingRequest = new AbortController();
+
+            try {
+                displaySuggestions(datalist, await fetchSuggestions(prefix, pendingRequest.signal));
+            } catch (error) {
+                if (error.name !== 'AbortError') {
+                    console.error('Error fetching suggestions:', error);
+                }
+            }
+        }, SUGGEST_DEBOUNCE_MS);
+    });
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const input = document.getElementById('title');
+
+    if (input) {
+        attachTitleSuggestions(input);
+    }
+});
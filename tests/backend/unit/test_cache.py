@@ -0,0 +1,179 @@
+"""
+Unit tests for the shared service caches.
+"""
+import pytest
+from unittest.mock import patch
+from services.cache import MISSING, TTLCache, SQLiteCacheStore, FileCacheStore, TieredCache, SingleFlight
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test the in-process LRU cache."""
+
+    def test_get_set(self):
+        """Test storing and reading back a value."""
+        cache = TTLCache(max_size=10, ttl=60)
+        cache.set('matrix', {'title': 'The Matrix'})
+        assert cache.get('matrix') == {'title': 'The Matrix'}
+        assert cache.hits == 1
+
+    def test_miss_returns_sentinel(self):
+        """Test that a miss returns MISSING, distinct from a cached None."""
+        cache = TTLCache(max_size=10, ttl=60)
+        assert cache.get('unknown') is MISSING
+        cache.set('not_found', None)
+        assert cache.get('not_found') is None
+        assert cache.misses == 1
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        cache = TTLCache(max_size=10, ttl=60)
+        with patch('services.cache.time.monotonic', return_value=1000.0):
+            cache.set('matrix', 'value')
+        with patch('services.cache.time.monotonic', return_value=1059.0):
+            assert cache.get('matrix') == 'value'
+        with patch('services.cache.time.monotonic', return_value=1061.0):
+            assert cache.get('matrix') is MISSING
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is MISSING
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.evictions == 1
+
+    def test_stats(self):
+        """Test the reported hit ratio."""
+        cache = TTLCache(max_size=10, ttl=60)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_ratio'] == 0.5
+
+
+@pytest.mark.unit
+class TestSQLiteCacheStore:
+    """Test the persistent SQLite cache store."""
+
+    def test_values_survive_new_instance(self, tmp_path):
+        """Test that entries persist across store instances (process restarts)."""
+        cache_path = str(tmp_path / 'cache.db')
+        SQLiteCacheStore(cache_path).set('matrix', {'title': 'The Matrix'}, ttl=60)
+        assert SQLiteCacheStore(cache_path).get('matrix') == {'title': 'The Matrix'}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that expired rows are not returned."""
+        store = SQLiteCacheStore(str(tmp_path / 'cache.db'))
+        store.set('matrix', 'value', ttl=-1)
+        assert store.get('matrix') is MISSING
+
+    def test_prune_trims_to_max_entries(self, tmp_path):
+        """Test that pruning keeps at most max_entries rows."""
+        store = SQLiteCacheStore(str(tmp_path / 'cache.db'), max_entries=2)
+        for index in range(5):
+            store.set(f'key{index}', index, ttl=60 + index)
+        store.prune()
+        assert store.get('key4') == 4
+        assert store.get('key0') is MISSING
+
+    def test_invalid_table_name(self, tmp_path):
+        """Test that table names are validated."""
+        with pytest.raises(ValueError):
+            SQLiteCacheStore(str(tmp_path / 'cache.db'), table='bad; DROP')
+
+
+@pytest.mark.unit
+class TestFileCacheStore:
+    """Test the persistent one-file-per-entry cache store."""
+
+    def test_values_survive_new_instance(self, tmp_path):
+        """Test that entries persist across store instances (process restarts)."""
+        FileCacheStore(str(tmp_path)).set('matrix', {'html': '<p>The Matrix</p>'}, ttl=60)
+        assert FileCacheStore(str(tmp_path)).get('matrix') == {'html': '<p>The Matrix</p>'}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that expired files are not returned."""
+        store = FileCacheStore(str(tmp_path))
+        store.set('matrix', 'value', ttl=-1)
+        assert store.get('matrix') is MISSING
+
+    def test_prune_trims_to_max_entries(self, tmp_path):
+        """Test that pruning keeps the max_entries files expiring last."""
+        store = FileCacheStore(str(tmp_path), max_entries=2)
+        for index in range(5):
+            store.set(f'key{index}', index, ttl=60 + index)
+        store.prune()
+        assert store.get('key4') == 4
+        assert store.get('key0') is MISSING
+        assert len(list(tmp_path.glob('*.json'))) == 2
+
+    def test_delete_and_clear(self, tmp_path):
+        """Test removing one entry and all entries."""
+        store = FileCacheStore(str(tmp_path))
+        store.set('a', 1, ttl=60)
+        store.set('b', 2, ttl=60)
+        store.delete('a')
+        store.delete('missing')
+        assert store.get('a') is MISSING
+        store.clear()
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+class TestTieredCache:
+    """Test the memory + disk cache combination."""
+
+    def test_store_hit_is_promoted_to_memory(self, tmp_path):
+        """Test that a value found only on disk is copied into memory."""
+        cache_path = str(tmp_path / 'cache.db')
+        SQLiteCacheStore(cache_path).set('matrix', 'value', ttl=60)
+        cache = TieredCache(TTLCache(max_size=10, ttl=60), SQLiteCacheStore(cache_path))
+
+        assert cache.get('matrix') == 'value'
+        assert cache.store_hits == 1
+        assert cache.memory.get('matrix') == 'value'
+
+    def test_miss_counts(self):
+        """Test hit/miss counters in memory-only mode."""
+        cache = TieredCache(TTLCache(max_size=10, ttl=60))
+        assert cache.get('a') is MISSING
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['persistent'] is False
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test call de-duplication."""
+
+    def test_sequential_calls_each_run(self):
+        """Test that calls which do not overlap each execute."""
+        flights = SingleFlight()
+        calls = []
+        flights.do('key', calls.append, 1)
+        flights.do('key', calls.append, 2)
+        assert calls == [1, 2]
+        assert flights.in_flight('key') is False
+
+    def test_exception_propagates(self):
+        """Test that the leader's exception is raised and the key released."""
+        flights = SingleFlight()
+
+        def failing_call():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flights.do('key', failing_call)
+        assert flights.in_flight('key') is False
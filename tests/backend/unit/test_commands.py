@@ -0,0 +1,101 @@
+"""
+Unit tests for the Flask CLI commands.
+"""
+import json
+import pytest
+from unittest.mock import patch
+from datamanager.data_models import Movie
+
+
+@pytest.mark.unit
+class TestImportMoviesCommand:
+    """Test `flask movies import`."""
+
+    def test_import_csv_with_omdb_columns(self, app, runner, tmp_path):
+        """Test importing a CSV that uses OMDb column names."""
+        import_path = tmp_path / 'movies.csv'
+        import_path.write_text(
+            'Title,Year,Director,imdbRating,Poster\n'
+            'The Matrix,1999,Lana Wachowski,8.7,http://example.com/matrix.jpg\n'
+            'Firefly,2002–2003,Joss Whedon,9.0,N/A\n'
+        )
+
+        result = runner.invoke(args=['movies', 'import', str(import_path), '--no-omdb'])
+
+        assert result.exit_code == 0, result.output
+        assert 'Imported 2 movies' in result.output
+        with app.app_context():
+            firefly = Movie.query.filter_by(title='Firefly').one()
+            assert firefly.release_year == 2002
+            assert firefly.poster is None
+            assert firefly.rating == 9.0
+
+    def test_import_upserts_on_title_and_year(self, app, runner, tmp_path, sample_movie):
+        """Test that existing movies are updated and duplicates collapse to one row."""
+        import_path = tmp_path / 'movies.ndjson'
+        import_path.write_text(
+            json.dumps({'title': 'The Matrix', 'release_year': 1999, 'director': 'Wachowskis', 'rating': 8.8}) + '\n'
+            + json.dumps({'title': 'The Matrix', 'release_year': 2021, 'director': 'Lana Wachowski', 'rating': 5.7})
+            + '\n\nnot json\n'
+        )
+
+        result = runner.invoke(args=['movies', 'import', str(import_path), '--no-omdb', '--chunk-size', '1'])
+
+        assert result.exit_code == 0, result.output
+        assert '1 inserted, 1 updated, 1 skipped' in result.output
+        with app.app_context():
+            movies = Movie.query.filter_by(title='The Matrix').order_by(Movie.release_year).all()
+            assert [(movie.release_year, movie.rating) for movie in movies] == [(1999, 8.8), (2021, 5.7)]
+            # Columns missing from the input keep their stored values
+            assert movies[0].poster == sample_movie.poster
+
+    def test_omdb_only_for_incomplete_rows(self, app, runner, tmp_path):
+        """Test that OMDb is queried only for rows lacking metadata."""
+        import_path = tmp_path / 'movies.csv'
+        import_path.write_text(
+            'title,release_year,director,rating\n'
+            'Inception,2010,Christopher Nolan,8.8\n'
+            'Alien,,,\n'
+            'Unknown Movie,,,\n'
+        )
+        omdb_results = {
+            'Alien': {'title': 'Alien', 'release_year': '1979', 'director': 'Ridley Scott',
+                      'rating': '8.5', 'poster': 'http://example.com/alien.jpg'},
+            'Unknown Movie': None,
+        }
+
+        with patch('commands.fetch_movies_data', return_value=omdb_results) as mock_fetch:
+            result = runner.invoke(args=['movies', 'import', str(import_path)])
+
+        assert result.exit_code == 0, result.output
+        mock_fetch.assert_called_once_with(['Alien', 'Unknown Movie'])
+        assert '2 inserted, 0 updated, 1 skipped' in result.output
+        with app.app_context():
+            alien = Movie.query.filter_by(title='Alien').one()
+            assert (alien.release_year, alien.director, alien.rating) == (1979, 'Ridley Scott', 8.5)
+
+    def test_omdb_lookup_uses_row_year(self, app, runner, tmp_path):
+        """Test that rows of one title with different years are completed from their own release."""
+        import_path = tmp_path / 'movies.csv'
+        import_path.write_text(
+            'title,release_year,director,rating\n'
+            'Dune,1984,,\n'
+            'Dune,2021,,\n'
+        )
+        omdb_results = {
+            ('Dune', 1984): {'title': 'Dune', 'release_year': '1984', 'director': 'David Lynch',
+                             'rating': '6.3', 'poster': 'N/A'},
+            ('Dune', 2021): {'title': 'Dune', 'release_year': '2021', 'director': 'Denis Villeneuve',
+                             'rating': '8.0', 'poster': 'N/A'},
+        }
+
+        with patch('commands.fetch_movies_data', return_value=omdb_results) as mock_fetch:
+            result = runner.invoke(args=['movies', 'import', str(import_path)])
+
+        assert result.exit_code == 0, result.output
+        mock_fetch.assert_called_once_with([('Dune', 1984), ('Dune', 2021)])
+        with app.app_context():
+            movies = Movie.query.filter_by(title='Dune').order_by(Movie.release_year).all()
+            assert [(movie.release_year, movie.director, movie.rating) for movie in movies] == [
+                (1984, 'David Lynch', 6.3), (2021, 'Denis Villeneuve', 8.0)
+            ]
@@ -0,0 +1,44 @@
+"""
+Unit tests for application configuration.
+"""
+import pytest
+from sqlalchemy import text
+from config import load_sqlite_pragmas, SQLITE_PRAGMA_DEFAULTS
+from extensions import db
+
+
+@pytest.mark.unit
+class TestSQLitePragmas:
+    """Test SQLite connection tuning."""
+
+    def test_defaults(self, monkeypatch):
+        """Test that the defaults are used without environment overrides."""
+        for pragma_name in SQLITE_PRAGMA_DEFAULTS:
+            monkeypatch.delenv(f'SQLITE_{pragma_name.upper()}', raising=False)
+        assert load_sqlite_pragmas() == SQLITE_PRAGMA_DEFAULTS
+
+    def test_environment_override(self, monkeypatch):
+        """Test overriding and disabling pragmas from the environment."""
+        monkeypatch.setenv('SQLITE_SYNCHRONOUS', 'FULL')
+        monkeypatch.setenv('SQLITE_MMAP_SIZE', '')
+        sqlite_pragmas = load_sqlite_pragmas()
+        assert sqlite_pragmas['synchronous'] == 'FULL'
+        assert 'mmap_size' not in sqlite_pragmas
+
+    def test_invalid_value_rejected(self, monkeypatch):
+        """Test that values which are not plain words or numbers are rejected."""
+        monkeypatch.setenv('SQLITE_JOURNAL_MODE', 'WAL; DROP TABLE user')
+        with pytest.raises(ValueError, match="SQLITE_JOURNAL_MODE"):
+            load_sqlite_pragmas()
+
+    def test_pragmas_applied_on_connect(self, app):
+        """Test that new connections run with the configured pragmas."""
+        with app.app_context():
+            assert db.session.execute(text("PRAGMA journal_mode")).scalar() == 'wal'
+            assert db.session.execute(text("PRAGMA foreign_keys")).scalar() == 1
+            assert db.session.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+    def test_engine_options(self, app):
+        """Test that explicit pool options are configured."""
+        engine_options = app.config['SQLALCHEMY_ENGINE_OPTIONS']
+        assert {'pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle'} <= set(engine_options)
@@ -2,9 +2,12 @@
 Unit tests for SQLiteDataManager.
 """
 import pytest
+from unittest.mock import patch
+from sqlalchemy.exc import IntegrityError
 from datamanager.data_models import User, Movie, UserMovies
 from extensions import db
 from datamanager import data_manager
+from datamanager.snapshots import IdentityCache, UserSnapshot, MovieSnapshot
 
 
 @pytest.mark.unit
@@ -65,6 +68,34 @@ class TestDataManagerUsers:
                 data_manager.get_user(sample_user.id)
 
 
+@pytest.mark.unit
+class TestDataManagerReadRows:
+    """Test that the read-only listings are served from projected rows."""
+
+    def test_listings_return_untracked_snapshots(self, app, db_session, sample_user, sample_movie,
+                                                 sample_user_movie):
+        """Test that pages and collections come back as snapshots without entering the identity map."""
+        user_id, movie_id = sample_user.id, sample_movie.id
+        db_session.expunge_all()
+
+        users = data_manager.get_users_page().items
+        movies = data_manager.get_movies_page().items
+        found_movies = data_manager.search_movies('matrix').items
+        user_movies = data_manager.get_user_movies(user_id)
+        assert users == [UserSnapshot(user_id, 'Test User')]
+        assert movies == found_movies == [
+            MovieSnapshot(movie_id, 'The Matrix', 1999, 'https://example.com/poster.jpg',
+                          'Lana Wachowski, Lilly Wachowski', 8.7)
+        ]
+        assert user_movies[0]['id'] == movie_id and user_movies[0]['user_rating'] == 9.0
+        assert len(db_session.identity_map) == 0
+
+    def test_full_listings_return_orm_objects(self, app, db_session, sample_user, sample_movie):
+        """Test that get_all_users and get_all_movies keep returning session-bound models."""
+        assert isinstance(data_manager.get_all_users()[0], User)
+        assert isinstance(data_manager.get_all_movies()[0], Movie)
+
+
 @pytest.mark.unit
 class TestDataManagerMovies:
     """Test movie-related methods in SQLiteDataManager."""
@@ -134,3 +165,643 @@ class TestDataManagerUpdateMovie:
             with pytest.raises(ValueError, match="User has not added movie"):
                 data_manager.update_movie(999, sample_user.id, 8.0)
 
+
+
+@pytest.mark.unit
+class TestDataManagerAddMovie:
+    """Test the single-transaction add_movie upsert."""
+
+    MATRIX_DATA = {'title': 'The Matrix', 'director': 'Lana Wachowski', 'rating': '8.7',
+                   'release_year': '1999', 'poster': 'https://example.com/matrix.jpg'}
+
+    def test_add_movie_added_then_linked(self, app, sample_user):
+        """Test the added/linked contract and that the movie row is reused."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=self.MATRIX_DATA):
+                first_result = data_manager.add_movie(sample_user.id, 'The Matrix')
+                second_result = data_manager.add_movie(sample_user.id, 'the matrix')
+
+            assert first_result['message'] == 'added'
+            assert second_result['message'] == 'linked'
+            assert first_result['movie'].id == second_result['movie'].id
+            assert first_result['movie'].release_year == 1999
+            assert UserMovies.query.one().user_rating == 8.7
+
+    def test_add_existing_movie_for_another_user(self, app, sample_user, sample_movie):
+        """Test that a second user is linked to the existing movie row."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=self.MATRIX_DATA):
+                result = data_manager.add_movie(sample_user.id, 'The Matrix')
+
+            assert result['message'] == 'added'
+            assert result['movie'].id == sample_movie.id
+            assert Movie.query.count() == 1
+
+    def test_add_movie_not_found(self, app, sample_user):
+        """Test that unknown titles are reported without touching the database."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=None):
+                assert data_manager.add_movie(sample_user.id, 'Unknown') == {'message': 'not_found', 'movie': None}
+            assert Movie.query.count() == 0
+
+    def test_duplicate_movie_rejected_by_schema(self, app, db_session, sample_movie):
+        """Test that (title, release_year) is unique."""
+        db_session.add(Movie(title=sample_movie.title, release_year=sample_movie.release_year, rating=1.0))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
+
+    def test_duplicate_movie_without_year_rejected_by_schema(self, app, db_session):
+        """Test that titles are unique among movies without a release year."""
+        db_session.add(Movie(title='Untitled Project', release_year=None, rating=1.0))
+        db_session.commit()
+        db_session.add(Movie(title='Untitled Project', release_year=None, rating=2.0))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
+
+    def test_add_movie_without_year_upserts(self, app, sample_user):
+        """Test that re-adding a movie without a release year updates the existing row."""
+        untitled_data = {'title': 'Untitled Project', 'director': 'Someone', 'rating': '6.0',
+                         'release_year': None, 'poster': 'N/A'}
+        with app.app_context():
+            with patch.object(data_manager, 'always_refresh', True), \
+                    patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=untitled_data):
+                first_result = data_manager.add_movie(sample_user.id, 'Untitled Project')
+                untitled_data['director'] = 'Someone Else'
+                second_result = data_manager.add_movie(sample_user.id, 'Untitled Project')
+
+            assert (first_result['message'], second_result['message']) == ('added', 'linked')
+            assert first_result['movie'].id == second_result['movie'].id
+            assert Movie.query.one().director == 'Someone Else'
+
+
+@pytest.mark.unit
+class TestDataManagerLocalFirst:
+    """Test that titles in the local catalog are resolved without OMDb."""
+
+    def test_local_title_skips_omdb(self, app, sample_user, sample_movie):
+        """Test that an article/case variant of a local title is linked without a lookup."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data') as mock_fetch:
+                result = data_manager.add_movie(sample_user.id, 'matrix, the')
+
+            mock_fetch.assert_not_called()
+            assert result['message'] == 'added'
+            assert result['movie'].id == sample_movie.id
+            assert UserMovies.query.one().user_rating == sample_movie.rating
+
+    def test_year_hint_disambiguates(self, app, db_session, sample_user):
+        """Test that remakes are told apart by a "(year)" hint and otherwise go to OMDb."""
+        db_session.add_all([Movie(title='Dune', release_year=1984, rating=6.3),
+                            Movie(title='Dune', release_year=2021, rating=8.0)])
+        db_session.commit()
+
+        assert data_manager.find_movie_by_title('Dune (2021)').release_year == 2021
+        assert data_manager.find_movie_by_title('dune', release_year=1984).rating == 6.3
+        assert data_manager.find_movie_by_title('Dune') is None
+
+    def test_always_refresh_uses_omdb(self, app, sample_user, sample_movie):
+        """Test that always_refresh bypasses the catalog and refreshes metadata."""
+        omdb_data = {'title': 'The Matrix', 'director': 'The Wachowskis', 'rating': '8.8',
+                     'release_year': '1999', 'poster': 'https://example.com/new.jpg'}
+        with app.app_context():
+            with patch.object(data_manager, 'always_refresh', True), \
+                    patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=omdb_data) as mock_fetch:
+                result = data_manager.add_movie(sample_user.id, 'The Matrix')
+
+            mock_fetch.assert_called_once_with('The Matrix', None)
+            assert result['movie'].id == sample_movie.id
+            assert (result['movie'].director, result['movie'].rating) == ('The Wachowskis', 8.8)
+
+    def test_batch_looks_up_only_unknown_titles(self, app, sample_user, sample_movie):
+        """Test that batch imports query OMDb only for titles missing locally."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data',
+                       return_value={'Alien': None}) as mock_fetch:
+                results = data_manager.add_movies(sample_user.id, ['the matrix', 'Alien'])
+
+            mock_fetch.assert_called_once_with(['Alien'])
+            assert [result['message'] for result in results] == ['added', 'not_found']
+
+
+@pytest.mark.unit
+class TestDataManagerAddMovies:
+    """Test adding many movies in one transaction."""
+
+    @staticmethod
+    def _omdb_data(title, year):
+        return {'title': title, 'director': 'Director', 'rating': '7.5',
+                'release_year': year, 'poster': 'N/A'}
+
+    def test_add_movies_creates_movies_and_links(self, app, sample_user):
+        """Test that new movies and links are created."""
+        omdb_results = {
+            'inception': self._omdb_data('Inception', '2010'),
+            'Interstellar': self._omdb_data('Interstellar', '2014'),
+        }
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data', return_value=omdb_results):
+                results = data_manager.add_movies(sample_user.id, ['inception', 'Interstellar'])
+
+            assert [result['message'] for result in results] == ['added', 'added']
+            assert Movie.query.count() == 2
+            movies = data_manager.get_user_movies(sample_user.id)
+            assert {movie['title'] for movie in movies} == {'Inception', 'Interstellar'}
+            assert movies[0]['user_rating'] == 7.5
+
+    def test_add_movies_reuses_existing_movie(self, app, sample_user, sample_movie):
+        """Test that an existing movie is linked rather than duplicated."""
+        omdb_results = {'The Matrix': self._omdb_data('The Matrix', '1999')}
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data', return_value=omdb_results):
+                results = data_manager.add_movies(sample_user.id, ['The Matrix'])
+
+            assert results[0]['message'] == 'added'
+            assert results[0]['movie'].id == sample_movie.id
+            assert Movie.query.count() == 1
+
+    def test_add_movies_duplicate_titles_in_batch(self, app, sample_user):
+        """Test that a title repeated in the batch is linked once."""
+        inception = self._omdb_data('Inception', '2010')
+        omdb_results = {'Inception': inception, 'inception': inception}
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data', return_value=omdb_results):
+                results = data_manager.add_movies(sample_user.id, ['Inception', 'inception'])
+
+            assert [result['message'] for result in results] == ['added', 'linked']
+            assert UserMovies.query.count() == 1
+
+    def test_add_movies_same_title_two_release_years(self, app, sample_user):
+        """Test that "Title (Year)" inputs sharing a title are looked up and stored per year."""
+        omdb_results = {
+            ('Dune', 1984): self._omdb_data('Dune', '1984'),
+            ('Dune', 2021): self._omdb_data('Dune', '2021'),
+        }
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data',
+                       return_value=omdb_results) as mock_fetch:
+                results = data_manager.add_movies(sample_user.id, ['Dune (1984)', 'Dune (2021)'])
+
+            mock_fetch.assert_called_once_with([('Dune', 1984), ('Dune', 2021)])
+            assert [result['message'] for result in results] == ['added', 'added']
+            assert sorted(movie.release_year for movie in Movie.query.filter_by(title='Dune')) == [1984, 2021]
+
+    def test_add_movies_survives_concurrent_insert(self, app, sample_user):
+        """Test that a movie inserted by another connection during the OMDb lookup is reused."""
+        def lookup_while_another_process_adds(titles):
+            with db.engine.begin() as other_connection:
+                other_connection.execute(Movie.__table__.insert().values(
+                    title='Inception', release_year=2010, director='Someone', rating=7.0))
+            return {'Inception': self._omdb_data('Inception', '2010'),
+                    'Interstellar': self._omdb_data('Interstellar', '2014')}
+
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data',
+                       side_effect=lookup_while_another_process_adds):
+                results = data_manager.add_movies(sample_user.id, ['Inception', 'Interstellar'])
+
+            assert [result['message'] for result in results] == ['added', 'added']
+            assert Movie.query.count() == 2
+            assert Movie.query.filter_by(title='Inception').one().director == 'Director'
+
+    def test_add_movies_not_found(self, app, sample_user):
+        """Test that unknown titles are reported as not_found."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movies_data', return_value={'Unknown': None}):
+                results = data_manager.add_movies(sample_user.id, ['Unknown'])
+
+            assert results == [{'title': 'Unknown', 'message': 'not_found', 'movie': None}]
+
+
+@pytest.mark.unit
+class TestDataManagerUpsertMovies:
+    """Test bulk catalog upserts."""
+
+    @staticmethod
+    def _row(title, release_year, rating, director=None):
+        return {'title': title, 'release_year': release_year, 'poster': None,
+                'director': director, 'rating': rating}
+
+    def test_upsert_counts_and_keeps_missing_columns(self, app, db_session, sample_movie):
+        """Test that inserts and updates are counted and absent values keep stored ones."""
+        counts = data_manager.upsert_movies([self._row('The Matrix', 1999, 8.8), self._row('Heat', 1995, 8.3),
+                                             self._row('Untitled Project', None, 5.0)])
+
+        assert counts == {'inserted': 2, 'updated': 1}
+        matrix = db_session.get(Movie, sample_movie.id)
+        db_session.refresh(matrix)
+        assert (matrix.rating, matrix.poster) == (8.8, sample_movie.poster)
+
+    def test_upsert_without_year_updates_existing_row(self, app, db_session):
+        """Test that rows without a release year upsert on the title."""
+        data_manager.upsert_movies([self._row('Untitled Project', None, 5.0)])
+        counts = data_manager.upsert_movies([self._row('Untitled Project', None, 6.0, director='Someone')])
+
+        assert counts == {'inserted': 0, 'updated': 1}
+        assert [(movie.rating, movie.director) for movie in Movie.query.all()] == [(6.0, 'Someone')]
+
+    def test_upsert_survives_concurrent_insert(self, app, db_session):
+        """Test that movies another connection inserts while the import runs are updated, not duplicated."""
+        original_bump = data_manager._bump_data_versions
+
+        def insert_from_another_process_then_bump(*scopes):
+            with db.engine.begin() as other_connection:
+                other_connection.execute(Movie.__table__.insert(), [
+                    {'title': 'Heat', 'release_year': 1995, 'rating': 1.0},
+                    {'title': 'Untitled Project', 'release_year': None, 'rating': 1.0},
+                ])
+            original_bump(*scopes)
+
+        with patch.object(data_manager, '_bump_data_versions', side_effect=insert_from_another_process_then_bump):
+            counts = data_manager.upsert_movies([self._row('Heat', 1995, 8.3), self._row('Untitled Project', None, 5.0),
+                                                 self._row('Ronin', 1998, 7.2)])
+
+        assert counts == {'inserted': 1, 'updated': 2}
+        assert sorted((movie.title, movie.rating) for movie in Movie.query.all()) == [
+            ('Heat', 8.3), ('Ronin', 7.2), ('Untitled Project', 5.0)
+        ]
+
+
+@pytest.mark.unit
+class TestDataManagerDeleteUsers:
+    """Test set-based user deletion and orphaned movie cleanup."""
+
+    @staticmethod
+    def _create_user_with_movies(db_session, name, movies):
+        user = User(name=name)
+        db_session.add(user)
+        db_session.flush()
+        for movie in movies:
+            db_session.add(UserMovies(user_id=user.id, movie_id=movie.id, user_rating=5.0))
+        db_session.commit()
+        return user
+
+    @staticmethod
+    def _create_movies(db_session, *titles):
+        movies = [Movie(title=title, release_year=2000, rating=7.0) for title in titles]
+        db_session.add_all(movies)
+        db_session.commit()
+        return movies
+
+    def test_delete_user_removes_orphaned_movies_only(self, app, db_session):
+        """Test that movies still linked to other users are kept."""
+        shared_movie, own_movie = self._create_movies(db_session, 'Shared', 'Own')
+        alice = self._create_user_with_movies(db_session, 'Alice', [shared_movie, own_movie])
+        self._create_user_with_movies(db_session, 'Bob', [shared_movie])
+
+        assert data_manager.delete_user(alice.id) == 'Alice'
+
+        assert {movie.title for movie in Movie.query.all()} == {'Shared'}
+        assert UserMovies.query.filter_by(user_id=alice.id).count() == 0
+        assert UserMovies.query.count() == 1
+
+    def test_delete_user_not_found(self, app):
+        """Test deleting a non-existent user raises ValueError."""
+        with app.app_context():
+            with pytest.raises(ValueError, match="No user found with ID"):
+                data_manager.delete_user(999)
+
+    def test_delete_users_bulk(self, app, db_session):
+        """Test deleting several users at once."""
+        shared_movie, alice_movie, carol_movie = self._create_movies(db_session, 'Shared', 'A', 'C')
+        alice = self._create_user_with_movies(db_session, 'Alice', [shared_movie, alice_movie])
+        bob = self._create_user_with_movies(db_session, 'Bob', [shared_movie])
+        self._create_user_with_movies(db_session, 'Carol', [carol_movie])
+
+        deleted_names = data_manager.delete_users([alice.id, bob.id, 999])
+
+        assert sorted(deleted_names) == ['Alice', 'Bob']
+        assert [user.name for user in User.query.all()] == ['Carol']
+        assert [movie.title for movie in Movie.query.all()] == ['C']
+        assert UserMovies.query.count() == 1
+
+    def test_delete_users_empty(self, app):
+        """Test that an empty id list is a no-op."""
+        with app.app_context():
+            assert data_manager.delete_users([]) == []
+
+
+@pytest.mark.unit
+class TestDataManagerPagination:
+    """Test keyset-paginated listings."""
+
+    @staticmethod
+    def _collect_pages(fetch_page, **kwargs):
+        """Follow next cursors until the last page and return all items."""
+        items, cursor = [], None
+        while True:
+            page = fetch_page(cursor=cursor, **kwargs)
+            items.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return items
+
+    def test_users_pages_cover_all_users(self, app, db_session):
+        """Test that walking all user pages returns every user once, in id order."""
+        db_session.add_all([User(name=f'User {index}') for index in range(7)])
+        db_session.commit()
+
+        first_page = data_manager.get_users_page(limit=3)
+        assert len(first_page.items) == 3
+        assert first_page.next_cursor is not None
+
+        users = self._collect_pages(data_manager.get_users_page, limit=3)
+        assert [user.name for user in users] == [f'User {index}' for index in range(7)]
+
+    @pytest.mark.parametrize('sort, attribute', [
+        ('title', 'title'), ('year', 'release_year'), ('rating', 'rating')
+    ])
+    @pytest.mark.parametrize('descending', [False, True])
+    def test_movie_pages_are_stable(self, app, db_session, sort, attribute, descending):
+        """Test that pages follow (sort column, id) order, including ties and NULL years."""
+        db_session.add_all([
+            Movie(title=f'Movie {index % 3}', release_year=None if index % 4 == 0 else 1990 + index // 3,
+                  rating=float(index % 2), director='Director')
+            for index in range(11)
+        ])
+        db_session.commit()
+
+        movies = self._collect_pages(data_manager.get_movies_page, limit=2,
+                                     sort=sort, descending=descending)
+
+        # SQLite orders NULLs first ascending, last descending
+        def sort_key(movie):
+            value = getattr(movie, attribute)
+            return (value is not None, value if value is not None else 0, movie.id)
+
+        expected = sorted(Movie.query.all(), key=sort_key, reverse=descending)
+        assert [movie.id for movie in movies] == [movie.id for movie in expected]
+
+    def test_user_with_movies_pages(self, app, db_session, sample_user):
+        """Test that the user page loader returns the user and every movie once, in id order."""
+        movies = [Movie(title=f'Movie {index}', rating=7.0) for index in range(5)]
+        db_session.add_all(movies)
+        db_session.flush()
+        db_session.add_all([UserMovies(user_id=sample_user.id, movie_id=movie.id, user_rating=float(index))
+                            for index, movie in enumerate(movies)])
+        db_session.commit()
+
+        first_page = data_manager.get_user_with_movies(sample_user.id, limit=2)
+        assert first_page.user.name == 'Test User'
+        assert first_page.movies[0] == (movies[0].id, 'Movie 0', None, None, None, 7.0, 0.0)
+
+        pages, cursor = [], None
+        while True:
+            page = data_manager.get_user_with_movies(sample_user.id, limit=2, cursor=cursor)
+            pages.append(page.movies)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert [len(movies_page) for movies_page in pages] == [2, 2, 1]
+        assert [movie.user_rating for movies_page in pages for movie in movies_page] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_user_with_movies_empty_and_missing(self, app, db_session, sample_user):
+        """Test a user without movies and a missing user."""
+        page = data_manager.get_user_with_movies(sample_user.id)
+        assert page.user.id == sample_user.id
+        assert page.movies == [] and page.next_cursor is None
+
+        with pytest.raises(ValueError, match="No user found"):
+            data_manager.get_user_with_movies(999)
+
+    def test_invalid_sort(self, app):
+        """Test that unknown sort keys raise ValueError."""
+        with app.app_context():
+            with pytest.raises(ValueError, match="Invalid sort"):
+                data_manager.get_movies_page(sort='poster')
+
+    def test_cursor_from_other_sort_rejected(self, app, db_session):
+        """Test that a cursor is only valid for the ordering that produced it."""
+        db_session.add_all([Movie(title=f'Movie {index}', rating=7.0) for index in range(3)])
+        db_session.commit()
+        cursor = data_manager.get_movies_page(limit=1, sort='title').next_cursor
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            data_manager.get_movies_page(limit=1, sort='rating', cursor=cursor)
+
+
+@pytest.mark.unit
+class TestDataManagerSearch:
+    """Test full-text movie search."""
+
+    @pytest.fixture
+    def catalog(self, db_session):
+        """Add a small catalog to search."""
+        movies = [
+            Movie(title='The Matrix', release_year=1999, director='Lana Wachowski', rating=8.7),
+            Movie(title='Amélie', release_year=2001, director='Jean-Pierre Jeunet', rating=8.3),
+            Movie(title='Inception', release_year=2010, director='Christopher Nolan', rating=8.8),
+            Movie(title='Matrix Revisited', release_year=2001, director='Josh Oreck', rating=7.3),
+            Movie(title='Following', release_year=1998, director='Christopher Nolan', rating=7.5),
+        ]
+        db_session.add_all(movies)
+        db_session.commit()
+        return movies
+
+    def test_prefix_match_on_every_word(self, app, catalog):
+        """Test that all words must match as prefixes of title or director words."""
+        titles = {movie.title for movie in data_manager.search_movies('matr wach').items}
+        assert titles == {'The Matrix'}
+
+    def test_diacritics_ignored(self, app, catalog):
+        """Test that accented titles match unaccented queries."""
+        assert [movie.title for movie in data_manager.search_movies('amelie').items] == ['Amélie']
+
+    def test_title_matches_rank_above_director_matches(self, app, db_session, catalog):
+        """Test that a title match outranks a director-only match."""
+        db_session.add(Movie(title='Memento', director='Nolan Fan', rating=6.0))
+        db_session.add(Movie(title='Nolan', director='Someone', rating=6.0))
+        db_session.commit()
+
+        titles = [movie.title for movie in data_manager.search_movies('nolan').items]
+        assert titles[0] == 'Nolan'
+        assert set(titles) == {'Nolan', 'Memento', 'Inception', 'Following'}
+
+    def test_index_follows_updates_and_deletes(self, app, db_session, catalog):
+        """Test that the triggers keep the index in sync with the movie table."""
+        matrix = catalog[0]
+        matrix.title = 'Speed Racer'
+        db_session.delete(catalog[3])
+        db_session.commit()
+
+        assert data_manager.search_movies('matrix').items == []
+        assert [movie.id for movie in data_manager.search_movies('racer').items] == [matrix.id]
+
+    def test_pages_cover_all_matches(self, app, db_session):
+        """Test that following cursors returns every match once."""
+        db_session.add_all([Movie(title=f'Star {index}', rating=7.0) for index in range(7)])
+        db_session.commit()
+
+        movie_ids, cursor = [], None
+        while True:
+            page = data_manager.search_movies('star', limit=3, cursor=cursor)
+            movie_ids.extend(movie.id for movie in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert sorted(movie_ids) == sorted(movie.id for movie in Movie.query.all())
+        assert len(movie_ids) == 7
+
+    def test_cursor_from_other_query_rejected(self, app, db_session):
+        """Test that a cursor is only valid for the query that produced it."""
+        db_session.add_all([Movie(title=f'Star {index}', rating=7.0) for index in range(3)])
+        db_session.commit()
+        cursor = data_manager.search_movies('star', limit=1).next_cursor
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            data_manager.search_movies('sta', limit=1, cursor=cursor)
+
+
+@pytest.mark.unit
+class TestDataManagerSuggest:
+    """Test title suggestions and their index maintenance."""
+
+    def test_index_loaded_on_first_use(self, app, sample_movie):
+        """Test that existing catalog titles are suggested."""
+        suggestions = data_manager.suggest_titles('matr')
+        assert [(suggestion.movie_id, suggestion.title) for suggestion in suggestions] == \
+            [(sample_movie.id, 'The Matrix')]
+
+    @patch('datamanager.sqlite_data_manager.fetch_movie_data')
+    def test_added_and_deleted_movies_update_index(self, mock_fetch, app, db_session, sample_user):
+        """Test that add_movie and delete_movie update the loaded index in place."""
+        assert data_manager.suggest_titles('incep') == []
+        mock_fetch.return_value = {'title': 'Inception', 'release_year': '2010', 'director': 'Christopher Nolan',
+                                   'rating': '8.8', 'poster': 'N/A'}
+
+        with patch.object(data_manager, '_load_title_index') as mock_load:
+            movie = data_manager.add_movie(sample_user.id, 'Inception')['movie']
+            assert [suggestion.title for suggestion in data_manager.suggest_titles('incep')] == ['Inception']
+
+            data_manager.delete_movie(sample_user.id, movie.id)
+            assert data_manager.suggest_titles('incep') == []
+            mock_load.assert_not_called()
+
+    def test_bulk_import_reloads_index(self, app, db_session):
+        """Test that upsert_movies invalidates the index."""
+        assert data_manager.suggest_titles('heat') == []
+        data_manager.upsert_movies([{'title': 'Heat', 'release_year': 1995, 'poster': None,
+                                     'director': 'Michael Mann', 'rating': 8.3}])
+        assert [suggestion.title for suggestion in data_manager.suggest_titles('heat')] == ['Heat']
+
+    def test_deleted_user_movies_leave_index(self, app, sample_user, sample_movie, sample_user_movie):
+        """Test that movies orphaned by deleting a user are no longer suggested."""
+        assert data_manager.suggest_titles('matr')
+        data_manager.delete_user(sample_user.id)
+        assert data_manager.suggest_titles('matr') == []
+
+
+@pytest.mark.unit
+class TestDataManagerDataVersions:
+    """Test the change counters bumped by writes."""
+
+    @staticmethod
+    def _versions(*scopes):
+        """Return the counter of each scope."""
+        return {scope: version for scope, (version, _) in data_manager.get_data_versions(scopes).items()}
+
+    def test_unwritten_scopes(self, app, db_session):
+        """Test that table-wide scopes start at 1 and unwritten user scopes at 0."""
+        versions = data_manager.get_data_versions(['users', 'movies', 'user:1'])
+        assert versions['users'][0] == versions['movies'][0] == 1
+        assert versions['users'][1] is not None
+        assert versions['user:1'] == (0, None)
+
+    def test_user_writes_bump_user_scopes(self, app, db_session):
+        """Test that adding and renaming users bump the user list and the user's scope."""
+        data_manager.add_user('Alice')
+        user_id = data_manager.get_user_by_name('Alice').id
+        data_manager.update_user(user_id, 'Alicia')
+
+        assert self._versions('users', f'user:{user_id}', 'movies') == {
+            'users': 3, f'user:{user_id}': 1, 'movies': 1
+        }
+
+    def test_movie_writes_bump_collection_and_catalog(self, app, db_session, sample_user, sample_movie,
+                                                      sample_user_movie):
+        """Test rating and removing a movie."""
+        user_scope = f'user:{sample_user.id}'
+        data_manager.update_movie(sample_movie.id, sample_user.id, rating=7.0)
+        assert self._versions(user_scope, 'movies') == {user_scope: 1, 'movies': 1}
+
+        data_manager.delete_movie(sample_user.id, sample_movie.id)
+        assert self._versions(user_scope, 'movies') == {user_scope: 2, 'movies': 2}
+
+    def test_failed_write_does_not_bump(self, app, db_session, sample_user):
+        """Test that counters roll back with a failed write."""
+        with pytest.raises(ValueError):
+            data_manager.update_movie(999, sample_user.id, rating=7.0)
+        assert self._versions(f'user:{sample_user.id}') == {f'user:{sample_user.id}': 0}
+
+    def test_import_bumps_catalog(self, app, db_session):
+        """Test that bulk imports bump the catalog scope."""
+        data_manager.upsert_movies([{'title': 'Heat', 'release_year': 1995, 'poster': None,
+                                     'director': 'Michael Mann', 'rating': 8.3}])
+        assert self._versions('movies') == {'movies': 2}
+
+
+@pytest.mark.unit
+class TestDataManagerIdentityCache:
+    """Test the snapshot cache behind get_user and get_movie."""
+
+    def test_snapshots_are_cached(self, app, db_session, sample_user, sample_movie):
+        """Test that repeated lookups return one immutable snapshot without querying again."""
+        user = data_manager.get_user(sample_user.id)
+        assert user == UserSnapshot(sample_user.id, 'Test User')
+        assert data_manager.get_user(sample_user.id) is user
+        with pytest.raises(AttributeError):
+            user.name = 'Changed'
+
+        movie = data_manager.get_movie(sample_movie.id)
+        assert isinstance(movie, MovieSnapshot) and movie.title == 'The Matrix'
+        with patch.object(data_manager, '_load_movie_snapshot') as mock_load:
+            assert data_manager.get_movie(sample_movie.id) is movie
+            mock_load.assert_not_called()
+
+        stats = data_manager.get_identity_cache_stats()
+        assert stats['users']['hits'] == 1 and stats['users']['misses'] == 1
+        assert stats['movies']['hit_ratio'] == 0.5
+
+    def test_missing_rows_are_not_cached(self, app, db_session):
+        """Test that a lookup of a missing row is retried."""
+        with pytest.raises(ValueError):
+            data_manager.get_user(1)
+        data_manager.add_user('Alice')
+        assert data_manager.get_user(1).name == 'Alice'
+
+    def test_user_writes_invalidate(self, app, db_session, sample_user, sample_movie, sample_user_movie):
+        """Test that renaming and deleting a user drop the user's and orphaned movies' snapshots."""
+        data_manager.get_user(sample_user.id)
+        data_manager.update_user(sample_user.id, 'Renamed')
+        assert data_manager.get_user(sample_user.id).name == 'Renamed'
+
+        data_manager.get_movie(sample_movie.id)
+        data_manager.delete_user(sample_user.id)
+        with pytest.raises(ValueError):
+            data_manager.get_user(sample_user.id)
+        with pytest.raises(ValueError):
+            data_manager.get_movie(sample_movie.id)
+
+    def test_movie_writes_invalidate(self, app, db_session, sample_user, sample_movie, sample_user_movie):
+        """Test that imports and deleting a movie drop its snapshot."""
+        data_manager.get_movie(sample_movie.id)
+        data_manager.upsert_movies([{'title': 'The Matrix', 'release_year': 1999, 'poster': None,
+                                     'director': None, 'rating': 9.1}])
+        assert data_manager.get_movie(sample_movie.id).rating == 9.1
+
+        data_manager.delete_movie(sample_user.id, sample_movie.id)
+        with pytest.raises(ValueError):
+            data_manager.get_movie(sample_movie.id)
+
+    def test_load_racing_invalidation_is_not_cached(self):
+        """Test that a row read before a concurrent write's invalidation is not cached."""
+        identity_cache = IdentityCache()
+
+        def load_then_race(key):
+            identity_cache.invalidate(key)  # a write commits while the old row is being read
+            return 'old row'
+
+        assert identity_cache.get_or_load(1, load_then_race) == 'old row'
+        assert identity_cache.get_or_load(1, lambda key: 'new row') == 'new row'
+        assert identity_cache.get_or_load(1, lambda key: 'unused') == 'new row'
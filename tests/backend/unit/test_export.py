@@ -0,0 +1,55 @@
+"""
+Unit tests for the streaming export serializers.
+"""
+import csv
+import io
+import json
+import pytest
+from services.export import ndjson_chunks, csv_chunks, export_chunks
+
+ROWS = [
+    {'id': 1, 'title': 'Amélie', 'rating': 8.3},
+    {'id': 2, 'title': 'Crouching Tiger, Hidden Dragon', 'rating': None},
+    {'id': 3, 'title': 'The "Matrix"', 'rating': 8.7},
+]
+
+
+@pytest.mark.unit
+class TestExportSerializers:
+    """Test NDJSON and CSV serialization in chunks."""
+
+    def test_ndjson(self):
+        """Test that every row becomes one JSON line."""
+        text = ''.join(ndjson_chunks(iter(ROWS)))
+        assert [json.loads(line) for line in text.splitlines()] == ROWS
+
+    def test_csv_quotes_and_header(self):
+        """Test that CSV output has a header and round-trips quoting."""
+        text = ''.join(csv_chunks(iter(ROWS), ['id', 'title', 'rating']))
+        parsed_rows = list(csv.DictReader(io.StringIO(text)))
+        assert [row['title'] for row in parsed_rows] == [row['title'] for row in ROWS]
+        assert parsed_rows[1]['rating'] == ''
+
+    def test_rows_are_chunked(self):
+        """Test that rows are grouped into chunks of the requested size."""
+        chunks = list(ndjson_chunks(iter(ROWS), chunk_rows=2))
+        assert [chunk.count('\n') for chunk in chunks] == [2, 1]
+
+    def test_rows_consumed_lazily(self):
+        """Test that no row is read before the first chunk is requested."""
+        consumed = []
+
+        def rows():
+            for row in ROWS:
+                consumed.append(row['id'])
+                yield row
+
+        chunks = ndjson_chunks(rows(), chunk_rows=1)
+        assert consumed == []
+        next(chunks)
+        assert consumed == [1]
+
+    def test_invalid_format(self):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            export_chunks(iter(ROWS), 'xml', ['id'])
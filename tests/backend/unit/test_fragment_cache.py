@@ -0,0 +1,94 @@
+"""
+Unit tests for the rendered fragment cache.
+"""
+import pytest
+from services.cache import TTLCache, FileCacheStore
+from services.fragment_cache import FragmentCache, create_fragment_backend, fragment_cache
+from datamanager import data_manager
+
+
+@pytest.mark.unit
+class TestFragmentCache:
+    """Test caching of rendered fragments."""
+
+    @pytest.mark.parametrize('backend_name', ['memory', 'filesystem'])
+    def test_renders_once_per_key(self, tmp_path, backend_name):
+        """Test that a fragment is rendered on the first lookup only."""
+        cache = FragmentCache()
+        cache.backend = create_fragment_backend(backend_name, directory=str(tmp_path))
+        renders = []
+
+        def render():
+            renders.append(True)
+            return {'html': '<div class="movie_card"></div>', 'next_cursor': None}
+
+        assert cache.get_or_render('cards:v1', render) == cache.get_or_render('cards:v1', render)
+        assert len(renders) == 1
+        cache.get_or_render('cards:v2', render)
+        assert len(renders) == 2
+        assert cache.stats()['hits'] == 1
+
+    def test_disabled_backend_always_renders(self):
+        """Test that the 'none' backend renders on every lookup."""
+        cache = FragmentCache()
+        cache.backend = create_fragment_backend('none')
+        assert cache.get_or_render('cards', lambda: 'a') == 'a'
+        assert cache.get_or_render('cards', lambda: 'b') == 'b'
+        assert cache.stats()['renders'] == 2
+
+    def test_render_errors_are_not_cached(self):
+        """Test that a failing render leaves no entry behind."""
+        cache = FragmentCache()
+        cache.backend = TTLCache(max_size=10, ttl=60)
+
+        def fail():
+            raise ValueError("Invalid pagination cursor")
+
+        with pytest.raises(ValueError):
+            cache.get_or_render('cards', fail)
+        assert cache.get_or_render('cards', lambda: 'ok') == 'ok'
+
+    def test_backend_selection(self, tmp_path):
+        """Test backend names."""
+        assert isinstance(create_fragment_backend('memory'), TTLCache)
+        assert isinstance(create_fragment_backend('filesystem', directory=str(tmp_path)), FileCacheStore)
+        with pytest.raises(ValueError, match="Invalid fragment cache backend"):
+            create_fragment_backend('redis')
+
+
+@pytest.mark.unit
+class TestFragmentCacheRoutes:
+    """Test fragment caching of the movie list pages."""
+
+    def test_user_movies_served_from_cache_until_write(self, client, sample_user, sample_movie,
+                                                        sample_user_movie):
+        """Test that repeated views reuse the cards and a rating update re-renders them."""
+        client.get(f'/users/{sample_user.id}')
+        response = client.get(f'/users/{sample_user.id}')
+        assert b'The Matrix' in response.data
+        assert (fragment_cache.hits, fragment_cache.renders) == (1, 1)
+
+        data_manager.update_movie(sample_movie.id, sample_user.id, rating=3.5)
+        response = client.get(f'/users/{sample_user.id}')
+        assert '⭐ 3.5'.encode() in response.data
+        assert fragment_cache.renders == 2
+
+    def test_movies_page_follows_catalog_changes(self, client, db_session, sample_movie):
+        """Test that catalog writes invalidate the cached movie cards."""
+        client.get('/movies')
+        assert b'Heat' not in client.get('/movies').data
+        assert fragment_cache.hits == 1
+
+        data_manager.upsert_movies([{'title': 'Heat', 'release_year': 1995, 'poster': None,
+                                     'director': 'Michael Mann', 'rating': 8.3}])
+        assert b'Heat' in client.get('/movies').data
+
+    def test_pages_are_cached_separately(self, client, db_session):
+        """Test that query parameters are part of the key."""
+        from datamanager.data_models import Movie
+        db_session.add_all([Movie(title=f'Movie {index}', rating=7.0) for index in range(3)])
+        db_session.commit()
+
+        first_page = client.get('/movies?limit=2&sort=title').data
+        assert b'Movie 2' not in first_page
+        assert b'Movie 2' in client.get('/movies?limit=3&sort=title').data
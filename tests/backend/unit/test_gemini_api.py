@@ -3,7 +3,11 @@ Unit tests for Gemini API service.
 """
 import pytest
 import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
+from services import gemini_api
 from services.gemini_api import get_similar_movies, _extract_movies_from_text
 
 
@@ -133,3 +137,125 @@ class TestMovieExtraction:
         assert result is not None
         assert result.count("Movie Title") == 1
 
+
+
+def _mock_gemini_model(mock_genai, response_text):
+    """Make mock_genai return a model that answers with response_text."""
+    mock_model = MagicMock()
+    mock_response = MagicMock()
+    mock_response.text = response_text
+    mock_model.generate_content.return_value = mock_response
+    mock_genai.GenerativeModel.return_value = mock_model
+    return mock_model
+
+
+@pytest.mark.unit
+@patch('services.gemini_api.GEMINI_AVAILABLE', True)
+@patch('services.gemini_api.GEMINI_API_KEY', 'test-key')
+class TestRecommendationCache:
+    """Test caching of Gemini recommendations."""
+
+    @patch('services.gemini_api.genai')
+    def test_repeated_title_uses_cache(self, mock_genai):
+        """Test that the same title (any case) is answered from the cache."""
+        mock_model = _mock_gemini_model(mock_genai, '["Movie 1", "Movie 2"]')
+
+        first_result = get_similar_movies("The Matrix")
+        second_result = get_similar_movies("the  matrix")
+
+        assert first_result == second_result == ["Movie 1", "Movie 2"]
+        mock_model.generate_content.assert_called_once()
+        mock_genai.GenerativeModel.assert_called_once()
+
+    @patch('services.gemini_api.genai')
+    def test_failures_are_cached_briefly(self, mock_genai):
+        """Test that a quota error is not retried until the negative TTL has passed."""
+        mock_model = _mock_gemini_model(mock_genai, '["Movie 1"]')
+        mock_model.generate_content.side_effect = [Exception("429 quota"), mock_model.generate_content.return_value]
+
+        with patch('services.gemini_api.GEMINI_CACHE_NEGATIVE_TTL', 0.2):
+            assert get_similar_movies("The Matrix") is None
+            assert get_similar_movies("the matrix") is None
+            assert mock_model.generate_content.call_count == 1
+
+            time.sleep(0.25)
+            assert get_similar_movies("The Matrix") == ["Movie 1"]
+        assert mock_model.generate_content.call_count == 2
+
+    @patch('services.gemini_api.genai')
+    def test_failed_refresh_is_not_repeated(self, mock_genai):
+        """Test that after a failed background refresh the stale entry is served without new calls."""
+        mock_model = _mock_gemini_model(mock_genai, '["Fresh Movie"]')
+        mock_model.generate_content.side_effect = Exception("429 quota")
+        gemini_api.recommendation_cache.set(
+            'the matrix',
+            {'movies': ['Stale Movie'], 'fetched_at': time.time() - gemini_api.GEMINI_CACHE_TTL - 1}
+        )
+
+        refresh_futures = []
+        original_submit = gemini_api._refresh_executor.submit
+
+        def capture_submit(*args):
+            refresh_future = original_submit(*args)
+            refresh_futures.append(refresh_future)
+            return refresh_future
+
+        with patch.object(gemini_api._refresh_executor, 'submit', side_effect=capture_submit):
+            assert get_similar_movies("The Matrix") == ['Stale Movie']
+        assert refresh_futures[0].result(timeout=5) is None
+
+        with patch.object(gemini_api._refresh_executor, 'submit') as mock_submit:
+            assert get_similar_movies("The Matrix") == ['Stale Movie']
+
+        mock_submit.assert_not_called()
+        mock_model.generate_content.assert_called_once()
+
+    @patch('services.gemini_api.genai')
+    def test_stale_entry_served_while_refreshing(self, mock_genai):
+        """Test stale-while-revalidate: stale data is returned and refreshed in the background."""
+        mock_model = _mock_gemini_model(mock_genai, '["Fresh Movie"]')
+        gemini_api.recommendation_cache.set(
+            'the matrix',
+            {'movies': ['Stale Movie'], 'fetched_at': time.time() - gemini_api.GEMINI_CACHE_TTL - 1}
+        )
+        refresh_futures = []
+        original_submit = gemini_api._refresh_executor.submit
+
+        def capture_submit(*args):
+            refresh_future = original_submit(*args)
+            refresh_futures.append(refresh_future)
+            return refresh_future
+
+        with patch.object(gemini_api._refresh_executor, 'submit', side_effect=capture_submit):
+            assert get_similar_movies("The Matrix") == ['Stale Movie']
+
+        assert len(refresh_futures) == 1
+        assert refresh_futures[0].result(timeout=5) == ['Fresh Movie']
+        assert get_similar_movies("The Matrix") == ['Fresh Movie']
+        mock_model.generate_content.assert_called_once()
+
+    @patch('services.gemini_api.genai')
+    def test_concurrent_misses_share_one_call(self, mock_genai):
+        """Test single-flight de-duplication of concurrent requests."""
+        call_started = threading.Event()
+        release_call = threading.Event()
+        mock_model = _mock_gemini_model(mock_genai, '["Movie 1"]')
+        original_response = mock_model.generate_content.return_value
+
+        def slow_generate(prompt):
+            call_started.set()
+            release_call.wait(timeout=5)
+            return original_response
+
+        mock_model.generate_content.side_effect = slow_generate
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first_future = executor.submit(get_similar_movies, "The Matrix")
+            call_started.wait(timeout=5)
+            other_futures = [executor.submit(get_similar_movies, "The Matrix") for _ in range(2)]
+            time.sleep(0.05)
+            release_call.set()
+            results = [first_future.result(timeout=5)] + [future.result(timeout=5) for future in other_futures]
+
+        assert results == [["Movie 1"]] * 3
+        mock_model.generate_content.assert_called_once()
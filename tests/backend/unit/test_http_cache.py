@@ -0,0 +1,60 @@
+"""
+Unit tests for HTTP cache validators.
+"""
+import pytest
+from datetime import datetime, timezone
+from flask import Response
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
+from services.http_cache import apply_validators, is_not_modified, validators_for
+
+CHANGED_AT = datetime(2026, 10, 17, 12, 0, 0, 500000)
+VERSIONS = {'users': (3, CHANGED_AT), 'user:1': (0, None)}
+
+
+def _request(headers: dict) -> Request:
+    """Build a GET request carrying the given headers."""
+    return Request(EnvironBuilder(headers=headers).get_environ())
+
+
+@pytest.mark.unit
+class TestValidators:
+    """Test deriving and checking validators from data versions."""
+
+    def test_etag_depends_on_versions_and_change_times(self):
+        """Test that the ETag changes with any counter or change time."""
+        etag = validators_for(VERSIONS).etag
+        assert validators_for(dict(VERSIONS)).etag == etag
+        assert validators_for({**VERSIONS, 'users': (4, CHANGED_AT)}).etag != etag
+        assert validators_for({**VERSIONS, 'users': (3, datetime(2027, 1, 1))}).etag != etag
+
+    def test_last_modified_is_latest_change(self):
+        """Test that Last-Modified is the latest change time, in UTC."""
+        assert validators_for(VERSIONS).last_modified == CHANGED_AT.replace(tzinfo=timezone.utc)
+        assert validators_for({'users': (0, None)}).last_modified is None
+
+    def test_if_none_match(self):
+        """Test that matching ETags (strong, weak or *) are not modified."""
+        validators = validators_for(VERSIONS)
+        assert is_not_modified(_request({'If-None-Match': f'"{validators.etag}"'}), validators)
+        assert is_not_modified(_request({'If-None-Match': f'W/"{validators.etag}"'}), validators)
+        assert is_not_modified(_request({'If-None-Match': '*'}), validators)
+        assert not is_not_modified(_request({'If-None-Match': '"other"'}), validators)
+        assert not is_not_modified(_request({}), validators)
+
+    def test_if_modified_since(self):
+        """Test second-resolution date comparison, ignored when If-None-Match is present."""
+        validators = validators_for(VERSIONS)
+        assert is_not_modified(_request({'If-Modified-Since': 'Sat, 17 Oct 2026 12:00:00 GMT'}), validators)
+        assert not is_not_modified(_request({'If-Modified-Since': 'Sat, 17 Oct 2026 11:59:59 GMT'}), validators)
+        assert not is_not_modified(_request({'If-Modified-Since': 'Sat, 17 Oct 2026 12:00:00 GMT',
+                                             'If-None-Match': '"other"'}), validators)
+
+    def test_apply_validators(self):
+        """Test the headers set on a response."""
+        validators = validators_for(VERSIONS)
+        response = apply_validators(Response('{}'), validators)
+        assert response.headers['ETag'] == f'"{validators.etag}"'
+        assert response.headers['Last-Modified'] == 'Sat, 17 Oct 2026 12:00:00 GMT'
+        assert 'no-cache' in response.headers['Cache-Control']
+        assert 'private' in response.headers['Cache-Control']
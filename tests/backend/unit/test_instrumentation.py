@@ -0,0 +1,158 @@
+"""
+Unit tests for per-request performance instrumentation.
+"""
+import json
+import logging
+import pytest
+from unittest.mock import patch, Mock, MagicMock
+from services.instrumentation import RequestTimings, timed_external, current_timings, _current_timings
+from datamanager.data_models import Movie
+
+
+def _server_timing(response) -> dict:
+    """Parse a Server-Timing header into {metric: parameters}."""
+    metrics = {}
+    for metric in response.headers['Server-Timing'].split(', '):
+        name, *parameters = metric.split(';')
+        metrics[name] = dict(parameter.split('=', 1) for parameter in parameters)
+    return metrics
+
+
+@pytest.fixture
+def timings():
+    """Collect timings as if a request were being handled."""
+    request_timings = RequestTimings()
+    token = _current_timings.set(request_timings)
+    yield request_timings
+    _current_timings.reset(token)
+
+
+@pytest.mark.unit
+class TestTimedExternal:
+    """Test timing of external service calls."""
+
+    def test_outside_requests_nothing_is_recorded(self):
+        """Test that calls outside a request run untimed."""
+        assert current_timings() is None
+        assert timed_external('omdb')(lambda: 'result')() == 'result'
+
+    def test_calls_are_counted_once_when_nested(self, timings):
+        """Test that a batch call wrapping single calls counts as one call."""
+        fetch_one = timed_external('omdb')(lambda title: title)
+        fetch_many = timed_external('omdb')(lambda titles: [fetch_one(title) for title in titles])
+
+        assert fetch_many(['a', 'b']) == ['a', 'b']
+        assert timings.external_calls == {'omdb': 1, 'gemini': 0}
+        assert timings.external_time['omdb'] > 0
+
+    def test_failed_calls_are_timed(self, timings):
+        """Test that exceptions propagate and the call is still recorded."""
+        @timed_external('gemini')
+        def failing_call():
+            raise RuntimeError("quota exceeded")
+
+        with pytest.raises(RuntimeError):
+            failing_call()
+        assert timings.external_calls['gemini'] == 1
+        assert not timings.active_services
+
+
+@pytest.mark.unit
+class TestExternalCallAccounting:
+    """Test that only requests actually sent to external services are timed."""
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_omdb_cache_hits_are_not_counted(self, mock_get, timings):
+        """Test that cached OMDb lookups and searches record no external call."""
+        from services.omdb_api import fetch_movie_data, fetch_movies_data, search_movie_titles
+        omdb_response = Mock()
+        omdb_response.raise_for_status.return_value = None
+        omdb_response.json.return_value = {'Title': 'The Matrix', 'Year': '1999', 'Director': 'Wachowskis',
+                                           'imdbRating': '8.7', 'Poster': 'N/A',
+                                           'Search': [{'Title': 'The Matrix', 'Year': '1999', 'Poster': 'N/A'}]}
+        mock_get.return_value = omdb_response
+
+        fetch_movie_data("The Matrix")
+        search_movie_titles("matrix")
+        fetch_movies_data(["Inception"])
+        assert timings.external_calls['omdb'] == 3
+
+        fetch_movie_data("The Matrix")
+        search_movie_titles("matrix")
+        fetch_movies_data(["The Matrix", "Inception"])
+        assert timings.external_calls['omdb'] == 3
+        assert mock_get.call_count == 3
+
+    @patch('services.gemini_api.GEMINI_AVAILABLE', True)
+    @patch('services.gemini_api.GEMINI_API_KEY', 'test-key')
+    @patch('services.gemini_api.genai')
+    def test_gemini_cache_hits_are_not_counted(self, mock_genai, timings):
+        """Test that cached recommendations record no external call."""
+        from services.gemini_api import get_similar_movies
+        mock_response = MagicMock()
+        mock_response.text = '["Inception"]'
+        mock_genai.GenerativeModel.return_value.generate_content.return_value = mock_response
+
+        assert get_similar_movies("The Matrix") == ["Inception"]
+        assert get_similar_movies("The Matrix") == ["Inception"]
+        assert timings.external_calls['gemini'] == 1
+
+
+@pytest.mark.unit
+class TestRequestInstrumentation:
+    """Test the Server-Timing header, request log line and N+1 warning."""
+
+    def test_server_timing_header(self, client, sample_movie):
+        """Test that pages report query count, database and render time."""
+        response = client.get('/movies')
+
+        metrics = _server_timing(response)
+        assert list(metrics) == ['db', 'render', 'total']
+        assert int(metrics['db']['desc'].strip('"').split()[0]) > 0
+        assert float(metrics['render']['dur']) > 0
+        assert float(metrics['total']['dur']) >= float(metrics['db']['dur'])
+
+    def test_omdb_time_is_reported(self, client, sample_user):
+        """Test that OMDb lookups made by a request show up in its timings."""
+        omdb_response = Mock()
+        omdb_response.raise_for_status.return_value = None
+        omdb_response.json.return_value = {'Response': 'False', 'Error': 'Movie not found!'}
+        with patch('services.omdb_api.omdb_client.session.get', return_value=omdb_response):
+            response = client.post(f'/api/users/{sample_user.id}/movies', json={'title': 'Unknown Film'})
+
+        assert 'omdb' in _server_timing(response)
+        assert 'gemini' not in _server_timing(response)
+
+    def test_request_log_line(self, app, client, sample_movie, caplog):
+        """Test that every request logs its timings as one JSON line."""
+        with caplog.at_level(logging.INFO, logger=app.logger.name):
+            client.get('/api/movies')
+
+        request_lines = [json.loads(record.getMessage()) for record in caplog.records
+                         if record.getMessage().startswith('{"event": "request"')]
+        assert len(request_lines) == 1
+        assert request_lines[0]['path'] == '/api/movies'
+        assert request_lines[0]['status'] == 200
+        assert request_lines[0]['queries'] > 0
+        assert request_lines[0]['omdb_calls'] == 0
+
+    def test_n_plus_one_warning(self, app, client, db_session, caplog):
+        """Test that requests running many queries are flagged."""
+        db_session.add(Movie(title="Alien", release_year=1979, director="Ridley Scott", rating=8.5))
+        db_session.commit()
+        app.config['N_PLUS_ONE_THRESHOLD'] = 1
+
+        with caplog.at_level(logging.WARNING, logger=app.logger.name):
+            client.get('/movies')
+
+        assert any('Possible N+1 queries: GET /movies' in record.getMessage() for record in caplog.records)
+
+    def test_disabled(self, app, client):
+        """Test that the header can be switched off."""
+        app.config['SERVER_TIMING_ENABLED'] = False
+        assert 'Server-Timing' not in client.get('/').headers
+
+    def test_timings_do_not_leak_between_requests(self, client):
+        """Test that no timings are collected once a request has finished."""
+        client.get('/')
+        assert current_timings() is None
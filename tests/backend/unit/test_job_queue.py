@@ -0,0 +1,150 @@
+"""
+Unit tests for the background job queue.
+"""
+import os
+import sys
+import runpy
+import threading
+import importlib
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from datamanager.data_models import Job, UserMovies
+from datamanager import data_manager
+from extensions import db
+from services.job_queue import job_queue, add_movie_dedupe_key, is_async_requested
+from services.posters import poster_store
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+MATRIX_DATA = {
+    'title': 'The Matrix', 'director': 'Lana Wachowski', 'rating': '8.7',
+    'release_year': '1999', 'poster': 'https://example.com/matrix.jpg'
+}
+
+
+@pytest.mark.unit
+class TestJobQueue:
+    """Test enqueuing, coalescing and running add-movie jobs."""
+
+    def test_job_adds_movie(self, app, sample_user):
+        """Test that a queued job adds the movie and records the result."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=MATRIX_DATA):
+                job, created = job_queue.enqueue_add_movie(sample_user.id, 'The Matrix')
+                job_id = job.id
+                assert job_queue.join(timeout=5)
+
+            db.session.expire_all()
+            finished_job = data_manager.get_job(job_id)
+            assert created is True
+            assert finished_job.status == Job.SUCCEEDED
+            assert finished_job.result_message == 'added'
+            assert finished_job.attempts == 1
+            assert UserMovies.query.filter_by(user_id=sample_user.id, movie_id=finished_job.movie_id).count() == 1
+
+    def test_duplicate_jobs_coalesce(self, app, sample_user):
+        """Test that re-submitting an active title returns the existing job."""
+        release_lookup = threading.Event()
+
+        def slow_fetch(title):
+            release_lookup.wait(timeout=5)
+            return MATRIX_DATA
+
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', side_effect=slow_fetch) as mock_fetch:
+                first_job, first_created = job_queue.enqueue_add_movie(sample_user.id, 'The Matrix')
+                second_job, second_created = job_queue.enqueue_add_movie(sample_user.id, '  the MATRIX ')
+                first_job_id, second_job_id = first_job.id, second_job.id
+                release_lookup.set()
+                assert job_queue.join(timeout=5)
+
+            assert first_created is True and second_created is False
+            assert first_job_id == second_job_id
+            assert mock_fetch.call_count == 1
+            assert Job.query.count() == 1
+
+    def test_finished_job_does_not_block_new_one(self, app, sample_user):
+        """Test that coalescing only applies to queued or running jobs."""
+        with app.app_context():
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=None):
+                first_job, _ = job_queue.enqueue_add_movie(sample_user.id, 'Unknown')
+                first_job_id = first_job.id
+                assert job_queue.join(timeout=5)
+                second_job, created = job_queue.enqueue_add_movie(sample_user.id, 'Unknown')
+                assert job_queue.join(timeout=5)
+
+            assert created is True
+            assert second_job.id != first_job_id
+            db.session.expire_all()
+            assert data_manager.get_job(first_job_id).result_message == 'not_found'
+
+    def test_claim_is_exclusive(self, app, sample_user):
+        """Test that a job can be claimed only once."""
+        with app.app_context():
+            job, _ = data_manager.create_job('add_movie', sample_user.id, 'Alien',
+                                             add_movie_dedupe_key(sample_user.id, 'Alien'))
+            assert data_manager.claim_job(job.id) is True
+            assert data_manager.claim_job(job.id) is False
+
+    def test_stale_running_jobs_are_requeued(self, app, sample_user):
+        """Test that jobs abandoned by a stopped process are queued again on startup."""
+        with app.app_context():
+            long_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+            db.session.add_all([
+                Job(kind='add_movie', user_id=sample_user.id, title='Alien', dedupe_key='a',
+                    status=Job.RUNNING, updated_at=long_ago),
+                Job(kind='add_movie', user_id=sample_user.id, title='Heat', dedupe_key='b',
+                    status=Job.RUNNING),
+                Job(kind='add_movie', user_id=sample_user.id, title='Up', dedupe_key='c', status=Job.QUEUED),
+            ])
+            db.session.commit()
+
+            pending_job_ids = data_manager.requeue_stale_jobs(stale_after_seconds=600)
+
+            assert [db.session.get(Job, job_id).title for job_id in pending_job_ids] == ['Alien', 'Up']
+            assert Job.query.filter_by(title='Heat').one().status == Job.RUNNING
+
+    def test_is_async_requested(self):
+        """Test the ?async= flag and its configured default."""
+        assert is_async_requested('1', False) is True
+        assert is_async_requested('false', True) is False
+        assert is_async_requested(None, True) is True
+
+
+@pytest.mark.unit
+class TestPreloadedServing:
+    """Test that the gunicorn master never runs jobs and its workers do."""
+
+    def test_preload_starts_no_job_threads(self, app, sample_user, monkeypatch, tmp_path):
+        """Test that importing wsgi.app under gunicorn.conf.py leaves jobs to post_fork."""
+        monkeypatch.setenv('METRICS_DIR', str(tmp_path))
+        monkeypatch.setenv('JOB_QUEUE_AUTOSTART', 'true')
+        gunicorn_settings = runpy.run_path(os.path.join(PROJECT_DIRECTORY, 'gunicorn.conf.py'))
+        assert os.environ['JOB_QUEUE_AUTOSTART'] == 'false'
+
+        with app.app_context():
+            job, _ = data_manager.create_job('add_movie', sample_user.id, 'The Matrix',
+                                             add_movie_dedupe_key(sample_user.id, 'The Matrix'))
+            job_id = job.id
+        job_threads_before = {thread for thread in threading.enumerate() if thread.name.startswith('job-worker')}
+
+        sys.modules.pop('wsgi', None)
+        try:
+            # The module-level setting was read at import, before the environment changed
+            with patch('services.job_queue.JOB_QUEUE_AUTOSTART', False):
+                preloaded_app = importlib.import_module('wsgi').app
+            job_threads = {thread for thread in threading.enumerate() if thread.name.startswith('job-worker')}
+            assert job_queue._executor is None
+            assert job_threads <= job_threads_before
+            with preloaded_app.app_context():
+                assert data_manager.get_job(job_id).status == Job.QUEUED
+
+            with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=MATRIX_DATA), \
+                    patch.object(poster_store, 'prefetch'):
+                gunicorn_settings['post_fork'](None, None)
+                assert job_queue.join(timeout=5)
+            with preloaded_app.app_context():
+                assert data_manager.get_job(job_id).status == Job.SUCCEEDED
+        finally:
+            sys.modules.pop('wsgi', None)
@@ -0,0 +1,180 @@
+"""
+Unit tests for the metrics registry and the /metrics endpoint.
+"""
+import os
+import json
+import runpy
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from requests.exceptions import ConnectionError
+from services.metrics import MetricsRegistry, CONTENT_TYPE, registry as app_registry
+from services.omdb_client import OMDbClient, CircuitBreaker
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _sample_lines(text: str) -> dict:
+    """Parse exposition text into {series: value}, skipping comments."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            samples[series] = float(value)
+    return samples
+
+
+@pytest.fixture
+def registry():
+    """Create a single-process registry."""
+    return MetricsRegistry(directory=None)
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test counting, rendering and multi-process aggregation."""
+
+    def test_counts_from_many_threads(self, registry):
+        """Test that per-thread samples, including those of finished threads, are summed."""
+        requests_total = registry.counter('requests_total', 'Requests.', ('endpoint',))
+
+        def count_requests():
+            for _ in range(1000):
+                requests_total.inc('movie.show_movies')
+
+        threads = [threading.Thread(target=count_requests) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests_total.inc('movie.show_movies')
+
+        assert registry.snapshot() == {('movieweb_requests_total', ('movie.show_movies',)): 4001}
+        # Finished threads are folded into one shard, without losing counts
+        assert registry.snapshot() == {('movieweb_requests_total', ('movie.show_movies',)): 4001}
+        assert len(registry._shards) == 1
+
+    def test_histogram_exposition(self, registry):
+        """Test that histograms render cumulative buckets, sum and count."""
+        latency = registry.histogram('latency_seconds', 'Latency.', ('endpoint',), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value, 'api.list_users')
+
+        text = registry.render()
+        assert '# TYPE movieweb_latency_seconds histogram' in text
+        assert _sample_lines(text) == {
+            'movieweb_latency_seconds_bucket{endpoint="api.list_users",le="0.1"}': 2,
+            'movieweb_latency_seconds_bucket{endpoint="api.list_users",le="1"}': 3,
+            'movieweb_latency_seconds_bucket{endpoint="api.list_users",le="+Inf"}': 4,
+            'movieweb_latency_seconds_sum{endpoint="api.list_users"}': 2.65,
+            'movieweb_latency_seconds_count{endpoint="api.list_users"}': 4,
+        }
+
+    def test_label_values_are_escaped(self, registry):
+        """Test that quotes and backslashes in label values are escaped."""
+        registry.counter('errors_total', 'Errors.', ('reason',)).inc('say "hi" \\')
+        assert 'movieweb_errors_total{reason="say \\"hi\\" \\\\"} 1' in registry.render()
+
+    def test_collectors_replace_values(self, registry):
+        """Test that collected samples reflect the latest reading."""
+        pool_size = registry.gauge('pool_size', 'Pool size.')
+        readings = iter([5, 7])
+        registry.register_collector(lambda: [(pool_size, (), next(readings))])
+
+        assert registry.snapshot()[('movieweb_pool_size', ())] == 5
+        assert registry.snapshot()[('movieweb_pool_size', ())] == 7
+
+    def test_merges_worker_snapshots(self, tmp_path):
+        """Test that counters of all processes are summed and gauges of exited ones dropped."""
+        registry = MetricsRegistry(directory=str(tmp_path))
+        requests_total = registry.counter('requests_total', 'Requests.')
+        in_progress = registry.gauge('in_progress', 'In progress.')
+        requests_total.inc(amount=3)
+        in_progress.inc()
+        exited_pid = 2 ** 22 + 1  # above the default pid_max, so never a live process
+        with open(tmp_path / f'{exited_pid}.json', 'w') as snapshot_file:
+            json.dump([['movieweb_requests_total', [], 5], ['movieweb_in_progress', [], 2]], snapshot_file)
+
+        samples = registry.collect()
+
+        assert samples[('movieweb_requests_total', ())] == 8
+        assert samples[('movieweb_in_progress', ())] == 1
+        assert os.path.exists(tmp_path / f'{os.getpid()}.json')
+
+    def test_retire_process_folds_snapshot_into_aggregate(self, tmp_path):
+        """Test that exited workers' snapshots are summed into one file and removed."""
+        registry = MetricsRegistry(directory=str(tmp_path))
+        registry.counter('requests_total', 'Requests.')
+        registry.gauge('in_progress', 'In progress.')
+        registry.histogram('latency_seconds', 'Latency.', buckets=(0.1,))
+        first_pid, second_pid = 2 ** 22 + 1, 2 ** 22 + 2
+        for exited_pid, request_count in ((first_pid, 5), (second_pid, 7)):
+            with open(tmp_path / f'{exited_pid}.json', 'w') as snapshot_file:
+                json.dump([['movieweb_requests_total', [], request_count], ['movieweb_in_progress', [], 2],
+                           ['movieweb_latency_seconds', [], [1, 0, 0.05]]], snapshot_file)
+        samples_before = registry.collect()
+
+        registry.retire_process(first_pid)
+        registry.retire_process(second_pid)
+        registry.retire_process(second_pid)  # already retired
+
+        assert sorted(os.listdir(tmp_path)) == sorted(['exited.json', f'{os.getpid()}.json'])
+        with open(tmp_path / 'exited.json') as aggregate_file:
+            assert sorted(json.load(aggregate_file)) == [['movieweb_latency_seconds', [], [2, 0, 0.1]],
+                                                         ['movieweb_requests_total', [], 12]]
+        assert registry.collect() == samples_before
+
+    def test_gunicorn_child_exit_retires_worker(self, monkeypatch, tmp_path):
+        """Test that the gunicorn master retires the snapshot of each exited worker."""
+        monkeypatch.setenv('METRICS_DIR', str(tmp_path))
+        monkeypatch.setenv('JOB_QUEUE_AUTOSTART', 'true')
+        gunicorn_settings = runpy.run_path(os.path.join(PROJECT_DIRECTORY, 'gunicorn.conf.py'))
+        with patch.object(app_registry, 'retire_process') as mock_retire:
+            gunicorn_settings['child_exit'](None, SimpleNamespace(pid=4321))
+        mock_retire.assert_called_once_with(4321)
+
+    def test_snapshots_are_throttled(self, tmp_path):
+        """Test that maybe_write_snapshot writes at most once per interval."""
+        registry = MetricsRegistry(directory=str(tmp_path), snapshot_interval=3600)
+        with patch.object(registry, 'write_snapshot', wraps=registry.write_snapshot) as mock_write:
+            registry.maybe_write_snapshot()
+            registry.maybe_write_snapshot()
+        assert mock_write.call_count == 1
+
+
+@pytest.mark.unit
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint and the metrics recorded by the application."""
+
+    def test_request_metrics(self, client, sample_movie):
+        """Test that requests are counted and timed per endpoint."""
+        client.get('/movies')
+        client.get('/movies')
+        client.get('/no-such-page')
+
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == CONTENT_TYPE
+        samples = _sample_lines(response.get_data(as_text=True))
+        assert samples['movieweb_http_requests_total{endpoint="movie.show_movies",method="GET",status="200"}'] == 2
+        assert samples['movieweb_http_requests_total{endpoint="unmatched",method="GET",status="404"}'] == 1
+        assert samples['movieweb_http_request_duration_seconds_count{endpoint="movie.show_movies",method="GET"}'] == 2
+        # The scrape itself is in progress
+        assert samples['movieweb_http_requests_in_progress'] == 1
+        assert samples['movieweb_db_pool_checkouts_total'] > 0
+        assert samples['movieweb_cache_hit_ratio{cache="fragment"}'] == 0.5
+
+    def test_omdb_errors_and_latency(self):
+        """Test that failed OMDb calls are timed and counted as errors."""
+        omdb_client = OMDbClient(max_retries=0, breaker=CircuitBreaker(failure_threshold=1))
+        with patch.object(omdb_client.session, 'get', side_effect=ConnectionError("refused")):
+            with pytest.raises(ConnectionError):
+                omdb_client.get({})
+        # The breaker is now open: the next call fails fast without a request
+        with pytest.raises(ConnectionError):
+            omdb_client.get({})
+
+        samples = app_registry.snapshot()
+        assert samples[('movieweb_external_call_errors_total', ('omdb',))] == 2
+        assert sum(samples[('movieweb_external_call_duration_seconds', ('omdb',))][:-1]) == 1
@@ -3,15 +3,23 @@ Unit tests for OMDb API service.
 """
 import pytest
 from unittest.mock import patch, Mock
-from services.omdb_api import fetch_movie_data
+from services.omdb_api import (fetch_movie_data, fetch_movies_data, normalize_title, omdb_cache,
+                               search_movie_titles)
 from tests.backend.fixtures.sample_data import SAMPLE_OMDB_RESPONSE, SAMPLE_OMDB_RESPONSE_NOT_FOUND
 
 
+@pytest.fixture(autouse=True)
+def no_backoff_sleep():
+    """Skip the retry backoff delays of the OMDb client."""
+    with patch('services.omdb_client.time.sleep') as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.mark.unit
 class TestOMDbAPI:
     """Test OMDb API integration."""
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_success(self, mock_get):
         """Test successfully fetching movie data from OMDb API."""
         # Mock successful API response
@@ -29,7 +37,7 @@ class TestOMDbAPI:
         assert result['rating'] == "8.7"
         assert result['poster'] == "https://example.com/matrix.jpg"
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_not_found(self, mock_get):
         """Test handling when movie is not found in OMDb API."""
         # Mock API error response
@@ -42,7 +50,7 @@ class TestOMDbAPI:
         
         assert result is None
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_http_error(self, mock_get):
         """Test handling HTTP errors from OMDb API."""
         from requests.exceptions import HTTPError
@@ -54,7 +62,7 @@ class TestOMDbAPI:
         
         assert result is None
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_connection_error(self, mock_get):
         """Test handling connection errors."""
         from requests.exceptions import ConnectionError
@@ -66,7 +74,7 @@ class TestOMDbAPI:
         
         assert result is None
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_timeout(self, mock_get):
         """Test handling timeout errors."""
         from requests.exceptions import Timeout
@@ -78,7 +86,17 @@ class TestOMDbAPI:
         
         assert result is None
     
-    @patch('services.omdb_api.requests.get')
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_fetch_movie_data_other_request_error(self, mock_get):
+        """Test that any RequestException is handled, not only connection errors."""
+        from requests.exceptions import ChunkedEncodingError
+
+        mock_get.side_effect = ChunkedEncodingError("Connection broken: IncompleteRead")
+
+        assert fetch_movie_data("Some Movie") is None
+        assert search_movie_titles("Some Movie") == []
+
+    @patch('services.omdb_api.omdb_client.session.get')
     def test_fetch_movie_data_invalid_json(self, mock_get):
         """Test handling invalid JSON response."""
         # Mock invalid JSON response
@@ -91,3 +109,179 @@ class TestOMDbAPI:
         
         assert result is None
 
+
+@pytest.mark.unit
+@patch('services.omdb_api.OMDB_API_KEY', 'test-key')
+class TestOMDbCache:
+    """Test caching of OMDb API responses."""
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_repeated_lookup_uses_cache(self, mock_get):
+        """Test that a second lookup of the same title makes no HTTP request."""
+        mock_response = Mock()
+        mock_response.json.return_value = SAMPLE_OMDB_RESPONSE
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        first_result = fetch_movie_data("The Matrix")
+        second_result = fetch_movie_data("  the   MATRIX ")
+
+        assert first_result == second_result
+        assert mock_get.call_count == 1
+        assert omdb_cache.stats()['hits'] == 1
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_release_year_narrows_lookup(self, mock_get):
+        """Test that a year is sent as y= and cached apart from the bare title."""
+        mock_response = Mock()
+        mock_response.json.return_value = SAMPLE_OMDB_RESPONSE
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        fetch_movie_data("Dune", 1984)
+        fetch_movie_data("Dune", 2021)
+        fetch_movie_data("Dune")
+        fetch_movie_data("dune", 1984)
+
+        sent_params = [call.kwargs['params'] for call in mock_get.call_args_list]
+        assert [params.get('y') for params in sent_params] == [1984, 2021, None]
+        assert omdb_cache.stats()['hits'] == 1
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_cached_result_is_a_copy(self, mock_get):
+        """Test that callers cannot mutate the cached entry."""
+        mock_response = Mock()
+        mock_response.json.return_value = SAMPLE_OMDB_RESPONSE
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        fetch_movie_data("The Matrix")['title'] = "Changed"
+
+        assert fetch_movie_data("The Matrix")['title'] == "The Matrix"
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_not_found_is_cached(self, mock_get):
+        """Test negative caching of "Movie not found!" answers."""
+        mock_response = Mock()
+        mock_response.json.return_value = SAMPLE_OMDB_RESPONSE_NOT_FOUND
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        assert fetch_movie_data("NonExistentMovie") is None
+        assert fetch_movie_data("NonExistentMovie") is None
+        assert mock_get.call_count == 1
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_transport_errors_are_not_cached(self, mock_get):
+        """Test that failed requests are retried on the next lookup."""
+        from requests.exceptions import ConnectionError
+
+        mock_get.side_effect = ConnectionError("Connection failed")
+
+        assert fetch_movie_data("Some Movie") is None
+        calls_per_lookup = mock_get.call_count
+        assert fetch_movie_data("Some Movie") is None
+        assert mock_get.call_count == 2 * calls_per_lookup
+
+
+@pytest.mark.unit
+@patch('services.omdb_api.OMDB_API_KEY', 'test-key')
+class TestSearchMovieTitles:
+    """Test OMDb title searches used by suggestions."""
+
+    SEARCH_RESPONSE = {
+        'Search': [{'Title': 'The Matrix', 'Year': '1999', 'imdbID': 'tt0133093', 'Type': 'movie',
+                    'Poster': 'https://example.com/matrix.jpg'}],
+        'totalResults': '1',
+        'Response': 'True'
+    }
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_search_results_are_cached(self, mock_get):
+        """Test that results are formatted and a repeated search makes no HTTP request."""
+        mock_response = Mock()
+        mock_response.json.return_value = self.SEARCH_RESPONSE
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        results = search_movie_titles("matr")
+        assert results == [{'title': 'The Matrix', 'release_year': '1999',
+                            'poster': 'https://example.com/matrix.jpg'}]
+        assert search_movie_titles(" MATR ") == results
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs['params']['s'] == "matr"
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    @pytest.mark.parametrize('error, cached', [("Too many results.", True), ("Request limit reached!", False)])
+    def test_error_answers(self, mock_get, error, cached):
+        """Test that empty answers are cached and other errors are not."""
+        mock_response = Mock()
+        mock_response.json.return_value = {'Response': 'False', 'Error': error}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        assert search_movie_titles("the") == []
+        assert search_movie_titles("the") == []
+        assert mock_get.call_count == (1 if cached else 2)
+
+    @patch('services.omdb_api.omdb_client.session.get')
+    def test_short_queries_not_sent(self, mock_get):
+        """Test that queries below OMDB_SEARCH_MIN_CHARS make no request."""
+        assert search_movie_titles("ma") == []
+        mock_get.assert_not_called()
+
+
+@pytest.mark.unit
+class TestFetchMoviesData:
+    """Test concurrent batch lookups."""
+
+    @patch('services.omdb_api._load_movie_data')
+    def test_fetch_movies_data_deduplicates(self, mock_fetch):
+        """Test that titles sharing a cache key are fetched once."""
+        mock_fetch.side_effect = lambda title: {'title': title.strip()}
+
+        results = fetch_movies_data(["The Matrix", "the matrix", "Inception"])
+
+        assert mock_fetch.call_count == 2
+        assert results["the matrix"] == results["The Matrix"]
+        assert results["Inception"] == {'title': "Inception"}
+
+    @patch('services.omdb_api._load_movie_data')
+    def test_fetch_movies_data_keys_by_release_year(self, mock_fetch):
+        """Test that (title, year) lookups of one title with two release years stay distinct."""
+        mock_fetch.side_effect = lambda title, release_year=None: {'title': title, 'release_year': release_year}
+
+        results = fetch_movies_data([("Dune", 1984), ("Dune", 2021), ("dune", 1984), "Dune"])
+
+        assert mock_fetch.call_count == 3
+        assert results[("Dune", 1984)] == {'title': "Dune", 'release_year': 1984}
+        assert results[("Dune", 2021)] == {'title': "Dune", 'release_year': 2021}
+        assert results[("dune", 1984)] == results[("Dune", 1984)]
+        assert results["Dune"] == {'title': "Dune", 'release_year': None}
+
+    @patch('services.omdb_api._load_movie_data')
+    def test_fetch_movies_data_serves_cached_lookups(self, mock_fetch):
+        """Test that only lookups missing from the cache are requested."""
+        omdb_cache.set(normalize_title("The Matrix"), {'title': "The Matrix"})
+        omdb_cache.set(normalize_title("Unknown Movie"), None)
+        mock_fetch.side_effect = lambda title: {'title': title}
+
+        results = fetch_movies_data(["The Matrix", "Unknown Movie", "Inception"])
+
+        mock_fetch.assert_called_once_with("Inception")
+        assert results == {"The Matrix": {'title': "The Matrix"}, "Unknown Movie": None,
+                           "Inception": {'title': "Inception"}}
+
+    def test_fetch_movies_data_empty(self):
+        """Test that an empty batch makes no lookups."""
+        assert fetch_movies_data([]) == {}
+
+
+@pytest.mark.unit
+class TestNormalizeTitle:
+    """Test cache key normalization."""
+
+    def test_normalize_title(self):
+        """Test that case and whitespace differences are ignored."""
+        assert normalize_title("  The   Matrix ") == "the matrix"
+        assert normalize_title("THE MATRIX") == normalize_title("the matrix")
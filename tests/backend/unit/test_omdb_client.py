@@ -0,0 +1,156 @@
+"""
+Unit tests for the pooled OMDb HTTP client.
+"""
+import pytest
+from unittest.mock import patch, Mock
+from requests.exceptions import ConnectionError, Timeout, HTTPError, ChunkedEncodingError, TooManyRedirects
+from services.omdb_client import OMDbClient, CircuitBreaker, CircuitOpenError
+
+
+def _make_response(status_code=200):
+    """Build a mock response whose raise_for_status matches its status code."""
+    response = Mock()
+    response.status_code = status_code
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(f"{status_code} Error", response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a client with fast retries and a low breaker threshold."""
+    omdb_client = OMDbClient(max_retries=2, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30))
+    with patch('services.omdb_client.time.sleep'):
+        yield omdb_client
+
+
+@pytest.mark.unit
+class TestOMDbClient:
+    """Test retries, timeouts and pooling of the OMDb client."""
+
+    def test_get_passes_params_and_timeout(self, client):
+        """Test that requests carry query params and (connect, read) timeouts."""
+        with patch.object(client.session, 'get', return_value=_make_response()) as mock_get:
+            client.get({'apikey': 'key', 't': 'The Matrix'})
+
+        _, call_kwargs = mock_get.call_args
+        assert call_kwargs['params'] == {'apikey': 'key', 't': 'The Matrix'}
+        assert call_kwargs['timeout'] == client.timeout
+
+    def test_retries_connection_errors(self, client):
+        """Test that transient errors are retried until a request succeeds."""
+        success = _make_response()
+        with patch.object(client.session, 'get',
+                          side_effect=[ConnectionError("reset"), Timeout("slow"), success]) as mock_get:
+            assert client.get({}) is success
+
+        assert mock_get.call_count == 3
+        assert client.retries == 2
+        assert client.breaker.consecutive_failures == 0
+
+    def test_retries_server_errors(self, client):
+        """Test that 503 responses are retried."""
+        success = _make_response()
+        with patch.object(client.session, 'get', side_effect=[_make_response(503), success]):
+            assert client.get({}) is success
+
+    def test_retry_budget_exhausted(self, client):
+        """Test that the last error is raised once retries run out."""
+        with patch.object(client.session, 'get', side_effect=ConnectionError("down")) as mock_get:
+            with pytest.raises(ConnectionError):
+                client.get({})
+
+        assert mock_get.call_count == 3
+        assert client.failures == 1
+
+    def test_client_errors_not_retried(self, client):
+        """Test that 4xx responses fail immediately without tripping the breaker."""
+        with patch.object(client.session, 'get', return_value=_make_response(401)) as mock_get:
+            with pytest.raises(HTTPError):
+                client.get({})
+
+        assert mock_get.call_count == 1
+        assert client.breaker.consecutive_failures == 0
+
+    def test_breaker_fails_fast_when_open(self, client):
+        """Test that repeated failures open the breaker and skip the network."""
+        with patch.object(client.session, 'get', side_effect=ConnectionError("down")) as mock_get:
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    client.get({})
+            calls_before_open = mock_get.call_count
+
+            with pytest.raises(CircuitOpenError):
+                client.get({})
+
+        assert mock_get.call_count == calls_before_open
+        assert client.short_circuits == 1
+        assert client.stats()['breaker']['state'] == CircuitBreaker.OPEN
+
+    def test_other_request_errors_resolve_half_open_trial(self, client):
+        """Test that a trial failing with a non-connection RequestException re-opens the breaker."""
+        with patch('services.omdb_client.time.monotonic', return_value=100.0), \
+                patch.object(client.session, 'get', side_effect=ConnectionError("down")):
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    client.get({})
+
+        with patch('services.omdb_client.time.monotonic', return_value=131.0), \
+                patch.object(client.session, 'get', side_effect=ChunkedEncodingError("truncated")) as mock_get:
+            with pytest.raises(ChunkedEncodingError):
+                client.get({})
+            assert mock_get.call_count == 1  # not retried
+            assert client.breaker.state == CircuitBreaker.OPEN
+
+        success = _make_response()
+        with patch('services.omdb_client.time.monotonic', return_value=162.0), \
+                patch.object(client.session, 'get', side_effect=[TooManyRedirects("loop"), success]):
+            with pytest.raises(TooManyRedirects):
+                client.get({})
+        with patch('services.omdb_client.time.monotonic', return_value=193.0), \
+                patch.object(client.session, 'get', return_value=success):
+            assert client.get({}) is success
+        assert client.breaker.state == CircuitBreaker.CLOSED
+
+    def test_pool_stats(self, client):
+        """Test that the pool configuration is reported."""
+        pool_stats = client.stats()['pool']
+        assert pool_stats['pool_maxsize'] == client.pool_maxsize
+        assert pool_stats['hosts'] == {}
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_half_open_after_timeout(self):
+        """Test that one trial request is allowed after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        with patch('services.omdb_client.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+            assert breaker.allow_request() is False
+        with patch('services.omdb_client.time.monotonic', return_value=131.0):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow_request() is True
+            assert breaker.allow_request() is False
+
+    def test_success_closes_breaker(self):
+        """Test that a successful trial closes the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens_breaker(self):
+        """Test that a failed trial re-opens the breaker."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        with patch('services.omdb_client.time.monotonic', return_value=100.0):
+            for _ in range(3):
+                breaker.record_failure()
+        with patch('services.omdb_client.time.monotonic', return_value=131.0):
+            assert breaker.allow_request() is True
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
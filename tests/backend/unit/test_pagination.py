@@ -0,0 +1,40 @@
+"""
+Unit tests for keyset pagination helpers.
+"""
+import pytest
+from datamanager.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, clamp_page_size, encode_cursor, decode_cursor
+)
+
+
+@pytest.mark.unit
+class TestPagination:
+    """Test cursor encoding and page size limits."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the values it was built from."""
+        cursor = encode_cursor('rating:desc', 8.7, 42)
+        assert decode_cursor(cursor, 'rating:desc') == (8.7, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors need no URL escaping."""
+        cursor = encode_cursor('title:asc', 'Amélie / Über?', 7)
+        assert all(character.isalnum() or character in '-_' for character in cursor)
+
+    def test_cursor_for_other_sort_rejected(self):
+        """Test that a cursor cannot be reused with a different ordering."""
+        cursor = encode_cursor('title:asc', 'Alien', 3)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'title:desc')
+
+    @pytest.mark.parametrize('cursor', ['not-a-cursor', '!!!', encode_cursor('id:asc', 1, '1')])
+    def test_malformed_cursor_rejected(self, cursor):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'id:asc')
+
+    def test_clamp_page_size(self):
+        """Test default and bounds of the page size."""
+        assert clamp_page_size(None) == DEFAULT_PAGE_SIZE
+        assert clamp_page_size(0) == 1
+        assert clamp_page_size(10_000) == MAX_PAGE_SIZE
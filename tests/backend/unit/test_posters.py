@@ -0,0 +1,249 @@
+"""
+Unit tests for the local poster store and the /posters endpoint.
+"""
+import io
+import os
+import re
+import pytest
+from unittest.mock import patch, MagicMock
+from requests.exceptions import ConnectionError
+from services import posters
+from services.posters import PosterStore, poster_store, is_poster_url, poster_version, snap_width
+from datamanager import data_manager
+from datamanager.data_models import Movie, UserMovies
+
+POSTER_URL = "https://example.com/poster.jpg"
+JPEG_BYTES = b'\xff\xd8\xff\xe0fake-jpeg-data'
+
+
+def _image_response(content=JPEG_BYTES, content_type='image/jpeg'):
+    """Build a mock streamed response returning content."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {'Content-Type': content_type}
+    response.raise_for_status.return_value = None
+    response.iter_content.return_value = [content]
+    return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a poster store in a temporary directory."""
+    return PosterStore(str(tmp_path), prefetch_enabled=False)
+
+
+@pytest.mark.unit
+class TestPosterHelpers:
+    """Test poster URL helpers."""
+
+    @pytest.mark.parametrize('poster_url, expected', [
+        (POSTER_URL, True),
+        ("http://example.com/poster.jpg", True),
+        ("N/A", False),
+        ("", False),
+        (None, False),
+    ])
+    def test_is_poster_url(self, poster_url, expected):
+        """Test that only http(s) URLs count as posters."""
+        assert is_poster_url(poster_url) is expected
+
+    def test_poster_version_follows_url(self):
+        """Test that the version changes with the poster URL only."""
+        assert poster_version(POSTER_URL) == poster_version(POSTER_URL)
+        assert poster_version(POSTER_URL) != poster_version("https://example.com/other.jpg")
+
+    @pytest.mark.parametrize('width, expected', [
+        (None, None), (1, 140), (140, 140), (141, 280), (560, 560), (561, None),
+    ])
+    def test_snap_width(self, width, expected):
+        """Test that widths are rounded up to a thumbnail width."""
+        assert snap_width(width) == expected
+
+
+@pytest.mark.unit
+class TestPosterStore:
+    """Test fetching and storing posters."""
+
+    def test_fetches_once_and_stores_by_content(self, store, tmp_path):
+        """Test that a poster is downloaded once and named by its content hash."""
+        with patch.object(store.session, 'get', return_value=_image_response()) as mock_get:
+            first = store.get_poster(POSTER_URL)
+            second = store.get_poster(POSTER_URL)
+
+        assert mock_get.call_count == 1
+        assert first == second
+        assert first.mimetype == 'image/jpeg'
+        assert os.path.dirname(first.path) == str(tmp_path / 'originals')
+        with open(first.path, 'rb') as poster_file:
+            assert poster_file.read() == JPEG_BYTES
+        assert store.fetches == 1
+
+    def test_identical_images_share_a_file(self, store):
+        """Test that two URLs serving the same bytes share one original."""
+        with patch.object(store.session, 'get', side_effect=[_image_response(), _image_response()]):
+            first = store.get_poster(POSTER_URL)
+            second = store.get_poster("https://mirror.example.com/poster.jpg")
+        assert first.path == second.path
+
+    def test_survives_restart(self, store, tmp_path):
+        """Test that a new store finds posters fetched by a previous one."""
+        with patch.object(store.session, 'get', return_value=_image_response()):
+            stored = store.get_poster(POSTER_URL)
+
+        restarted = PosterStore(str(tmp_path), prefetch_enabled=False)
+        with patch.object(restarted.session, 'get') as mock_get:
+            assert restarted.get_poster(POSTER_URL) == stored
+        mock_get.assert_not_called()
+
+    def test_not_a_url(self, store):
+        """Test that "N/A" posters are never fetched."""
+        with patch.object(store.session, 'get') as mock_get:
+            assert store.get_poster("N/A") is None
+        mock_get.assert_not_called()
+
+    @pytest.mark.parametrize('response', [
+        _image_response(content_type='text/html'),
+        _image_response(content=b''),
+        _image_response(content=b'x' * 2048),
+    ])
+    def test_rejects_unusable_responses(self, tmp_path, response):
+        """Test that non-images, empty and oversized downloads are rejected."""
+        store = PosterStore(str(tmp_path), prefetch_enabled=False, max_bytes=1024)
+        with patch.object(store.session, 'get', return_value=response):
+            assert store.get_poster(POSTER_URL) is None
+        assert store.fetch_failures == 1
+        assert not os.path.exists(tmp_path / 'originals')
+
+    def test_failures_are_not_retried_immediately(self, store):
+        """Test that a failed URL is remembered for the failure TTL."""
+        with patch.object(store.session, 'get', side_effect=ConnectionError("refused")) as mock_get:
+            assert store.get_poster(POSTER_URL) is None
+            assert store.get_poster(POSTER_URL) is None
+        assert mock_get.call_count == 1
+
+    def test_width_without_pillow_serves_original(self, store):
+        """Test that thumbnails fall back to the original when Pillow is missing."""
+        with patch.object(posters, 'PILLOW_AVAILABLE', False), \
+                patch.object(store.session, 'get', return_value=_image_response()):
+            original = store.get_poster(POSTER_URL)
+            assert store.get_poster(POSTER_URL, width=280) == original
+
+    def test_thumbnails(self, store):
+        """Test that Pillow thumbnails are resized JPEGs and smaller originals are kept."""
+        image_module = pytest.importorskip('PIL.Image')
+        png_bytes = io.BytesIO()
+        image_module.new('RGB', (600, 900), 'red').save(png_bytes, 'PNG')
+
+        with patch.object(store.session, 'get',
+                          return_value=_image_response(png_bytes.getvalue(), 'image/png')):
+            thumbnail = store.get_poster(POSTER_URL, width=280)
+            original = store.get_poster(POSTER_URL, width=1000)
+
+        assert thumbnail.mimetype == 'image/jpeg'
+        with image_module.open(thumbnail.path) as thumbnail_image:
+            assert thumbnail_image.size == (280, 420)
+        assert original.mimetype == 'image/png'
+
+    def test_prefetch(self, store):
+        """Test that prefetch fetches in the background only when enabled."""
+        assert store.prefetch(POSTER_URL) is None
+
+        store.prefetch_enabled = True
+        assert store.prefetch("N/A") is None
+        with patch.object(store.session, 'get', return_value=_image_response()):
+            store.prefetch(POSTER_URL).result(timeout=5)
+        assert store.fetches == 1
+
+
+@pytest.mark.unit
+class TestPosterRoutes:
+    """Test the /posters endpoint and poster links in pages."""
+
+    @pytest.fixture
+    def poster_movie(self, db_session):
+        """Create a movie with a remote poster."""
+        movie = Movie(title="The Matrix", release_year=1999, director="Wachowskis",
+                      rating=8.7, poster=POSTER_URL)
+        db_session.add(movie)
+        db_session.commit()
+        return movie
+
+    def test_versioned_link_is_immutable(self, client, poster_movie):
+        """Test that a link with the current version is cached forever."""
+        with patch.object(poster_store.session, 'get', return_value=_image_response()):
+            response = client.get(f'/posters/{poster_movie.id}?v={poster_version(POSTER_URL)}')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'image/jpeg'
+        assert response.data == JPEG_BYTES
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == posters.POSTER_MAX_AGE
+
+    def test_unversioned_link_is_revalidated(self, client, poster_movie):
+        """Test that links without the current version are cached briefly."""
+        with patch.object(poster_store.session, 'get', return_value=_image_response()):
+            response = client.get(f'/posters/{poster_movie.id}?v=stale')
+
+        assert response.status_code == 200
+        assert not response.cache_control.immutable
+        assert response.cache_control.max_age == posters.POSTER_PLACEHOLDER_MAX_AGE
+
+    def test_placeholder_for_missing_poster(self, client, db_session):
+        """Test that movies without a poster get the placeholder image."""
+        movie = Movie(title="Obscure", release_year=2001, director="Nobody", rating=5.0, poster="N/A")
+        db_session.add(movie)
+        db_session.commit()
+
+        response = client.get(f'/posters/{movie.id}')
+        assert response.status_code == 200
+        assert response.mimetype == 'image/svg+xml'
+        assert response.cache_control.max_age == posters.POSTER_PLACEHOLDER_MAX_AGE
+
+    def test_placeholder_when_fetch_fails(self, client, poster_movie):
+        """Test that unreachable posters fall back to the placeholder."""
+        with patch.object(poster_store.session, 'get', side_effect=ConnectionError("refused")):
+            response = client.get(f'/posters/{poster_movie.id}')
+        assert response.mimetype == 'image/svg+xml'
+
+    def test_unknown_movie(self, client):
+        """Test that unknown movies return 404."""
+        assert client.get('/posters/999').status_code == 404
+
+    def test_pages_link_local_posters(self, client, sample_user, poster_movie, db_session):
+        """Test that movie cards point at /posters instead of the remote URL."""
+        db_session.add(UserMovies(user_id=sample_user.id, movie_id=poster_movie.id))
+        db_session.commit()
+        poster_link = f'/posters/{poster_movie.id}?v={poster_version(POSTER_URL)}'
+
+        for page in ('/movies', f'/users/{sample_user.id}'):
+            html = client.get(page).get_data(as_text=True)
+            assert poster_link in html
+            assert POSTER_URL not in html
+
+    def test_cards_load_posters_lazily(self, client, db_session):
+        """Test that only the first row of posters loads eagerly and all are sized with a srcset."""
+        db_session.add_all([Movie(title=f"Movie {number}", release_year=2000 + number, director="Someone",
+                                  rating=7.0, poster=f"https://example.com/{number}.jpg")
+                            for number in range(6)])
+        db_session.commit()
+
+        html = client.get('/movies?sort=year').get_data(as_text=True)
+        poster_tags = re.findall(r'<img [^>]*class="movie_poster"[^>]*>', html)
+
+        assert len(poster_tags) == 6
+        assert [('loading="eager"' in tag) for tag in poster_tags] == [True] * 4 + [False] * 2
+        for tag in poster_tags:
+            assert 'decoding="async"' in tag
+            assert 'width="280" height="400"' in tag
+            assert re.search(r'srcset="[^"]*w=140 140w, [^"]*w=280 280w, [^"]*w=560 560w"', tag)
+        assert 'loading="lazy"' in poster_tags[4]
+
+    def test_add_movie_prefetches_poster(self, db_session, sample_user):
+        """Test that adding a movie from OMDb schedules a poster prefetch."""
+        omdb_movie_data = {'title': 'Inception', 'release_year': 2010, 'director': 'Christopher Nolan',
+                           'rating': '8.8', 'poster': 'https://example.com/inception.jpg'}
+        with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=omdb_movie_data), \
+                patch.object(poster_store, 'prefetch') as mock_prefetch:
+            data_manager.add_movie(sample_user.id, 'Inception')
+
+        mock_prefetch.assert_called_once_with('https://example.com/inception.jpg')
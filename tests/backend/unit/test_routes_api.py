@@ -3,6 +3,7 @@ Unit tests for API routes.
 """
 import pytest
 import json
+from unittest.mock import patch
 from datamanager.data_models import User, Movie, UserMovies
 from extensions import db
 from datamanager import data_manager
@@ -33,6 +34,179 @@ class TestAPIUsers:
         assert data['users'][0]['id'] == sample_user.id
         assert data['users'][0]['name'] == sample_user.name
         assert data['count'] == 1
+        assert data['next_cursor'] is None
+
+    def test_list_users_paginated(self, client, db_session):
+        """Test following next_cursor through all pages of users."""
+        db_session.add_all([User(name=f'User {index}') for index in range(5)])
+        db_session.commit()
+
+        names, cursor = [], None
+        while True:
+            query = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            data = json.loads(client.get('/api/users', query_string=query).data)
+            names.extend(user['name'] for user in data['users'])
+            cursor = data['next_cursor']
+            if cursor is None:
+                break
+        assert names == [f'User {index}' for index in range(5)]
+
+    def test_list_users_invalid_cursor(self, client):
+        """Test that an invalid cursor returns 400."""
+        response = client.get('/api/users?cursor=garbage')
+        assert response.status_code == 400
+        assert json.loads(response.data)['success'] is False
+
+
+@pytest.mark.unit
+class TestAPIMovies:
+    """Test API /api/movies endpoint."""
+
+    def test_list_movies_sorted_by_rating(self, client, db_session):
+        """Test listing movies by descending rating across pages."""
+        db_session.add_all([Movie(title=f'Movie {rating}', rating=float(rating)) for rating in (5, 9, 7)])
+        db_session.commit()
+
+        first_page = json.loads(client.get('/api/movies?sort=rating&order=desc&limit=2').data)
+        assert [movie['rating'] for movie in first_page['movies']] == [9.0, 7.0]
+        assert first_page['count'] == 2
+
+        second_page = json.loads(client.get('/api/movies', query_string={
+            'sort': 'rating', 'order': 'desc', 'limit': 2, 'cursor': first_page['next_cursor']
+        }).data)
+        assert [movie['rating'] for movie in second_page['movies']] == [5.0]
+        assert second_page['next_cursor'] is None
+
+    @pytest.mark.parametrize('query', ['sort=poster', 'order=sideways', 'cursor=garbage'])
+    def test_list_movies_invalid_parameters(self, client, query):
+        """Test that invalid sort, order or cursor values return 400."""
+        response = client.get(f'/api/movies?{query}')
+        assert response.status_code == 400
+        assert json.loads(response.data)['success'] is False
+
+
+@pytest.mark.unit
+class TestAPIMovieSearch:
+    """Test API /api/movies/search endpoint."""
+
+    def test_search_movies(self, client, db_session):
+        """Test searching by title prefix and paging through results."""
+        db_session.add_all([Movie(title=f'Star {index}', rating=7.0) for index in range(3)])
+        db_session.add(Movie(title='Alien', director='Ridley Scott', rating=8.5))
+        db_session.commit()
+
+        first_page = json.loads(client.get('/api/movies/search?q=sta&limit=2').data)
+        assert first_page['success'] is True
+        assert first_page['query'] == 'sta'
+        assert first_page['count'] == 2
+        assert first_page['next_cursor'] is not None
+
+        second_page = json.loads(client.get('/api/movies/search', query_string={
+            'q': 'sta', 'limit': 2, 'cursor': first_page['next_cursor']
+        }).data)
+        titles = [movie['title'] for movie in first_page['movies'] + second_page['movies']]
+        assert sorted(titles) == ['Star 0', 'Star 1', 'Star 2']
+        assert second_page['next_cursor'] is None
+
+    @pytest.mark.parametrize('query', ['', 'q=', 'q=%22*', 'q=star&cursor=garbage'])
+    def test_search_movies_invalid_parameters(self, client, query):
+        """Test that empty queries and invalid cursors return 400."""
+        response = client.get(f'/api/movies/search?{query}')
+        assert response.status_code == 400
+        assert json.loads(response.data)['success'] is False
+
+
+@pytest.mark.unit
+class TestAPIConditionalRequests:
+    """Test ETag/Last-Modified validation of the read endpoints."""
+
+    def test_users_not_modified_until_write(self, client, db_session):
+        """Test that a current ETag gets 304 and a write invalidates it."""
+        data_manager.add_user('Alice')
+        response = client.get('/api/users')
+        etag = response.headers['ETag']
+        assert response.status_code == 200
+        assert response.headers['Last-Modified']
+
+        not_modified = client.get('/api/users', headers={'If-None-Match': etag})
+        assert not_modified.status_code == 304
+        assert not_modified.data == b''
+        assert not_modified.headers['ETag'] == etag
+
+        data_manager.add_user('Bob')
+        response = client.get('/api/users', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_not_modified_skips_query(self, client, db_session):
+        """Test that a 304 is answered without running the listing query."""
+        etag = client.get('/api/movies').headers['ETag']
+        with patch.object(data_manager, 'get_movies_page') as mock_page:
+            response = client.get('/api/movies', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        mock_page.assert_not_called()
+
+    def test_user_movies_follow_catalog_changes(self, client, db_session, sample_user, sample_movie,
+                                                sample_user_movie):
+        """Test that a user's collection is revalidated when the user or catalog changes."""
+        etag = client.get(f'/api/users/{sample_user.id}/movies').headers['ETag']
+        assert client.get(f'/api/users/{sample_user.id}/movies',
+                          headers={'If-None-Match': etag}).status_code == 304
+
+        data_manager.upsert_movies([{'title': 'The Matrix', 'release_year': 1999, 'poster': None,
+                                     'director': None, 'rating': 9.0}])
+        response = client.get(f'/api/users/{sample_user.id}/movies', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert json.loads(response.data)['movies'][0]['rating'] == 9.0
+
+    def test_if_modified_since(self, client, db_session):
+        """Test date-based validation."""
+        data_manager.add_user('Alice')
+        last_modified = client.get('/api/users').headers['Last-Modified']
+        response = client.get('/api/users', headers={'If-Modified-Since': last_modified})
+        assert response.status_code == 304
+
+
+@pytest.mark.unit
+class TestAPIMovieSuggest:
+    """Test API /api/movies/suggest endpoint."""
+
+    def test_suggest_catalog_titles(self, client, sample_movie):
+        """Test suggestions from the local catalog."""
+        response = client.get('/api/movies/suggest?prefix=the%20ma')
+        assert response.status_code == 200
+        assert json.loads(response.data) == {
+            'success': True,
+            'prefix': 'the ma',
+            'suggestions': [{'movie_id': sample_movie.id, 'title': 'The Matrix',
+                             'release_year': 1999, 'source': 'catalog'}]
+        }
+
+    @patch('routes.api.search_movie_titles')
+    def test_suggest_merges_omdb_results(self, mock_search, client, sample_movie):
+        """Test that OMDb results fill the remaining slots without duplicating catalog movies."""
+        mock_search.return_value = [
+            {'title': 'The Matrix', 'release_year': '1999', 'poster': 'N/A'},
+            {'title': 'The Matrix Reloaded', 'release_year': '2003', 'poster': 'N/A'},
+            {'title': 'The Animatrix', 'release_year': '2003', 'poster': 'N/A'},
+        ]
+
+        data = json.loads(client.get('/api/movies/suggest?prefix=matrix&omdb=1&limit=2').data)
+        assert [(suggestion['title'], suggestion['source']) for suggestion in data['suggestions']] == [
+            ('The Matrix', 'catalog'), ('The Matrix Reloaded', 'omdb')
+        ]
+        assert data['suggestions'][1]['release_year'] == 2003
+
+    @patch('routes.api.search_movie_titles')
+    def test_suggest_without_omdb_flag(self, mock_search, client, sample_movie):
+        """Test that OMDb is only asked when requested."""
+        client.get('/api/movies/suggest?prefix=zzz')
+        mock_search.assert_not_called()
+
+    def test_suggest_empty_prefix(self, client):
+        """Test that an empty prefix returns no suggestions."""
+        data = json.loads(client.get('/api/movies/suggest').data)
+        assert data['suggestions'] == []
 
 
 @pytest.mark.unit
@@ -73,6 +247,22 @@ class TestAPIUserMovies:
         data = json.loads(response.data)
         assert data['success'] is False
         assert 'error' in data
+
+    def test_get_user_movies_paginated(self, client, db_session, sample_user):
+        """Test following next_cursor through a user's movies."""
+        movies = [Movie(title=f'Movie {index}', rating=7.0) for index in range(3)]
+        db_session.add_all(movies)
+        db_session.flush()
+        db_session.add_all([UserMovies(user_id=sample_user.id, movie_id=movie.id) for movie in movies])
+        db_session.commit()
+
+        first_page = json.loads(client.get(f'/api/users/{sample_user.id}/movies?limit=2').data)
+        assert [movie['title'] for movie in first_page['movies']] == ['Movie 0', 'Movie 1']
+        last_page = json.loads(client.get(f'/api/users/{sample_user.id}/movies',
+                                          query_string={'limit': 2, 'cursor': first_page['next_cursor']}).data)
+        assert [movie['title'] for movie in last_page['movies']] == ['Movie 2']
+        assert last_page['user_name'] == sample_user.name
+        assert last_page['next_cursor'] is None
     
     @pytest.mark.parametrize('method', ['POST'])
     def test_add_user_movie_no_json(self, client, sample_user, method):
@@ -124,3 +314,165 @@ class TestAPIUserMovies:
         assert data['success'] is False
         assert 'error' in data
 
+
+
+@pytest.mark.unit
+class TestAPIBatchImport:
+    """Test API /api/users/<user_id>/movies/batch endpoint."""
+
+    @staticmethod
+    def _omdb_data(title, year):
+        return {'title': title, 'director': 'Director', 'rating': '8.0',
+                'release_year': year, 'poster': 'N/A'}
+
+    def test_batch_import(self, client, sample_user, sample_movie, sample_user_movie):
+        """Test a batch with added, linked and not found titles."""
+        omdb_results = {
+            'Inception': self._omdb_data('Inception', '2010'),
+            'The Matrix': self._omdb_data('The Matrix', '1999'),
+            'Unknown': None,
+        }
+        with patch('datamanager.sqlite_data_manager.fetch_movies_data', return_value=omdb_results):
+            response = client.post(
+                f'/api/users/{sample_user.id}/movies/batch',
+                json={'titles': ['Inception', 'The Matrix', 'Unknown']}
+            )
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert [result['status'] for result in data['results']] == ['added', 'linked', 'not_found']
+        assert data['counts'] == {'added': 1, 'linked': 1, 'not_found': 1}
+        assert data['results'][0]['movie']['title'] == 'Inception'
+        assert data['results'][2]['movie'] is None
+
+    def test_batch_import_rejects_non_list(self, client, sample_user):
+        """Test that titles must be a list."""
+        response = client.post(f'/api/users/{sample_user.id}/movies/batch',
+                               json={'titles': 'Inception'})
+        assert response.status_code == 400
+
+    def test_batch_import_rejects_empty_titles(self, client, sample_user):
+        """Test that blank titles are rejected."""
+        response = client.post(f'/api/users/{sample_user.id}/movies/batch',
+                               json={'titles': ['Inception', '  ']})
+        assert response.status_code == 400
+
+    def test_batch_import_too_many_titles(self, client, sample_user):
+        """Test the batch size limit."""
+        from routes.api import MAX_BATCH_TITLES
+        response = client.post(f'/api/users/{sample_user.id}/movies/batch',
+                               json={'titles': ['Movie'] * (MAX_BATCH_TITLES + 1)})
+        assert response.status_code == 400
+
+    def test_batch_import_database_error(self, client, sample_user):
+        """Test that a batch that cannot be written returns 500, not 404."""
+        with patch.object(data_manager, 'add_movies',
+                          side_effect=ValueError("Error occurred while adding movies: disk I/O error")):
+            response = client.post(f'/api/users/{sample_user.id}/movies/batch', json={'titles': ['Inception']})
+        assert response.status_code == 500
+        assert json.loads(response.data)['success'] is False
+
+    def test_batch_import_user_not_found(self, client):
+        """Test batch import for non-existent user."""
+        response = client.post('/api/users/999/movies/batch', json={'titles': ['Inception']})
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestAPIExport:
+    """Test the streaming export endpoints."""
+
+    def test_export_movies_ndjson(self, client, db_session):
+        """Test exporting the catalog as NDJSON in id order."""
+        db_session.add_all([Movie(title=f'Movie {index}', rating=7.0) for index in range(3)])
+        db_session.commit()
+
+        response = client.get('/api/export/movies')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert 'movies.ndjson' in response.headers['Content-Disposition']
+        exported = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [movie['title'] for movie in exported] == ['Movie 0', 'Movie 1', 'Movie 2']
+
+    def test_export_user_movies_csv(self, client, sample_user, sample_movie, sample_user_movie):
+        """Test exporting a user's collection as CSV including user ratings."""
+        response = client.get(f'/api/users/{sample_user.id}/movies/export?format=csv')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0] == 'id,title,release_year,poster,director,rating,user_rating'
+        assert len(lines) == 2
+        assert lines[1].startswith(f'{sample_movie.id},The Matrix,1999')
+        assert lines[1].endswith(',9.0')
+
+    def test_export_invalid_format(self, client):
+        """Test that unsupported formats return 400."""
+        response = client.get('/api/export/movies?format=xml')
+        assert response.status_code == 400
+        assert json.loads(response.data)['success'] is False
+
+    def test_export_user_not_found(self, client):
+        """Test exporting the collection of a missing user returns 404."""
+        response = client.get('/api/users/999/movies/export')
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestAPIAsyncAddMovie:
+    """Test asynchronous add-movie requests and job polling."""
+
+    def test_async_add_returns_202_and_job_completes(self, client, sample_user):
+        """Test that ?async=1 queues a job whose status can be polled."""
+        from services.job_queue import job_queue
+        matrix_data = {'title': 'The Matrix', 'director': 'Lana Wachowski', 'rating': '8.7',
+                       'release_year': '1999', 'poster': 'https://example.com/matrix.jpg'}
+
+        with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=matrix_data):
+            response = client.post(f'/api/users/{sample_user.id}/movies?async=1',
+                                   json={'title': 'The Matrix'})
+            assert job_queue.join(timeout=5)
+
+        assert response.status_code == 202
+        data = json.loads(response.data)
+        assert response.headers['Location'] == data['status_url']
+
+        status_response = client.get(data['status_url'])
+        assert status_response.status_code == 200
+        job = json.loads(status_response.data)['job']
+        assert job['status'] == 'succeeded'
+        assert job['result'] == 'added'
+        assert job['movie']['title'] == 'The Matrix'
+
+    def test_async_default_from_config(self, app, client, sample_user):
+        """Test that ADD_MOVIE_ASYNC makes requests asynchronous without ?async."""
+        from services.job_queue import job_queue
+        app.config['ADD_MOVIE_ASYNC'] = True
+
+        with patch('datamanager.sqlite_data_manager.fetch_movie_data', return_value=None):
+            response = client.post(f'/api/users/{sample_user.id}/movies', json={'title': 'Unknown'})
+            assert job_queue.join(timeout=5)
+
+        assert response.status_code == 202
+
+    def test_get_job_not_found(self, client):
+        """Test polling a missing job returns 404."""
+        response = client.get('/api/jobs/999')
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestAPIDiagnostics:
+    """Test API /api/diagnostics/database endpoint."""
+
+    def test_database_diagnostics(self, client):
+        """Test that active pragma values are reported."""
+        response = client.get('/api/diagnostics/database')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert data['dialect'] == 'sqlite'
+        assert data['active_pragmas']['journal_mode'] == 'wal'
+        assert data['active_pragmas']['foreign_keys'] == 1
+        assert 'pool' in data
@@ -40,3 +40,35 @@ class TestMovieRoutes:
         assert response.status_code == 200
         assert sample_movie.title.encode() in response.data
 
+
+    def test_show_movies_paginated(self, client, db_session):
+        """Test that /movies renders one page with a next page link."""
+        db_session.add_all([Movie(title=f'Movie {index}', rating=7.0) for index in range(3)])
+        db_session.commit()
+
+        response = client.get('/movies?limit=2&sort=title')
+        assert response.status_code == 200
+        assert b'Movie 1' in response.data
+        assert b'Movie 2' not in response.data
+        assert b'Next page' in response.data
+
+    def test_show_movies_invalid_cursor(self, client):
+        """Test that a tampered cursor is rejected."""
+        response = client.get('/movies?cursor=garbage')
+        assert response.status_code == 400
+
+    def test_show_movies_search(self, client, db_session):
+        """Test that /movies?q= lists only matching movies."""
+        db_session.add_all([Movie(title='The Matrix', rating=8.7), Movie(title='Alien', rating=8.5)])
+        db_session.commit()
+
+        response = client.get('/movies?q=matr')
+        assert response.status_code == 200
+        assert b'The Matrix' in response.data
+        assert b'Alien' not in response.data
+
+    def test_show_movies_search_no_results(self, client, sample_movie):
+        """Test the message shown when nothing matches."""
+        response = client.get('/movies?q=zzzz')
+        assert response.status_code == 200
+        assert b'No movies match your search.' in response.data
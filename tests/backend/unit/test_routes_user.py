@@ -2,7 +2,7 @@
 Unit tests for user routes.
 """
 import pytest
-from datamanager.data_models import User
+from datamanager.data_models import User, Movie, UserMovies
 from extensions import db
 
 
@@ -48,6 +48,8 @@ class TestUserRoutes:
         """Test getting user movies page."""
         response = client.get(f'/users/{sample_user.id}')
         assert response.status_code == 200
+        # The empty-collection message comes from the cards partial only
+        assert response.data.count(b'No movies added for Test User yet.') == 1
     
     def test_get_user_movies_not_found(self, client):
         """Test getting movies for non-existent user."""
@@ -55,3 +57,28 @@ class TestUserRoutes:
         assert response.status_code == 200  # Route handles gracefully
         assert b'not found' in response.data.lower() or b'No user found' in response.data
 
+
+    def test_show_users_paginated(self, client, db_session):
+        """Test that /users renders one page with a next page link."""
+        db_session.add_all([User(name=f'User {index}') for index in range(3)])
+        db_session.commit()
+
+        response = client.get('/users?limit=2')
+        assert response.status_code == 200
+        assert b'User 1' in response.data
+        assert b'User 2' not in response.data
+        assert b'Next page' in response.data
+
+    def test_user_movies_paginated(self, client, db_session, sample_user):
+        """Test that /users/<id> renders one page of movies with a next page link."""
+        movies = [Movie(title=f'Movie {index}', rating=7.0) for index in range(3)]
+        db_session.add_all(movies)
+        db_session.flush()
+        db_session.add_all([UserMovies(user_id=sample_user.id, movie_id=movie.id) for movie in movies])
+        db_session.commit()
+
+        response = client.get(f'/users/{sample_user.id}?limit=2')
+        assert response.status_code == 200
+        assert b'Movie 1' in response.data
+        assert b'Movie 2' not in response.data
+        assert b'Next page' in response.data
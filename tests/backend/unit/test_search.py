@@ -0,0 +1,29 @@
+"""
+Unit tests for full-text search query building.
+"""
+import pytest
+from datamanager.search import MAX_SEARCH_TERMS, build_match_query
+
+
+@pytest.mark.unit
+class TestBuildMatchQuery:
+    """Test turning user input into FTS5 MATCH expressions."""
+
+    def test_words_become_prefix_terms(self):
+        """Test that every word is a quoted prefix term."""
+        assert build_match_query('matr wach') == '"matr"* "wach"*'
+
+    def test_operators_and_punctuation_neutralized(self):
+        """Test that FTS5 syntax in user input is not interpreted."""
+        assert build_match_query('"Alien" OR title:Aliens*') == '"Alien"* "OR"* "title"* "Aliens"*'
+
+    def test_term_count_limited(self):
+        """Test that only the first MAX_SEARCH_TERMS words are used."""
+        match_query = build_match_query(' '.join(f'word{index}' for index in range(20)))
+        assert match_query.count('*') == MAX_SEARCH_TERMS
+
+    @pytest.mark.parametrize('search_text', ['', '   ', '"*:()', None])
+    def test_empty_query_rejected(self, search_text):
+        """Test that queries without words raise ValueError."""
+        with pytest.raises(ValueError, match="at least one letter or digit"):
+            build_match_query(search_text)
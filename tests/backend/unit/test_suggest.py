@@ -0,0 +1,79 @@
+"""
+Unit tests for the in-memory title prefix index.
+"""
+import pytest
+from datamanager.suggest import TitleIndex, Suggestion
+
+
+@pytest.fixture
+def title_index():
+    """Create an index loaded with a few titles."""
+    index = TitleIndex(ttl=300)
+    index.load([(1, 'The Matrix', 1999), (2, 'Matrix Reloaded', 2003), (3, 'Memento', 2000),
+                (4, 'Amélie', 2001)])
+    return index
+
+
+@pytest.mark.unit
+class TestTitleIndex:
+    """Test prefix lookups and incremental updates."""
+
+    def test_prefix_with_and_without_article(self, title_index):
+        """Test that titles match with or without their leading article."""
+        assert [suggestion.movie_id for suggestion in title_index.suggest('matr')] == [1, 2]
+        assert [suggestion.movie_id for suggestion in title_index.suggest('The MAT')] == [1]
+
+    def test_limit_and_empty_prefix(self, title_index):
+        """Test that the limit is applied and blank prefixes match nothing."""
+        assert len(title_index.suggest('m', limit=2)) == 2
+        assert title_index.suggest('   ') == []
+        assert title_index.suggest('zzz') == []
+
+    def test_unicode_titles(self, title_index):
+        """Test that non-ASCII titles match case-insensitively."""
+        assert title_index.suggest('AMÉ') == [Suggestion(4, 'Amélie', 2001)]
+
+    def test_add_and_discard(self, title_index):
+        """Test that single movies are indexed and removed in place."""
+        title_index.add(5, 'Matrix Resurrections', 2021)
+        assert [suggestion.movie_id for suggestion in title_index.suggest('matrix re')] == [2, 5]
+
+        title_index.discard(1)
+        title_index.discard(99)
+        assert [suggestion.movie_id for suggestion in title_index.suggest('matr')] == [2, 5]
+        assert title_index.suggest('the') == []
+
+    def test_add_replaces_previous_title(self, title_index):
+        """Test that re-adding a movie drops its old keys."""
+        title_index.add(3, 'Memento Mori', 2000)
+        assert title_index.suggest('memento') == [Suggestion(3, 'Memento Mori', 2000)]
+        assert len(title_index) == 4
+
+    def test_refresh_only_when_stale(self, title_index):
+        """Test that loads happen on first use, after invalidate() and not otherwise."""
+        loads = []
+
+        def load_movies():
+            loads.append(True)
+            return [(7, 'Heat', 1995)]
+
+        title_index.refresh_if_stale(load_movies)
+        assert loads == []
+
+        title_index.invalidate()
+        title_index.refresh_if_stale(load_movies)
+        title_index.refresh_if_stale(load_movies)
+        assert len(loads) == 1
+        assert [suggestion.title for suggestion in title_index.suggest('he')] == ['Heat']
+
+    def test_changes_during_load_keep_index_stale(self):
+        """Test that a write racing with a load forces another reload."""
+        index = TitleIndex(ttl=300)
+
+        def load_movies():
+            # A movie added after the snapshot was read
+            index.add(2, 'Heat', 1995)
+            yield 1, 'Alien', 1979
+
+        index.load(load_movies())
+        assert index.is_stale()
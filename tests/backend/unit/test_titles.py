@@ -0,0 +1,26 @@
+"""
+Unit tests for catalog title normalization.
+"""
+import pytest
+from datamanager.titles import normalize_catalog_title, split_title_year
+
+
+@pytest.mark.unit
+class TestTitles:
+    """Test title matching keys and year hints."""
+
+    @pytest.mark.parametrize('title', ['The Matrix', '  the   MATRIX ', 'Matrix, The', 'matrix'])
+    def test_article_case_and_whitespace_insensitive(self, title):
+        """Test that article, case and whitespace variants share one key."""
+        assert normalize_catalog_title(title) == 'matrix'
+
+    def test_article_only_titles_kept(self):
+        """Test that a title consisting of an article is not emptied."""
+        assert normalize_catalog_title('A') == 'a'
+        assert normalize_catalog_title('The') == 'the'
+
+    def test_split_title_year(self):
+        """Test extracting a trailing year hint."""
+        assert split_title_year('Dune (2021)') == ('Dune', 2021)
+        assert split_title_year(' Dune ') == ('Dune', None)
+        assert split_title_year('2001: A Space Odyssey') == ('2001: A Space Odyssey', None)
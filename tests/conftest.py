@@ -2,11 +2,17 @@
 Root conftest.py with shared fixtures for all tests.
 """
 import os
+import shutil
 import pytest
 import tempfile
 from app import create_app
 from extensions import db
 from datamanager.data_models import User, Movie, UserMovies
+from services.omdb_api import omdb_cache, omdb_search_cache, omdb_client
+from services import gemini_api
+from services.fragment_cache import fragment_cache
+from services.posters import poster_store
+from services.metrics import registry as metrics_registry
 
 
 @pytest.fixture(scope='function')
@@ -14,6 +20,7 @@ def app():
     """Create a Flask application instance for testing."""
     # Create a temporary database file
     db_fd, db_path = tempfile.mkstemp(suffix='.db')
+    poster_dir = tempfile.mkdtemp(prefix='posters-')
     
     # Set DATABASE_URL before creating app to ensure it uses our test database
     # We use the temp file path directly as SQLite URI
@@ -25,6 +32,10 @@ def app():
         app.config['TESTING'] = True
         app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
         app.config['WTF_CSRF_ENABLED'] = False  # Disable CSRF for testing
+        # Keep posters out of the project directory and never fetch them in the background
+        app.config['POSTER_CACHE_DIR'] = poster_dir
+        app.config['POSTER_PREFETCH'] = False
+        poster_store.init_app(app)
         
         # Ensure models are imported so db.create_all() can see them
         from datamanager.data_models import User, Movie, UserMovies
@@ -48,6 +59,29 @@ def app():
             del os.environ['DATABASE_URL']
         os.close(db_fd)
         os.unlink(db_path)
+        shutil.rmtree(poster_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """Start every test with empty external service caches and a closed breaker."""
+    omdb_cache.clear()
+    omdb_search_cache.clear()
+    omdb_client.reset_stats()
+    gemini_api.recommendation_cache.clear()
+    gemini_api.recommendation_failures.clear()
+    gemini_api._get_model.cache_clear()
+    fragment_cache.clear()
+    poster_store.clear()
+    metrics_registry.clear()
+    yield
+    omdb_cache.clear()
+    omdb_search_cache.clear()
+    omdb_client.reset_stats()
+    gemini_api.recommendation_cache.clear()
+    gemini_api.recommendation_failures.clear()
+    gemini_api._get_model.cache_clear()
+    fragment_cache.clear()
 
 
 @pytest.fixture